@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Reports load time, memory and per-document latency of each NER profile.
+
+Every profile is measured in a fresh interpreter, so models loaded earlier
+do not skew its memory figure. Profiles whose model is not installed are
+listed as such.
+
+Usage:
+    python scripts/bench_ner_profiles.py [--docs 500] [profile ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from skip_trace.analysis import ner
+from skip_trace.config import CONFIG
+
+SAMPLE_TEXTS = [
+    "2019-2021 The Python Software Foundation and contributors",
+    "Jane Doe <jane@example.com>",
+    "2008 Armin Ronacher and Pallets",
+    "Guido van Rossum, Barry Warsaw and the Python core team",
+    "(c) 2016 Google LLC. All rights reserved.",
+]
+
+
+def measure(profile: str, docs: int) -> dict:
+    """Loads one profile in this process and times it."""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    try:
+        nlp = ner.load_profile(profile)
+    except IOError:
+        return {"profile": profile, "error": "model not installed"}
+    load_seconds = time.perf_counter() - start
+    rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] + f" #{i}" for i in range(docs)]
+    start = time.perf_counter()
+    for text in texts:
+        nlp(text)
+    single_ms = (time.perf_counter() - start) * 1000 / docs
+    start = time.perf_counter()
+    list(nlp.pipe(texts, batch_size=CONFIG["ner"]["batch_size"]))
+    batched_ms = (time.perf_counter() - start) * 1000 / docs
+    return {
+        "profile": profile,
+        "components": nlp.pipe_names,
+        "load_s": round(load_seconds, 3),
+        "rss_mib": round(rss_kib / 1024, 1),
+        "ms_per_doc": round(single_ms, 3),
+        "ms_per_doc_piped": round(batched_ms, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("profiles", nargs="*", default=list(ner.NER_PROFILES))
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.profiles[0], args.docs)))
+        return
+
+    for profile in args.profiles:
+        ner.get_profile(profile)  # fail early on typos
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", "--docs", str(args.docs), profile],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        row = json.loads(output.strip().splitlines()[-1])
+        if "error" in row:
+            print(f"{profile:<10} {row['error']}")
+            continue
+        print(
+            f"{profile:<10} load {row['load_s']:>6.2f}s  "
+            f"+{row['rss_mib']:>6.1f} MiB  "
+            f"{row['ms_per_doc']:>7.3f} ms/doc  "
+            f"{row['ms_per_doc_piped']:>7.3f} ms/doc piped  "
+            f"[{', '.join(row['components'])}]"
+        )
+
+
+if __name__ == "__main__":
+    main()
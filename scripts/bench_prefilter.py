@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Times the claim extractors over an sdist, wheel or directory with and
+without the keyword prefilter, and checks both find the same evidence.
+
+Usage:
+    python scripts/bench_prefilter.py path/to/package-1.0.tar.gz [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import List, Tuple
+
+from skip_trace.analysis import file_scanner
+from skip_trace.config import CONFIG
+from skip_trace.utils import archive_reader
+
+
+def load_files(path: str) -> List[Tuple[str, bytes]]:
+    """Reads every file of the tree into memory, so only scanning is timed."""
+    if os.path.isdir(path):
+        return list(file_scanner.iter_directory_files(path))
+    with archive_reader.open_archive(path, os.path.basename(path)) as archive:
+        return list(archive.iter_selected(lambda name, size: -1))
+
+
+def run(files: List[Tuple[str, bytes]], prefilter: bool, repeat: int):
+    CONFIG["scan"]["prefilter"] = prefilter
+    best = float("inf")
+    evidence = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        evidence = file_scanner.scan_files(files, "bench", urls=False, workers=1)
+        best = min(best, time.perf_counter() - start)
+    return best, evidence
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("path", help="An sdist, wheel or directory")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Time the extractors, not the cache or a process pool
+    CONFIG["scan"]["evidence_cache"] = False
+    CONFIG["scan"]["vendored"] = "scan"
+    files = load_files(args.path)
+    size = sum(len(data) for _, data in files)
+    print(f"{len(files)} files, {size / 1024 / 1024:.1f} MiB")
+
+    baseline, expected = run(files, False, args.repeat)
+    filtered, actual = run(files, True, args.repeat)
+    print(f"without prefilter: {baseline:.3f}s")
+    print(f"with prefilter:    {filtered:.3f}s ({baseline / filtered:.1f}x)")
+    same = [r.id for r in expected] == [r.id for r in actual]
+    print(f"same evidence: {same} ({len(actual)} records)")
+    if not same:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Compares the rule-based NER backend with spaCy on the labeled fixtures in
+test/test_analysis/ner_fixtures.json: precision, recall, speed, and the
+memory taken by importing and loading each engine.
+
+Every backend is measured in a fresh interpreter. spaCy is skipped when
+its model is not installed.
+
+Usage:
+    python scripts/bench_rule_ner.py [--repeat 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import resource
+import subprocess
+import sys
+import time
+
+FIXTURES = (
+    pathlib.Path(__file__).parent.parent
+    / "test"
+    / "test_analysis"
+    / "ner_fixtures.json"
+)
+
+
+def measure(backend: str, repeat: int) -> dict:
+    """Loads one backend in this process, then scores and times it."""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    from skip_trace.analysis import ner, rule_ner
+
+    if backend == "rules":
+        extract = rule_ner.extract_entities
+    else:
+        try:
+            nlp = ner.load_profile()
+        except (ImportError, IOError):
+            return {"backend": backend, "error": "model not installed"}
+
+        def extract(text: str) -> list:
+            return ner._keep_entities(nlp(text).ents)
+
+    load_seconds = time.perf_counter() - start
+    rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+
+    rows = json.loads(FIXTURES.read_text(encoding="utf-8"))
+    found = expected = correct = 0
+    for row in rows:
+        gold = {tuple(entity) for entity in row["entities"]}
+        predicted = set(extract(row["text"]))
+        found += len(predicted)
+        expected += len(gold)
+        correct += len(predicted & gold)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for row in rows:
+            extract(row["text"])
+    seconds = time.perf_counter() - start
+    return {
+        "backend": backend,
+        "load_s": round(load_seconds, 3),
+        "rss_mib": round(rss_kib / 1024, 1),
+        "precision": correct / found if found else 0.0,
+        "recall": correct / expected if expected else 0.0,
+        "texts_per_s": round(repeat * len(rows) / seconds),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.repeat)))
+        return
+
+    for backend in ("rules", "spacy"):
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                backend,
+                "--repeat",
+                str(args.repeat),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        row = json.loads(output.strip().splitlines()[-1])
+        if "error" in row:
+            print(f"{backend:<6} {row['error']}")
+            continue
+        print(
+            f"{backend:<6} load {row['load_s']:>6.2f}s  "
+            f"+{row['rss_mib']:>6.1f} MiB  "
+            f"precision {row['precision']:.2f}  recall {row['recall']:.2f}  "
+            f"{row['texts_per_s']:>8} texts/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
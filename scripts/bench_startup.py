@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Measures how long the CLI takes to start and fails when it regresses.
+
+Each measurement runs in a fresh interpreter with `-X importtime`: the time
+to import `skip_trace.cli` (all `--version` and `--help` pay for), plus the
+modules the cheap commands load. The run fails when the import exceeds the
+budget or when a heavy dependency is imported at startup.
+
+Usage:
+    python scripts/bench_startup.py [--budget-ms 250] [--repeat 5] [--top 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).parent.parent
+# Dependencies only the commands that use them may import
+HEAVY_MODULES = (
+    "bs4",
+    "github",
+    "httpx",
+    "pydantic",
+    "sigstore",
+    "spacy",
+    "tldextract",
+    "whois",
+    "whoisit",
+)
+COMMANDS = {
+    "import": "import skip_trace.cli",
+    "--version": "from skip_trace import cli; cli.main(['--version'])",
+    "schema": "from skip_trace import cli; cli.main(['schema', 'pypi-profile'])",
+}
+
+
+def importtime(code: str) -> dict[str, int]:
+    """Runs code in a fresh interpreter; returns the cumulative import time
+    of every module it imported, in microseconds."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line.split("|")
+        if not total.strip().isdigit():
+            continue  # the header line
+        cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    failed = False
+    for label, code in COMMANDS.items():
+        runs = [importtime(code) for _ in range(args.repeat)]
+        best_ms = min(run.get("skip_trace.cli", 0) for run in runs) / 1000
+        roots = {module.split(".")[0] for module in runs[0]}
+        heavy = sorted(roots.intersection(HEAVY_MODULES))
+        print(f"{label:<10} skip_trace.cli {best_ms:>7.1f} ms  heavy: {heavy or '-'}")
+        if label == "import":
+            failed |= best_ms > args.budget_ms
+            slowest = sorted(
+                (item for item in runs[0].items() if item[0] != "skip_trace.cli"),
+                key=lambda item: -item[1],
+            )
+            for module, micros in slowest[: args.top]:
+                print(f"    {micros / 1000:>7.1f} ms  {module}")
+        # `schema` renders a pydantic model, so it may load pydantic
+        allowed = {"pydantic"} if label == "schema" else set()
+        failed |= bool(set(heavy) - allowed)
+
+    if failed:
+        print(f"Startup regressed (budget {args.budget_ms:.0f} ms, no heavy imports)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
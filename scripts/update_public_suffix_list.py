@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""
+Refreshes the public suffix list bundled in skip_trace/utils.
+
+Downloads https://publicsuffix.org/list/public_suffix_list.dat and keeps its
+license header and ICANN section (private domains such as github.io are not
+used), then prints the old and new VERSION lines. Commit the result.
+
+Usage:
+    python scripts/update_public_suffix_list.py [--source FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import re
+
+import httpx
+
+URL = "https://publicsuffix.org/list/public_suffix_list.dat"
+TARGET = (
+    pathlib.Path(__file__).parent.parent
+    / "skip_trace"
+    / "utils"
+    / "public_suffix_list.dat"
+)
+END_MARKER = "// ===END ICANN DOMAINS==="
+
+
+def version_of(text: str) -> str:
+    match = re.search(r"^// VERSION: (\S+)", text, re.MULTILINE)
+    return match.group(1) if match else "unknown"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--source", help="Read a downloaded list instead.")
+    args = parser.parse_args()
+
+    if args.source:
+        text = pathlib.Path(args.source).read_text(encoding="utf-8")
+    else:
+        response = httpx.get(URL, follow_redirects=True, timeout=30)
+        response.raise_for_status()
+        text = response.text
+    if END_MARKER not in text:
+        raise SystemExit(f"No '{END_MARKER}' line, not a public suffix list")
+
+    old = TARGET.read_text(encoding="utf-8") if TARGET.exists() else ""
+    TARGET.write_text(text[: text.index(END_MARKER)] + END_MARKER + "\n", "utf-8")
+    print(f"{version_of(old)} -> {version_of(text)}")
+
+
+if __name__ == "__main__":
+    main()
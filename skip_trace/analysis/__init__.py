@@ -1,4 +1,17 @@
 # skip_trace/analysis/__init__.py
-from . import evidence, scoring, source_scanner, url_scanner
+from __future__ import annotations
 
-__all__ = ["evidence", "scoring", "source_scanner", "url_scanner"]
+from ..utils.lazy_imports import submodule_getattr
+
+__all__ = [
+    "evidence",
+    "file_scanner",
+    "project_files",
+    "scoring",
+    "source_scanner",
+    "url_scanner",
+]
+
+# Submodules load BeautifulSoup (evidence, url_scanner) and, for NER,
+# spaCy; they are imported when first accessed.
+__getattr__ = submodule_getattr(__name__, __all__)
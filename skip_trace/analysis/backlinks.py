@@ -10,7 +10,7 @@ from bs4 import BeautifulSoup
 
 from ..config import CONFIG
 from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
-from ..utils import http_client
+from ..collectors import urls
 from .evidence import generate_evidence_id
 
 logger = logging.getLogger(__name__)
@@ -86,13 +86,13 @@ def analyze_backlinks(
     # --- NEW LOGIC: Iterate through candidate URLs to verify them ---
     for source_url, source_record in candidate_url_map.items():
         logger.debug(f"Verifying claimed URL by scanning for backlinks: {source_url}")
-        response = http_client.make_request_safe(source_url)
+        status_code, content = urls.fetch_url_content(source_url)
 
-        if not response or response.status_code != 200:
+        if status_code != 200 or not content:
             continue
 
         try:
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(content, "html.parser")
         except Exception as e:
             logger.warning(f"Failed to parse HTML from {source_url}: {e}")
             continue
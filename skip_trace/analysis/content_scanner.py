@@ -8,7 +8,7 @@ from typing import List
 
 from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
 from ..utils.validation import is_valid_email
-from . import ner
+from . import license_text, ner, prefilter
 from .evidence import _parse_contact_string, generate_evidence_id
 
 # Regex to find copyright notices, capturing the holder.
@@ -77,11 +77,19 @@ def scan_text(
     evidence_list: List[EvidenceRecord] = []
     now = datetime.datetime.now(datetime.timezone.utc)
     found_in_scan = set()  # Avoid creating duplicate records from the same scan
+    triggers = prefilter.find_triggers(content)
+    if not triggers:
+        return evidence_list
 
     # 1. Scan for copyright notices
-    for match in COPYRIGHT_RE.finditer(content):
-        copyright_text = match.group(1).strip().rstrip(",.")
-        entities = ner.extract_entities(copyright_text)
+    copyright_texts = (
+        license_text.strip_boilerplate(
+            [m.group(1).strip().rstrip(",.") for m in COPYRIGHT_RE.finditer(content)]
+        )
+        if "copyright" in triggers
+        else []
+    )
+    for entities in ner.extract_entities_batch(copyright_texts):
         if entities:
             for entity_name, entity_label in entities:
                 if entity_name.lower() not in JUNK_WORDS:
@@ -109,7 +117,7 @@ def scan_text(
                     evidence_list.append(record)
 
     # 2. Scan for __author__ tags in Python files
-    if is_python_file:
+    if is_python_file and "author" in triggers:
         for match in AUTHOR_RE.finditer(content):
             author_str = match.group(1).strip()
             key = ("author", author_str)
@@ -135,7 +143,10 @@ def scan_text(
                 evidence_list.append(record)
 
     # 3. Scan for any standalone email address
-    for match in EMAIL_RE.finditer(content):
+    email_matches = (
+        prefilter.finditer(EMAIL_RE, content, "@") if "email" in triggers else iter(())
+    )
+    for match in email_matches:
         if valid_email := is_valid_email(match.group(0)):
             if ("email", valid_email) in found_in_scan:
                 continue
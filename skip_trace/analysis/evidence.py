@@ -7,10 +7,10 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-import tldextract
 from bs4 import BeautifulSoup  # Added import
 
 from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource, Maintainer
+from ..utils import domains
 from ..utils.validation import is_valid_email
 from . import ner  # Import the NER module
 
@@ -80,6 +80,57 @@ def generate_evidence_id(
     return f"e-{source.value}-{kind.value}-{slug}~{hash8}"
 
 
+def _parse_contact_strings(
+    contact_strs: List[str],
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Parses contact strings into their name and email components.
+
+    Handles formats like "Name <email>", "email", and "Name". Strings that
+    are neither are sent to NER together, in one batch.
+
+    Args:
+        contact_strs: The strings to parse.
+
+    Returns:
+        One dictionary with "name" and "email" keys per string, in order.
+    """
+    parsed: List[Dict[str, Optional[str]]] = []
+    needs_ner: List[int] = []
+    for contact_str in contact_strs:
+        if not contact_str or not contact_str.strip():
+            parsed.append({"name": None, "email": None})
+            continue
+
+        # Pattern for "Name <user@example.com>"
+        match = re.search(r"(.+)<(.+)>", contact_str)
+        if match:
+            name = match.group(1).strip()
+            # Validate the email part using the robust validator
+            email = is_valid_email(match.group(2).strip())
+            parsed.append({"name": name, "email": email})
+            continue
+
+        # If the whole string is a valid email, use it.
+        if email := is_valid_email(contact_str):
+            parsed.append({"name": None, "email": email})
+            continue
+
+        # Fallback to NER if it's not a clear email format
+        needs_ner.append(len(parsed))
+        parsed.append({"name": None, "email": None})
+
+    batch = [contact_strs[i].strip() for i in needs_ner]
+    for index, entities in zip(needs_ner, ner.extract_entities_batch(batch)):
+        for entity, kind in entities:
+            if kind == "PERSON":
+                parsed[index] = {"name": entity, "email": None}
+                break
+
+    # If no email and no person from NER, we got nothing
+    return parsed
+
+
 def _parse_contact_string(contact_str: str) -> Dict[str, Optional[str]]:
     """
     Parses a contact string into its name and email components.
@@ -92,29 +143,7 @@ def _parse_contact_string(contact_str: str) -> Dict[str, Optional[str]]:
     Returns:
         A dictionary with "name" and "email" keys.
     """
-    if not contact_str or not contact_str.strip():
-        return {"name": None, "email": None}
-
-    # Pattern for "Name <user@example.com>"
-    match = re.search(r"(.+)<(.+)>", contact_str)
-    if match:
-        name = match.group(1).strip()
-        # Validate the email part using the robust validator
-        email = is_valid_email(match.group(2).strip())
-        return {"name": name, "email": email}
-
-    # If the whole string is a valid email, use it.
-    if email := is_valid_email(contact_str):
-        return {"name": None, "email": email}
-
-    # Fallback to NER if it's not a clear email format
-    list_of_entities = ner.extract_entities(contact_str.strip())
-    for entity, kind in list_of_entities:
-        if kind == "PERSON":
-            return {"name": entity, "email": None}
-
-    # If no email and no person from NER, we got nothing
-    return {"name": None, "email": None}
+    return _parse_contact_strings([contact_str])[0]
 
 
 # Helper to sanitize fields that might contain the literal string "None"
@@ -236,8 +265,8 @@ def extract_from_pypi(
             logger.debug(
                 f"NER found {len(entities)} entities in PyPI field '{field_name}': {entities}"
             )
-            for entity_name, _entity_label in entities:
-                parsed = _parse_contact_string(entity_name)
+            names = [entity_name for entity_name, _entity_label in entities]
+            for parsed in _parse_contact_strings(names):
                 add_separate_evidence(parsed, "NER", confidence=0.45)
         # else:
         #     # Fallback to simple parsing if NER finds nothing
@@ -249,15 +278,19 @@ def extract_from_pypi(
     author_email = _clean_pypi_field(info.get("author_email"))
     # Prefer email string as it's more likely to contain both name and email
     author_string = author_email or author_name
+    maintainer_name = _clean_pypi_field(info.get("maintainer"))
+    maintainer_email = _clean_pypi_field(info.get("maintainer_email"))
+    maintainer_string = maintainer_email or maintainer_name
+
+    # Run NER over both fields in one batch; process_contact_string then
+    # finds the results memoized
+    ner.extract_entities_batch([s for s in (author_string, maintainer_string) if s])
+
     if author_string:
         process_contact_string(
             author_string, EvidenceKind.AUTHOR_TAG, "author/author_email"
         )
 
-    maintainer_name = _clean_pypi_field(info.get("maintainer"))
-    maintainer_email = _clean_pypi_field(info.get("maintainer_email"))
-    maintainer_string = maintainer_email or maintainer_name
-
     # Only process maintainer if it's different from the author string
     if maintainer_string and maintainer_string != author_string:
         process_contact_string(
@@ -272,7 +305,7 @@ def extract_from_pypi(
             if not url or not isinstance(url, str):
                 continue
 
-            domain_info = tldextract.extract(url)
+            domain_info = domains.extract(url)
             repo_host = domain_info.domain
             logger.debug(f"Parsing project URL ({label}): {url}")
 
@@ -0,0 +1,190 @@
+# skip_trace/analysis/evidence_cache.py
+from __future__ import annotations
+
+import base64
+import binascii
+import csv
+import datetime
+import hashlib
+import logging
+import posixpath
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import CONFIG
+from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
+from ..utils.cache import get_cached_data, set_cached_data
+from . import license_text, ner, project_files
+
+logger = logging.getLogger(__name__)
+
+EVIDENCE_CACHE_NAMESPACE = "evidence"
+# Evidence for a given content only changes with the extractors, never expire it
+EVIDENCE_CACHE_TTL_SECONDS = float("inf")
+# Bump whenever an extractor changes what it reports for the same text
+EXTRACTOR_VERSION = 5
+
+# Per-file (claim records, URL records)
+FileEvidence = Tuple[List[EvidenceRecord], List[EvidenceRecord]]
+
+
+def content_digest(data: bytes) -> str:
+    """Returns the hex sha256 of a file's content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_record_digests(record_text: str) -> Dict[str, str]:
+    """
+    Reads the sha256 of every file listed in a wheel's RECORD file.
+
+    Args:
+        record_text: The decoded RECORD file (CSV of path, hash, size).
+
+    Returns:
+        POSIX path -> hex sha256, for rows with a sha256 hash.
+    """
+    digests = {}
+    for row in csv.reader(record_text.splitlines()):
+        if len(row) < 2 or not row[1].startswith("sha256="):
+            continue
+        encoded = row[1][len("sha256=") :]
+        try:
+            raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4))
+        except (binascii.Error, ValueError):
+            continue
+        digests[posixpath.normpath(row[0])] = raw.hex()
+    return digests
+
+
+def _cache_key(digest: str, relative_path: str, claims: bool, urls: bool) -> str:
+    """
+    Builds the cache key for one file's evidence.
+
+    Extractors pick their rules by file name, and by whether a build
+    configuration file sits at the distribution root; NER output depends on
+    the engine and on whether license boilerplate is cut from its input. All
+    of these are part of the key along with the content hash.
+    """
+    model = ner.engine_signature()
+    basename = posixpath.basename(relative_path)
+    project = project_files.is_project_file(relative_path)
+    boilerplate = license_text.is_enabled()
+    return (
+        f"v{EXTRACTOR_VERSION}:{model}:claims={claims:d}:urls={urls:d}:"
+        f"project={project:d}:boilerplate={boilerplate:d}:{basename}:{digest}"
+    )
+
+
+def _to_json(record: EvidenceRecord) -> Dict[str, Any]:
+    return {
+        "id": record.id,
+        "source": record.source.value,
+        "kind": record.kind.value,
+        "value": record.value,
+        "confidence": record.confidence,
+        "notes": record.notes,
+    }
+
+
+def _relocate(
+    entry: Dict[str, Any],
+    old_locator: str,
+    old_path: str,
+    locator: str,
+    relative_path: str,
+    now: datetime.datetime,
+) -> EvidenceRecord:
+    """
+    Rebuilds a cached record as if it had been found at a new path.
+
+    The locator, the file path in the value and the locator in the notes are
+    replaced, and the ID hash is recomputed the way `generate_evidence_id`
+    would have computed it there.
+    """
+    source = EvidenceSource(entry["source"])
+    kind = EvidenceKind(entry["kind"])
+    value = entry["value"]
+    if isinstance(value, dict):
+        value = {k: relative_path if v == old_path else v for k, v in value.items()}
+    hasher = hashlib.sha256()
+    hasher.update(f"{source.value}|{kind.value}|{locator}|{value}".encode("utf-8"))
+    prefix = entry["id"].rsplit("~", 1)[0]
+    return EvidenceRecord(
+        id=f"{prefix}~{hasher.hexdigest()[:8]}",
+        source=source,
+        locator=locator,
+        kind=kind,
+        value=value,
+        observed_at=now,
+        confidence=entry["confidence"],
+        notes=entry["notes"].replace(old_locator, locator),
+    )
+
+
+def is_enabled() -> bool:
+    """Returns True if per-file evidence caching is on (`scan.evidence_cache`)."""
+    return bool(CONFIG.get("scan", {}).get("evidence_cache", True))
+
+
+def lookup(
+    digest: str,
+    relative_path: str,
+    locator_prefix: str,
+    claims: bool,
+    urls: bool,
+    now: datetime.datetime,
+) -> Optional[FileEvidence]:
+    """
+    Fetches the evidence previously found in a file with the same content.
+
+    Args:
+        digest: The hex sha256 of the file's content.
+        relative_path: The file's path relative to the package root.
+        locator_prefix: A prefix for the evidence locator (e.g., package name/version).
+        claims: Whether the claim extractors are enabled.
+        urls: Whether the URL extractors are enabled.
+        now: The observation timestamp for the returned records.
+
+    Returns:
+        (claim records, URL records) re-located to `relative_path`, or None
+        if this content has not been scanned before.
+    """
+    cached = get_cached_data(
+        EVIDENCE_CACHE_NAMESPACE,
+        _cache_key(digest, relative_path, claims, urls),
+        ttl_seconds=EVIDENCE_CACHE_TTL_SECONDS,
+    )
+    if cached is None:
+        return None
+    locator = f"{locator_prefix}/{relative_path}"
+
+    def relocate(entries: List[Dict[str, Any]]) -> List[EvidenceRecord]:
+        return [
+            _relocate(
+                entry, cached["locator"], cached["path"], locator, relative_path, now
+            )
+            for entry in entries
+        ]
+
+    return relocate(cached["claims"]), relocate(cached["urls"])
+
+
+def store(
+    digest: str,
+    relative_path: str,
+    locator_prefix: str,
+    claims: bool,
+    urls: bool,
+    evidence: FileEvidence,
+) -> None:
+    """Persists the evidence found in one file, see `lookup`."""
+    claim_records, url_records = evidence
+    set_cached_data(
+        EVIDENCE_CACHE_NAMESPACE,
+        _cache_key(digest, relative_path, claims, urls),
+        {
+            "path": relative_path,
+            "locator": f"{locator_prefix}/{relative_path}",
+            "claims": [_to_json(r) for r in claim_records],
+            "urls": [_to_json(r) for r in url_records],
+        },
+    )
@@ -0,0 +1,770 @@
+# skip_trace/analysis/file_scanner.py
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextlib
+import datetime
+import gc
+import itertools
+import logging
+import multiprocessing
+import multiprocessing.context
+import os
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..config import CONFIG
+from ..exceptions import ConfigurationError
+from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
+from . import (
+    evidence_cache,
+    license_text,
+    ner,
+    prefilter,
+    project_files,
+    source_scanner,
+    url_scanner,
+    vendored,
+)
+
+logger = logging.getLogger(__name__)
+
+# Only this much of a file is inspected to decide whether it is binary
+BINARY_SNIFF_BYTES = 1024
+# Work is shipped to worker processes in chunks of at most this many files/bytes
+CHUNK_MAX_FILES = 64
+CHUNK_MAX_BYTES = 8 * 1024 * 1024
+# How scan workers start (`scan.worker_start`): "preload" forks them from
+# this process once the NER model is loaded, "spawn" starts fresh interpreters
+WORKER_START_METHODS = ("preload", "spawn")
+
+# Called with (relative path, decoded text) for every text file scanned
+TextVisitor = Callable[[str, str], None]
+# Per-file (claim records, URL records), or None for a binary file
+FileResult = Optional[Tuple[List[EvidenceRecord], List[EvidenceRecord]]]
+# A file's result, whether it was served from the cache, and its decoded
+# text when the caller asked for it
+ChunkResult = Tuple[FileResult, bool, Optional[str]]
+
+# Kinds that the claim extractors report only once per package (by notes)
+PACKAGE_DEDUPED_KINDS = {EvidenceKind.COPYRIGHT, EvidenceKind.CONTACT}
+
+# Vendored code root -> vendored project, see `vendored.find_vendored_roots`
+VendoredRoots = Dict[str, Optional[str]]
+# Called with the claim evidence found so far; returning True ends the scan
+StopCondition = Callable[[List[EvidenceRecord]], bool]
+
+# File name prefixes of the files most likely to name an owner (tier 1)
+OWNER_FILE_PREFIXES = (
+    "license",
+    "licence",
+    "copying",
+    "notice",
+    "authors",
+    "contributors",
+    "maintainers",
+    "credits",
+)
+# Project files describing the package (tier 2)
+PROJECT_FILES = {"pyproject.toml", "setup.cfg", "setup.py"}
+# Prose and config extensions (tier 5)
+DOC_EXTENSIONS = {".md", ".rst", ".txt", ".toml", ".cfg"}
+
+
+def is_skipped_path(relative_path: str) -> bool:
+    """Returns True for files under skipped directories or with binary extensions."""
+    parts = relative_path.split("/")
+    if any(part in source_scanner.skip_dirs for part in parts[:-1]):
+        return True
+    extension = os.path.splitext(parts[-1])[1].lower()
+    return extension in source_scanner.skip_extensions
+
+
+def file_priority(relative_path: str) -> Tuple[int, int, str]:
+    """
+    Ranks a file by how likely it is to carry ownership evidence.
+
+    Tiers, best first: core metadata, license/authors-style files, README
+    and project files, package `__init__.py` files, shallow modules, other
+    docs and config, everything else. Within a tier, shallower paths win.
+
+    Args:
+        relative_path: The POSIX path relative to the package root.
+
+    Returns:
+        A sort key of (tier, depth, path).
+    """
+    parts = relative_path.split("/")
+    name = parts[-1].lower()
+    depth = len(parts) - 1
+    extension = os.path.splitext(name)[1]
+    if name in ("metadata", "pkg-info"):
+        tier = 0
+    elif name.startswith(OWNER_FILE_PREFIXES):
+        tier = 1
+    elif name.startswith("readme") or name in PROJECT_FILES:
+        tier = 2
+    elif name == "__init__.py" and depth <= 3:
+        tier = 3
+    elif extension == ".py" and depth <= 2:
+        tier = 4
+    elif extension in DOC_EXTENSIONS:
+        tier = 5
+    else:
+        tier = 6
+    return tier, depth, relative_path
+
+
+def plan_scan(
+    entries: Iterable[Tuple[str, int]],
+    max_files: int,
+    max_bytes: int,
+    max_member_bytes: int,
+) -> List[str]:
+    """
+    Picks the files a budgeted scan should read, most promising first.
+
+    Skipped paths and files over `max_member_bytes` are dropped, the rest are
+    ordered by `file_priority` and taken until `max_files` is reached. A file
+    that would overflow `max_bytes` is passed over in favour of smaller ones.
+
+    Args:
+        entries: (relative path, size in bytes) for every candidate file.
+        max_files: The most files to read.
+        max_bytes: The most bytes to read in total.
+        max_member_bytes: The largest single file to consider.
+
+    Returns:
+        The relative paths to read, in priority order.
+    """
+    candidates = sorted(
+        (
+            (file_priority(path), size)
+            for path, size in entries
+            if size <= max_member_bytes and not is_skipped_path(path)
+        ),
+    )
+    plan: List[str] = []
+    total = 0
+    for (_, _, path), size in candidates:
+        if len(plan) >= max_files:
+            break
+        if total + size > max_bytes:
+            continue
+        plan.append(path)
+        total += size
+    return plan
+
+
+def enough_evidence(min_records: int, min_confidence: float) -> StopCondition:
+    """
+    Builds a stop condition for `scan_files`.
+
+    Args:
+        min_records: How many claim records are enough.
+        min_confidence: The lowest confidence a record needs to count.
+
+    Returns:
+        A predicate that is True once enough confident claims were found.
+    """
+
+    def stop(claims: List[EvidenceRecord]) -> bool:
+        confident = [r for r in claims if r.confidence >= min_confidence]
+        return len(confident) >= min_records
+
+    return stop
+
+
+def list_directory_files(directory_path: str) -> List[str]:
+    """
+    Lists the candidate files of a directory tree, pruning skipped directories.
+
+    Args:
+        directory_path: The directory to walk.
+
+    Returns:
+        POSIX paths relative to the directory.
+    """
+    paths = []
+    for root, dirs, files in os.walk(directory_path):
+        # Modify dirs in-place to prune the search
+        dirs[:] = [d for d in dirs if d not in source_scanner.skip_dirs]
+        for filename in files:
+            relative_path = os.path.relpath(
+                os.path.join(root, filename), directory_path
+            )
+            relative_path = relative_path.replace(os.sep, "/")
+            if not is_skipped_path(relative_path):
+                paths.append(relative_path)
+    return paths
+
+
+def iter_directory_files(
+    directory_path: str, relative_paths: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Reads each candidate file of a directory tree once.
+
+    Args:
+        directory_path: The directory to read from.
+        relative_paths: The files to read (default: `list_directory_files`).
+
+    Returns:
+        An iterator of (POSIX path relative to the directory, file bytes).
+    """
+    if relative_paths is None:
+        relative_paths = list_directory_files(directory_path)
+    for relative_path in relative_paths:
+        file_path = os.path.join(directory_path, *relative_path.split("/"))
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            logger.debug(f"Could not read file {file_path}: {e}")
+            continue
+        yield relative_path, data
+
+
+def _set_aside_vendored(
+    files: Iterable[Tuple[str, bytes]],
+    roots: VendoredRoots,
+    mode: str,
+    set_aside: List[Tuple[str, bytes]],
+) -> Iterator[Tuple[str, bytes]]:
+    """Passes on the package's own files; vendored ones are dropped or set aside."""
+    skipped = 0
+    for relative_path, data in files:
+        if mode == "scan" or vendored.vendored_project(relative_path, roots) is None:
+            yield relative_path, data
+        elif mode == "tag":
+            set_aside.append((relative_path, data))
+        else:
+            skipped += 1
+    if skipped:
+        logger.info(f"Skipped {skipped} vendored files")
+
+
+def _scan_vendored(
+    files: List[Tuple[str, bytes]],
+    roots: VendoredRoots,
+    locator_prefix: str,
+    claims: bool,
+    urls: bool,
+    workers: Optional[int],
+) -> List[EvidenceRecord]:
+    """Scans vendored files one vendored project at a time and tags the evidence."""
+    by_project: Dict[str, List[Tuple[str, bytes]]] = {}
+    for relative_path, data in files:
+        project = vendored.vendored_project(relative_path, roots) or "unknown"
+        by_project.setdefault(project, []).append((relative_path, data))
+    evidence: List[EvidenceRecord] = []
+    for project, members in by_project.items():
+        records = scan_files(
+            members, locator_prefix, claims=claims, urls=urls, workers=workers
+        )
+        vendored.tag_vendored(records, project)
+        evidence.extend(records)
+    return evidence
+
+
+def _is_text(relative_path: str, data: bytes) -> bool:
+    """Runs the binary check on the first bytes of a file."""
+    return not source_scanner.is_binary_content(
+        relative_path, data[:BINARY_SNIFF_BYTES]
+    )
+
+
+def _merge_declared(
+    declared: List[EvidenceRecord], scanned: List[EvidenceRecord]
+) -> List[EvidenceRecord]:
+    """
+    Adds the regex matches of a build configuration file to the fields it
+    declares. Declared fields beat guesses over the same file, so matches
+    naming a declared person or email are dropped; the rest (emails in
+    comments) are kept.
+    """
+    names = set()
+    for record in declared:
+        for key in ("name", "email"):
+            if value := record.value.get(key):
+                names.add(value.lower())
+    kept = []
+    for record in scanned:
+        values = [record.value.get(key) for key in ("name", "email", "holder")]
+        if not any(value and str(value).lower() in names for value in values):
+            kept.append(record)
+    return declared + kept
+
+
+def _scan_text(
+    content: str,
+    relative_path: str,
+    locator_prefix: str,
+    claims: bool,
+    urls: bool,
+    now: datetime.datetime,
+    triggers: Optional[prefilter.Triggers] = None,
+    copyright_texts: Optional[List[str]] = None,
+) -> Tuple[List[EvidenceRecord], List[EvidenceRecord]]:
+    """
+    Runs the enabled extractors over one decoded file.
+
+    Build configuration files that declare their owners skip the copyright
+    (NER) extractor; only the regex ones run over them, to be merged with
+    the declared fields.
+    """
+    claim_records: List[EvidenceRecord] = []
+    structured = None
+    if claims and project_files.is_project_file(relative_path):
+        structured = project_files.extract_project_evidence(
+            content, relative_path, locator_prefix, now
+        )
+    if structured:
+        if triggers is None:
+            triggers = prefilter.find_triggers(content)
+        source_scanner.scan_file_content(
+            content,
+            relative_path,
+            locator_prefix,
+            claim_records,
+            now,
+            triggers - {"copyright"},
+            [],
+        )
+        claim_records = _merge_declared(structured, claim_records)
+    elif claims:
+        source_scanner.scan_file_content(
+            content,
+            relative_path,
+            locator_prefix,
+            claim_records,
+            now,
+            triggers,
+            copyright_texts,
+        )
+    url_records: List[EvidenceRecord] = []
+    if urls:
+        url_records = url_scanner.scan_text_for_urls(
+            content,
+            f"{locator_prefix}/{relative_path}",
+            EvidenceSource.WHEEL,
+            file_type=url_scanner.file_type_for(relative_path),
+        )
+    return claim_records, url_records
+
+
+def _scan_chunk(
+    chunk: List[Tuple[str, bytes]],
+    locator_prefix: str,
+    claims: bool,
+    urls: bool,
+    now: datetime.datetime,
+    digests: Dict[str, str],
+    keep_text: bool = False,
+) -> List[ChunkResult]:
+    """
+    Scans a chunk of files in a worker process.
+
+    Text files whose content was scanned before are served from the evidence
+    cache, and files that triggered an extractor or gave evidence are added
+    to it; `digests` supplies known content hashes (e.g. from a wheel's
+    RECORD), the rest are hashed here. The copyright notices of all other
+    files go through NER in one batch before any file is scanned.
+
+    Returns:
+        One (result, served from cache, decoded text) triple per file; the
+        text is only returned with `keep_text`, so `on_text` callers do not
+        decode each file again.
+    """
+    use_cache = evidence_cache.is_enabled()
+    results: List[ChunkResult] = [(None, False, None)] * len(chunk)
+    # (index, path, digest, content, triggers, copyright candidates) of the
+    # files left to scan
+    to_scan: List[
+        Tuple[int, str, str, str, Optional[prefilter.Triggers], Optional[List[str]]]
+    ] = []
+    for index, (relative_path, data) in enumerate(chunk):
+        if not _is_text(relative_path, data):
+            continue
+        digest = ""
+        if use_cache:
+            digest = digests.get(relative_path) or evidence_cache.content_digest(data)
+            cached = evidence_cache.lookup(
+                digest, relative_path, locator_prefix, claims, urls, now
+            )
+            if cached is not None:
+                text = source_scanner.decode_text(data) if keep_text else None
+                results[index] = (cached, True, text)
+                continue
+        # Trigger keywords are searched for in the raw bytes, before decoding
+        triggers = prefilter.find_triggers(data) if claims else None
+        content = source_scanner.decode_text(data)
+        # Project files are parsed before their notices are extracted, as
+        # those that declare their owners skip NER
+        candidates = (
+            source_scanner.copyright_candidates(content, triggers)
+            if claims and not project_files.is_project_file(relative_path)
+            else None
+        )
+        to_scan.append((index, relative_path, digest, content, triggers, candidates))
+
+    if claims:
+        # Warms the NER memo, so the per-file scans below find every result
+        ner.extract_entities_batch(
+            [text for *_, candidates in to_scan for text in candidates or ()]
+        )
+    for index, relative_path, digest, content, triggers, candidates in to_scan:
+        result = _scan_text(
+            content,
+            relative_path,
+            locator_prefix,
+            claims,
+            urls,
+            now,
+            triggers,
+            candidates,
+        )
+        # Files no claim extractor ran on and that gave nothing are cheaper
+        # to rescan than to store and look up
+        if use_cache and (triggers or any(result)):
+            evidence_cache.store(
+                digest, relative_path, locator_prefix, claims, urls, result
+            )
+        results[index] = (result, False, content if keep_text else None)
+    return results
+
+
+def _init_worker(config: Dict[str, Any]) -> None:
+    """
+    Worker initializer: adopt the parent's config and load NER and the
+    license index once.
+
+    Forked workers inherit the parent's, so loading is a no-op there.
+    """
+    CONFIG.update(config)
+    ner._get_nlp_model()
+    license_text.load_index()
+
+
+def _worker_start_method() -> str:
+    """
+    Returns how scan workers are started, `scan.worker_start`.
+
+    Raises:
+        ConfigurationError: If the setting is not one of WORKER_START_METHODS.
+    """
+    method = CONFIG.get("scan", {}).get("worker_start", "preload")
+    if method not in WORKER_START_METHODS:
+        raise ConfigurationError(
+            f"scan.worker_start must be one of {', '.join(WORKER_START_METHODS)}, "
+            f"not {method!r}"
+        )
+    return method
+
+
+@contextlib.contextmanager
+def _pool_context() -> Iterator[multiprocessing.context.BaseContext]:
+    """
+    Picks the multiprocessing context for a scan pool.
+
+    In "preload" mode the NER model and license index are loaded here and
+    workers are forked, so they start with both already in memory and share
+    their pages with this process copy-on-write. The pages are not all kept
+    shared: touching an object updates its reference count, which copies the
+    page it lives on. `gc.freeze()` moves the existing objects out of the
+    collector's generations, so at least collections in the workers do not
+    walk (and copy) every page of the model; large buffers such as the
+    model's weight arrays are rarely referenced and stay shared longest.
+    Where fork is unavailable, and in "spawn" mode, workers are fresh
+    interpreters that load their own.
+    """
+    if (
+        _worker_start_method() == "preload"
+        and "fork" in multiprocessing.get_all_start_methods()
+    ):
+        ner._get_nlp_model()
+        license_text.load_index()
+        gc.freeze()
+        try:
+            yield multiprocessing.get_context("fork")
+        finally:
+            gc.unfreeze()
+    else:
+        yield multiprocessing.get_context("spawn")
+
+
+def _chunked(
+    files: Iterable[Tuple[str, bytes]],
+) -> Iterator[List[Tuple[str, bytes]]]:
+    """Groups files into chunks bounded by CHUNK_MAX_FILES and CHUNK_MAX_BYTES."""
+    chunk: List[Tuple[str, bytes]] = []
+    size = 0
+    for item in files:
+        chunk.append(item)
+        size += len(item[1])
+        if len(chunk) >= CHUNK_MAX_FILES or size >= CHUNK_MAX_BYTES:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
+
+
+def _iter_parallel(
+    files: Iterable[Tuple[str, bytes]],
+    workers: int,
+    locator_prefix: str,
+    claims: bool,
+    urls: bool,
+    now: datetime.datetime,
+    digests: Dict[str, str],
+    keep_text: bool = False,
+) -> Generator[Tuple[str, FileResult, bool, Optional[str]], None, None]:
+    """
+    Scans files in a process pool, yielding results in input order.
+
+    At most two chunks per worker are in flight, so memory stays bounded
+    however large the tree is. Closing the iterator early cancels the
+    chunks that have not started.
+    """
+    with (
+        _pool_context() as context,
+        concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(dict(CONFIG),),
+        ) as pool,
+    ):
+        pending: Deque[
+            Tuple[
+                List[Tuple[str, bytes]],
+                concurrent.futures.Future[List[ChunkResult]],
+            ]
+        ] = collections.deque()
+        try:
+            for chunk in _chunked(files):
+                chunk_digests = {p: digests[p] for p, _ in chunk if p in digests}
+                future = pool.submit(
+                    _scan_chunk,
+                    chunk,
+                    locator_prefix,
+                    claims,
+                    urls,
+                    now,
+                    chunk_digests,
+                    keep_text,
+                )
+                pending.append((chunk, future))
+                if len(pending) >= workers * 2:
+                    done_chunk, done = pending.popleft()
+                    for (path, _), (result, cached, text) in zip(
+                        done_chunk, done.result()
+                    ):
+                        yield path, result, cached, text
+            while pending:
+                done_chunk, done = pending.popleft()
+                for (path, _), (result, cached, text) in zip(done_chunk, done.result()):
+                    yield path, result, cached, text
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _iter_serial(
+    files: Iterable[Tuple[str, bytes]],
+    locator_prefix: str,
+    claims: bool,
+    urls: bool,
+    now: datetime.datetime,
+    digests: Dict[str, str],
+    keep_text: bool = False,
+) -> Generator[Tuple[str, FileResult, bool, Optional[str]], None, None]:
+    """Scans files in this process, a chunk (and one NER batch) at a time."""
+    for chunk in _chunked(files):
+        results = _scan_chunk(
+            chunk, locator_prefix, claims, urls, now, digests, keep_text
+        )
+        for (path, _), (result, cached, text) in zip(chunk, results):
+            yield path, result, cached, text
+
+
+def _worker_count(workers: Optional[int]) -> int:
+    """Resolves the number of scan processes from the argument or config."""
+    if workers is None:
+        workers = CONFIG.get("scan", {}).get("workers")
+    return max(1, workers or os.cpu_count() or 1)
+
+
+def scan_files(
+    files: Iterable[Tuple[str, bytes]],
+    locator_prefix: str,
+    claims: bool = True,
+    urls: bool = True,
+    on_text: Optional[TextVisitor] = None,
+    workers: Optional[int] = None,
+    stop_when: Optional[StopCondition] = None,
+    vendored_roots: Optional[VendoredRoots] = None,
+    digests: Optional[Dict[str, str]] = None,
+) -> List[EvidenceRecord]:
+    """
+    Scans files for evidence, running every extractor over each file once.
+
+    Each file is checked for binary content once, decoded once and then
+    handed to the claim extractors (copyright, `__author__`, email, AUTHORS)
+    and the URL extractors. Trees with at least `scan.parallel_min_files`
+    files are split into chunks and scanned by a process pool; results are
+    merged in input order, so the evidence is the same either way.
+
+    Evidence is cached per file content (see `evidence_cache`), so content
+    seen in an earlier version or another package is not scanned again;
+    its evidence is re-located to the current path.
+
+    Args:
+        files: (path relative to the package root, bytes) pairs, e.g. from
+            `iter_directory_files` or an archive reader.
+        locator_prefix: A prefix for the evidence locator (e.g., package name/version).
+        claims: Whether to run the claim extractors.
+        urls: Whether to run the URL extractors.
+        on_text: Optional callback receiving every decoded text file, for
+            callers that need to parse specific files themselves. It runs
+            in this process, after the file was scanned.
+        workers: Number of scan processes (default: `scan.workers` config,
+            or one per CPU).
+        stop_when: Optional predicate over the claim evidence found so far,
+            checked after each file; once it returns True the remaining
+            files are not scanned. Pair it with prioritized input (see
+            `plan_scan`).
+        vendored_roots: Vendored code roots from
+            `vendored.find_vendored_roots`. Depending on `scan.vendored`,
+            files under them are skipped, scanned separately with their
+            evidence tagged and discounted, or scanned like the rest.
+
+        digests: Known hex sha256 digests by path, e.g. from a wheel's
+            RECORD; other files are hashed as they are scanned.
+
+    Returns:
+        The claim evidence followed by the URL evidence, then any tagged
+        vendored evidence.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    min_files = CONFIG.get("scan", {}).get("parallel_min_files", 200)
+    vendored_files: List[Tuple[str, bytes]] = []
+    if vendored_roots:
+        files = _set_aside_vendored(
+            files, vendored_roots, vendored.vendored_mode(), vendored_files
+        )
+
+    iterator = iter(files)
+    head = list(itertools.islice(iterator, min_files))
+    files = itertools.chain(head, iterator)
+    pool_size = _worker_count(workers)
+    keep_text = on_text is not None
+    if pool_size > 1 and len(head) >= min_files:
+        logger.info(f"Scanning files with {pool_size} worker processes")
+        results = _iter_parallel(
+            files,
+            pool_size,
+            locator_prefix,
+            claims,
+            urls,
+            now,
+            digests or {},
+            keep_text,
+        )
+    else:
+        results = _iter_serial(
+            files, locator_prefix, claims, urls, now, digests or {}, keep_text
+        )
+
+    claim_evidence: List[EvidenceRecord] = []
+    url_evidence: List[EvidenceRecord] = []
+    seen_notes: Set[str] = set()
+    file_count = 0
+    cached_count = 0
+    try:
+        for relative_path, result, cached, text in results:
+            file_count += 1
+            cached_count += cached
+            if result is None:
+                logger.debug(
+                    f"Skipping binary file detected by content: {relative_path}"
+                )
+                continue
+            claim_records, url_records = result
+            # Copyright holders and contact emails are reported once per package
+            for record in claim_records:
+                if record.kind in PACKAGE_DEDUPED_KINDS and record.notes in seen_notes:
+                    continue
+                seen_notes.add(record.notes)
+                claim_evidence.append(record)
+            url_evidence.extend(url_records)
+            if on_text and text is not None:
+                on_text(relative_path, text)
+            if stop_when and stop_when(claim_evidence):
+                logger.info(f"Stopping scan early after {file_count} files")
+                break
+    finally:
+        # Shuts down a process pool that still has chunks in flight
+        results.close()
+
+    logger.info(
+        f"Scanned {file_count} files ({cached_count} from the evidence cache), found "
+        f"{len(claim_evidence) + len(url_evidence)} potential evidence records."
+    )
+    evidence = claim_evidence + url_evidence
+    if vendored_roots and vendored_files:
+        evidence.extend(
+            _scan_vendored(
+                vendored_files, vendored_roots, locator_prefix, claims, urls, workers
+            )
+        )
+    return evidence
+
+
+def scan_directory(
+    directory_path: str,
+    locator_prefix: str,
+    claims: bool = True,
+    urls: bool = True,
+    on_text: Optional[TextVisitor] = None,
+) -> List[EvidenceRecord]:
+    """
+    Scans a directory tree in a single pass; see `scan_files`.
+
+    Vendored code is detected from the file listing before anything is
+    read, and handled according to `scan.vendored`.
+
+    Args:
+        directory_path: The absolute path to the directory to scan.
+        locator_prefix: A prefix for the evidence locator (e.g., package name/version).
+        claims: Whether to run the claim extractors.
+        urls: Whether to run the URL extractors.
+        on_text: Optional callback receiving every decoded text file.
+
+    Returns:
+        The claim evidence followed by the URL evidence.
+    """
+    paths = list_directory_files(directory_path)
+    roots = vendored.find_vendored_roots(paths)
+    if roots and vendored.vendored_mode() == "skip":
+        paths = [p for p in paths if vendored.vendored_project(p, roots) is None]
+    return scan_files(
+        iter_directory_files(directory_path, paths),
+        locator_prefix,
+        claims=claims,
+        urls=urls,
+        on_text=on_text,
+        vendored_roots=roots,
+    )
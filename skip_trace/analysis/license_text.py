@@ -0,0 +1,153 @@
+# skip_trace/analysis/license_text.py
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import re
+import time
+from typing import FrozenSet, List, NamedTuple, Set, Tuple
+
+from ..config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Standard license texts, named by SPDX id, with template fields such as
+# "<copyright holders>" where a real license names its holder
+LICENSE_TEXTS_DIR = os.path.join(os.path.dirname(__file__), "license_texts")
+# Phrases that follow holders in notices without being part of a license
+EXTRA_BOILERPLATE = (
+    "all rights reserved",
+    "some rights reserved",
+    "licensed under the",
+    "see the license",
+    "see license file",
+)
+# A run of this many words found in a license text marks boilerplate
+SHINGLE_WORDS = 3
+# Words as they are compared: case, punctuation and line breaks are ignored,
+# so the texts match however they are wrapped or commented
+WORD_RE = re.compile(r"[a-z0-9]+", re.IGNORECASE)
+# The holder part of the copyright notices the license texts carry themselves
+# ("Free Software Foundation, Inc." atop the GPL)
+NOTICE_RE = re.compile(r"copyright\s*(?:\(c\))?\s*(?:[0-9,\-\s]+)?\s*([^\n]+)", re.I)
+
+
+class BoilerplateIndex(NamedTuple):
+    """Every run of words in the bundled license texts, lowercased."""
+
+    licenses: Tuple[str, ...]
+    # Runs of SHINGLE_WORDS words
+    shingles: FrozenSet[str]
+    # Shorter runs, for holder texts of fewer words
+    phrases: FrozenSet[str]
+    # Holder texts of the licenses' own copyright notices
+    notices: FrozenSet[str]
+
+
+def is_enabled() -> bool:
+    """Returns True if license boilerplate is cut from copyright holders
+    before NER (`scan.license_boilerplate`)."""
+    return bool(CONFIG.get("scan", {}).get("license_boilerplate", True))
+
+
+def _words(text: str) -> List[str]:
+    return [word.lower() for word in WORD_RE.findall(text)]
+
+
+def _is_name_word(word: str) -> bool:
+    """Capitalized like a name ("Foundation"), not shouted ("HOLDERS")."""
+    return word[0].isupper() and not word.isupper()
+
+
+@functools.lru_cache(maxsize=None)
+def load_index(directory: str = LICENSE_TEXTS_DIR) -> BoilerplateIndex:
+    """
+    Indexes the license texts in a directory, once per process.
+
+    Args:
+        directory: A directory of `<SPDX id>.txt` files.
+
+    Returns:
+        The word runs of the texts and of EXTRA_BOILERPLATE.
+    """
+    start = time.perf_counter()
+    licenses = []
+    texts = list(EXTRA_BOILERPLATE)
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".txt"):
+            licenses.append(name[: -len(".txt")])
+            with open(os.path.join(directory, name), encoding="utf-8") as handle:
+                texts.append(handle.read())
+    shingles: Set[str] = set()
+    phrases: Set[str] = set()
+    notices: Set[str] = set()
+    for text in texts:
+        words = _words(text)
+        phrases.update(words)
+        phrases.update(map(" ".join, zip(words, words[1:])))
+        shingles.update(map(" ".join, zip(words, words[1:], words[2:])))
+        notices.update(" ".join(_words(m.group(1))) for m in NOTICE_RE.finditer(text))
+    logger.debug(
+        f"Indexed {len(licenses)} license texts ({len(shingles)} shingles) "
+        f"in {time.perf_counter() - start:.3f}s"
+    )
+    return BoilerplateIndex(
+        tuple(licenses), frozenset(shingles), frozenset(phrases), frozenset(notices)
+    )
+
+
+def holder_fragment(holder_text: str) -> str:
+    """
+    Cuts license boilerplate out of the text a copyright notice names.
+
+    The text is kept up to the first run of SHINGLE_WORDS words that occurs
+    in a known license, so "Acme Inc. All rights reserved." gives
+    "Acme Inc." and the "holders and contributors ..." matched inside a
+    license body gives "". Runs starting with two words capitalized like a
+    name are not cut ("Python Software Foundation and contributors" keeps
+    its "Software Foundation and"), and texts of fewer words are only
+    dropped when none of them is. The licenses' own notices are dropped
+    whole.
+
+    Args:
+        holder_text: The text after "Copyright", its symbol and years.
+
+    Returns:
+        The variable part of the notice, "" when it is all boilerplate.
+    """
+    matches = list(WORD_RE.finditer(holder_text))
+    words = [match.group(0).lower() for match in matches]
+    index = load_index()
+    if " ".join(words) in index.notices:
+        return ""
+
+    end = len(words)
+    for i in range(len(words) - SHINGLE_WORDS + 1):
+        if " ".join(words[i : i + SHINGLE_WORDS]) not in index.shingles:
+            continue
+        if _is_name_word(matches[i].group(0)) and _is_name_word(
+            matches[i + 1].group(0)
+        ):
+            continue  # "Software Foundation ...", a name, not a sentence
+        end = i
+        break
+    if end < SHINGLE_WORDS and not any(
+        _is_name_word(match.group(0)) for match in matches[:end]
+    ):
+        if " ".join(words[:end]) in index.phrases or end == 0:
+            return ""
+    if end == len(words):
+        return holder_text
+    return holder_text[: matches[end].start()].rstrip(" \t,;:-([<\"'")
+
+
+def strip_boilerplate(holder_texts: List[str]) -> List[str]:
+    """
+    Applies `holder_fragment` to copyright holder texts, if enabled, and
+    drops the texts left empty.
+    """
+    if not is_enabled():
+        return holder_texts
+    fragments = (holder_fragment(text) for text in holder_texts)
+    return [fragment for fragment in fragments if fragment]
@@ -1,58 +1,410 @@
 # skip_trace/analysis/ner.py
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import List, Optional, Tuple
+import multiprocessing
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-import spacy
-from spacy.language import Language
+from ..config import CONFIG
+from ..exceptions import ConfigurationError
+from ..utils.cache import get_cached_data, set_cached_data
+from . import rule_ner
+
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Span
 
 SPACY_AVAILABLE = True
+MODEL_NAME = "en_core_web_sm"
+NER_CACHE_NAMESPACE = "ner"
+# NER output only changes with the model, so persisted results never expire
+NER_CACHE_TTL_SECONDS = float("inf")
+
+# Named ways to load spaCy (`ner.profile`): the model, and the components to
+# keep, None keeping the whole pipeline. Only `doc.ents` is read, so all but
+# "full" leave out the tagger, parser, lemmatizer and the rest.
+NER_PROFILES: Dict[str, Dict[str, Any]] = {
+    "fast": {"model": MODEL_NAME, "components": ["ner"]},
+    "balanced": {"model": "en_core_web_md", "components": ["ner"]},
+    "accurate": {"model": "en_core_web_lg", "components": ["ner"]},
+    "full": {"model": MODEL_NAME, "components": None},
+}
+# Components of the en_core_web_* pipelines
+MODEL_COMPONENTS = (
+    "tok2vec",
+    "tagger",
+    "parser",
+    "senter",
+    "attribute_ruler",
+    "lemmatizer",
+    "ner",
+)
+# Shared embedding layers, kept only when a kept component listens to them
+EMBEDDING_COMPONENTS = ("tok2vec", "transformer")
+# NER engines (`ner.backend`): a spaCy model, or patterns and a gazetteer
+# (rule_ner), which never imports spaCy
+NER_BACKENDS = ("spacy", "rules")
 
 
 logger = logging.getLogger(__name__)
 
 _nlp: Optional[Language] = None
+_memo: Dict[str, List[Tuple[str, str]]] = {}
+_stats: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def get_backend() -> str:
+    """
+    Returns the configured NER engine, `ner.backend`.
+
+    Raises:
+        ConfigurationError: If the setting is not one of NER_BACKENDS.
+    """
+    backend = CONFIG.get("ner", {}).get("backend", "spacy")
+    if backend not in NER_BACKENDS:
+        raise ConfigurationError(
+            f"ner.backend must be one of {', '.join(NER_BACKENDS)}, not {backend!r}"
+        )
+    return backend
+
+
+def get_profile(name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Looks up an NER profile, by default the configured `ner.profile`.
+
+    Raises:
+        ConfigurationError: If the profile is not one of NER_PROFILES.
+    """
+    if name is None:
+        name = CONFIG.get("ner", {}).get("profile", "fast")
+    if name not in NER_PROFILES:
+        raise ConfigurationError(
+            f"ner.profile must be one of {', '.join(NER_PROFILES)}, not {name!r}"
+        )
+    return NER_PROFILES[name]
+
+
+def load_profile(name: Optional[str] = None) -> Language:
+    """
+    Loads the spaCy model of an NER profile with only the components it keeps.
+
+    Left-out components are excluded, so they are never read from disk.
+    Embedding layers such as tok2vec are excluded with them, unless a kept
+    component listens to them.
+
+    Args:
+        name: The profile, by default the configured `ner.profile`.
+
+    Raises:
+        ConfigurationError: If the profile is unknown.
+        IOError: If the profile's model is not installed.
+    """
+    profile = get_profile(name)
+    components = profile["components"]
+    exclude = []
+    if components is not None:
+        exclude = [
+            c
+            for c in MODEL_COMPONENTS
+            if c not in components and c not in EMBEDDING_COMPONENTS
+        ]
+    # Imported here: importing spaCy takes most of a second
+    import spacy
+
+    nlp = spacy.load(profile["model"], exclude=exclude)
+    if components is not None:
+        for embedding in EMBEDDING_COMPONENTS:
+            if embedding in nlp.pipe_names and not getattr(
+                nlp.get_pipe(embedding), "listening_components", None
+            ):
+                nlp.remove_pipe(embedding)
+    return nlp
 
 
 def _get_nlp_model() -> Optional[Language]:
-    """Loads and caches the spaCy model. Returns None if unavailable."""
+    """
+    Loads and caches the configured spaCy profile.
+
+    Returns None if spaCy or the model is unavailable, or if the rule-based
+    backend is selected.
+    """
     global _nlp
-    if not SPACY_AVAILABLE:
+    if not SPACY_AVAILABLE or get_backend() != "spacy":
         return None
     if _nlp is None:
+        model = get_profile()["model"]
         try:
-            logger.debug("Loading spaCy model 'en_core_web_sm'...")
-            _nlp = spacy.load("en_core_web_sm")
-            logger.info("Successfully loaded spaCy NER model.")
+            logger.debug(f"Loading spaCy model '{model}'...")
+            start = time.perf_counter()
+            _nlp = load_profile()
+            logger.info(
+                f"Successfully loaded spaCy NER model '{model}' with "
+                f"{', '.join(_nlp.pipe_names)} in {time.perf_counter() - start:.2f}s."
+            )
+        except ImportError:
+            logger.warning("spaCy is not installed, NER is disabled.")
+            return None
         except IOError:
             logger.warning(
-                "spaCy is installed, but model 'en_core_web_sm' not found. "
-                "Run 'python -m spacy download en_core_web_sm' to install it."
+                f"spaCy is installed, but model '{model}' not found. "
+                f"Run 'python -m spacy download {model}' to install it."
             )
             return None
     return _nlp
 
 
-def extract_entities(text: str) -> List[Tuple[str, str]]:
+def _model_signature(nlp: Language) -> str:
+    """Identifies the loaded model by name and version, e.g. 'en_core_web_sm@3.8.0'."""
+    meta = nlp.meta or {}
+    name = f"{meta.get('lang', 'xx')}_{meta.get('name', MODEL_NAME)}"
+    return f"{name}@{meta.get('version', 'unknown')}"
+
+
+def engine_signature() -> str:
     """
-    Extracts person and organization entities from a string using spaCy.
+    Identifies what extract_entities currently runs: the spaCy model
+    signature, the rules version, or "no-ner" when nothing is available.
+    """
+    if get_backend() == "rules":
+        return f"rules@{rule_ner.RULES_VERSION}"
+    nlp = _get_nlp_model()
+    return _model_signature(nlp) if nlp else "no-ner"
 
-    Args:
-        text: The text to process.
+
+def _cache_key(text: str, signature: str) -> str:
+    """Builds the memo key from the model signature and a hash of the text."""
+    digest = hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).hexdigest()
+    return f"{signature}:{digest}"
+
+
+def _remember(key: str, entities: List[Tuple[str, str]]) -> None:
+    """Adds a result to the in-process memo, evicting the oldest when full."""
+    max_size = CONFIG.get("ner", {}).get("memory_cache_size", 50000)
+    if len(_memo) >= max_size:
+        _memo.pop(next(iter(_memo)))
+    _memo[key] = entities
+
+
+def get_cache_stats() -> Dict[str, float]:
+    """
+    Reports how NER lookups were served in this process.
 
     Returns:
-        A list of tuples, where each tuple is (entity_text, entity_label).
-        Returns an empty list if spaCy is not available or fails.
+        A dict with "memory_hits", "disk_hits", "misses", "lookups" and
+        "hit_rate" (the fraction of lookups that did not run spaCy).
     """
-    nlp = _get_nlp_model()
-    if not nlp:
-        return []
+    lookups = sum(_stats.values())
+    hits = _stats["memory_hits"] + _stats["disk_hits"]
+    return {
+        **_stats,
+        "lookups": lookups,
+        "hit_rate": (hits / lookups) if lookups else 0.0,
+    }
+
 
-    doc = nlp(text)
+def _keep_entities(ents: Iterable[Span]) -> List[Tuple[str, str]]:
+    """Keeps the PERSON and ORG entities of a processed document."""
     entities = []
-    for ent in doc.ents:
+    for ent in ents:
         if ent.label_ in ["PERSON", "ORG"]:
             entities.append((ent.text.strip(), ent.label_))
             logger.debug(f"NER found entity: '{ent.text}' (Label: {ent.label_})")
     return entities
+
+
+def _window_end(text: str, low: int, high: int) -> int:
+    """Ends a window in [low, high] after a line, else a sentence, else a word."""
+    for separator in ("\n", ". ", " "):
+        index = text.rfind(separator, low, high)
+        if index != -1:
+            return index + len(separator)
+    return high
+
+
+def split_windows(text: str, size: int, overlap: int) -> Iterator[Tuple[int, int, int]]:
+    """
+    Cuts a text into windows of at most `size` characters for NER.
+
+    Windows end on a line, sentence or word boundary in their second half,
+    and the next one starts up to `overlap` characters earlier, at a line
+    start if there is one, so an entity cut by one window is whole in the
+    next.
+
+    Args:
+        text: The text to cut.
+        size: The maximum window length.
+        overlap: How far windows overlap, less than half of `size`.
+
+    Returns:
+        An iterator of (start, end, owned_end): the window is
+        `text[start:end]`, and entities starting before `owned_end` are
+        taken from it, the rest from the next window.
+    """
+    overlap = min(overlap, size // 2 - 1)
+    start = 0
+    while start + size < len(text):
+        end = _window_end(text, start + size // 2, start + size)
+        next_start = end - overlap
+        line_start = text.find("\n", next_start, end)
+        if line_start != -1:
+            next_start = line_start + 1
+        yield start, end, next_start
+        start = next_start
+    yield start, len(text), len(text)
+
+
+def _run_windowed(nlp: Language, text: str, size: int) -> List[Tuple[str, str]]:
+    """
+    Runs NER over a text too long for one call, one window at a time.
+
+    Only one window is held in the pipeline at once, so memory stays bounded
+    however long the text is.
+    """
+    overlap = CONFIG.get("ner", {}).get("window_overlap", 200)
+    windows = list(split_windows(text, size, overlap))
+    logger.info(
+        f"Running NER over a {len(text)}-character text in {len(windows)} windows"
+    )
+    docs = nlp.pipe((text[start:end] for start, end, _ in windows), batch_size=1)
+    entities = []
+    for (start, _, owned_end), doc in zip(windows, docs):
+        entities.extend(
+            _keep_entities(
+                ent for ent in doc.ents if start + ent.start_char < owned_end
+            )
+        )
+    return entities
+
+
+def _run_model(nlp: Language, texts: List[str]) -> List[List[Tuple[str, str]]]:
+    """
+    Runs the spaCy pipeline over a batch of texts with `nlp.pipe`.
+
+    Batches of at least `ner.n_process_min_texts` texts are spread over
+    `ner.n_process` processes, except inside daemonic scan workers, which
+    cannot start processes of their own. Texts longer than
+    `ner.max_chars_per_call` (or the model's `max_length`) are run in
+    windows of that size, see `split_windows`.
+    """
+    settings = CONFIG.get("ner", {})
+    budget = min(settings.get("max_chars_per_call", 100_000), nlp.max_length)
+    results: Dict[int, List[Tuple[str, str]]] = {
+        i: _run_windowed(nlp, text, budget)
+        for i, text in enumerate(texts)
+        if len(text) > budget
+    }
+    short = [(i, text) for i, text in enumerate(texts) if i not in results]
+    if len(short) == 1:
+        i, text = short[0]
+        results[i] = _keep_entities(nlp(text).ents)
+    elif short:
+        n_process = settings.get("n_process", 1)
+        if (
+            len(short) < settings.get("n_process_min_texts", 1000)
+            or multiprocessing.current_process().daemon
+        ):
+            n_process = 1
+        docs = nlp.pipe(
+            [text for _, text in short],
+            batch_size=settings.get("batch_size", 256),
+            n_process=n_process,
+        )
+        for (i, _), doc in zip(short, docs):
+            results[i] = _keep_entities(doc.ents)
+    return [results[i] for i in range(len(texts))]
+
+
+def extract_entities_batch(texts: Sequence[str]) -> List[List[Tuple[str, str]]]:
+    """
+    Extracts person and organization entities from many strings at once.
+
+    Texts already seen are served from the in-process memo or the "ner"
+    cache namespace; the rest are deduplicated and run through spaCy in a
+    single `nlp.pipe` call, which avoids the per-call overhead of running
+    the pipeline text by text.
+
+    Args:
+        texts: The texts to process.
+
+    Returns:
+        One list of (entity_text, entity_label) tuples per text, in order.
+        Lists are empty if spaCy is not available or fails.
+    """
+    if get_backend() == "rules":
+        # Cheaper to rerun than to look up
+        return [rule_ner.extract_entities(text) for text in texts]
+    nlp = _get_nlp_model()
+    if not nlp:
+        return [[] for _ in texts]
+
+    signature = _model_signature(nlp)
+    use_disk = CONFIG.get("ner", {}).get("persistent_cache", True)
+    keys = [_cache_key(text, signature) for text in texts]
+    found: Dict[str, List[Tuple[str, str]]] = {}
+    misses: Dict[str, str] = {}  # key -> text, in first-seen order
+    for key, text in zip(keys, texts):
+        if key in found or key in misses:
+            _stats["memory_hits"] += 1
+            continue
+        if key in _memo:
+            _stats["memory_hits"] += 1
+            found[key] = _memo[key]
+            continue
+        if use_disk:
+            cached = get_cached_data(
+                NER_CACHE_NAMESPACE, key, ttl_seconds=NER_CACHE_TTL_SECONDS
+            )
+            if cached is not None:
+                _stats["disk_hits"] += 1
+                found[key] = [(entity, label) for entity, label in cached["entities"]]
+                _remember(key, found[key])
+                continue
+        _stats["misses"] += 1
+        misses[key] = text
+
+    if misses:
+        logger.debug(f"Running NER over a batch of {len(misses)} texts")
+        try:
+            batch = _run_model(nlp, list(misses.values()))
+        except (ValueError, MemoryError) as e:
+            # One bad input must not end the run; failures are not cached
+            logger.warning(f"NER failed on a batch of {len(misses)} texts: {e}")
+            found.update((key, []) for key in misses)
+            misses = {}
+            batch = []
+        for key, entities in zip(misses, batch):
+            found[key] = entities
+            _remember(key, entities)
+            if use_disk:
+                set_cached_data(NER_CACHE_NAMESPACE, key, {"entities": entities})
+    return [list(found[key]) for key in keys]
+
+
+def extract_entities(text: str) -> List[Tuple[str, str]]:
+    """
+    Extracts person and organization entities from a string using spaCy.
+
+    Results are memoized in-process and on disk (the "ner" cache namespace),
+    keyed by a hash of the text plus the model name and version. Callers with
+    many strings should use `extract_entities_batch`.
+
+    Args:
+        text: The text to process.
+
+    Returns:
+        A list of tuples, where each tuple is (entity_text, entity_label).
+        Returns an empty list if spaCy is not available or fails.
+    """
+    return extract_entities_batch([text])[0]
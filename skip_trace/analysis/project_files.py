@@ -0,0 +1,383 @@
+# skip_trace/analysis/project_files.py
+from __future__ import annotations
+
+import ast
+import configparser
+import datetime
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Use tomllib if available (Python 3.11+), otherwise fall back to tomli
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # type: ignore
+
+from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
+from ..utils.validation import is_valid_email
+from .evidence import generate_evidence_id
+
+logger = logging.getLogger(__name__)
+
+# Build configuration files that declare authors, maintainers and URLs
+PROJECT_FILENAMES = {"pyproject.toml", "setup.cfg", "setup.py"}
+
+# Declared fields are as trustworthy as core metadata, which is built from them
+NAME_CONFIDENCE = 0.35
+EMAIL_CONFIDENCE = 0.45
+URL_CONFIDENCE = 0.30
+
+# "Name <user@example.com>", as used by Poetry and setup.py author strings
+NAME_EMAIL_RE = re.compile(r"^\s*(.*?)\s*<([^>]+)>\s*$")
+
+# setup() keywords that hold a single URL, and the label to report them under
+SETUP_URL_KEYWORDS = {"url": "Homepage", "download_url": "Download"}
+# [tool.poetry] keys that hold a single URL
+POETRY_URL_KEYS = {
+    "homepage": "Homepage",
+    "repository": "Repository",
+    "documentation": "Documentation",
+}
+
+# (name, email) with either part possibly missing
+Contact = Tuple[Optional[str], Optional[str]]
+
+
+@dataclass
+class ProjectInfo:
+    """The ownership fields declared in one build configuration file."""
+
+    authors: List[Contact] = field(default_factory=list)
+    maintainers: List[Contact] = field(default_factory=list)
+    urls: List[Tuple[str, str]] = field(default_factory=list)
+
+
+def is_project_file(relative_path: str) -> bool:
+    """
+    Returns True for the pyproject.toml, setup.cfg and setup.py files at the
+    distribution root; copies deeper in the tree (test fixtures, vendored
+    projects) do not describe this package.
+    """
+    return "/" not in relative_path and relative_path in PROJECT_FILENAMES
+
+
+def _split_contact(text: str) -> Contact:
+    """Splits "Name <email>", a bare email or a bare name."""
+    text = text.strip()
+    if match := NAME_EMAIL_RE.match(text):
+        return match.group(1) or None, match.group(2).strip() or None
+    if "@" in text:
+        return None, text
+    return text or None, None
+
+
+def _pair_contacts(names: Optional[str], emails: Optional[str]) -> List[Contact]:
+    """
+    Pairs comma-separated `author` and `author_email` style values.
+
+    Names and emails are matched by position when both lists have the same
+    length; otherwise each is reported on its own.
+    """
+    name_list = [n.strip() for n in (names or "").split(",") if n.strip()]
+    email_list = [e.strip() for e in (emails or "").split(",") if e.strip()]
+    # "Name <email>" in an email field carries its own name
+    contacts = [_split_contact(e) for e in email_list]
+    if len(name_list) == len(contacts):
+        return [
+            (c_name or name, email)
+            for name, (c_name, email) in zip(name_list, contacts)
+        ]
+    return [(name, None) for name in name_list] + contacts
+
+
+def _table(data: Any, key: str) -> Dict[str, Any]:
+    """Returns `data[key]` if both are TOML tables, else an empty one."""
+    value = data.get(key) if isinstance(data, dict) else None
+    return value if isinstance(value, dict) else {}
+
+
+def _array(data: Dict[str, Any], key: str) -> List[Any]:
+    """Returns `data[key]` if it is a TOML array, else an empty one."""
+    value = data.get(key)
+    return value if isinstance(value, list) else []
+
+
+def parse_pyproject(content: str) -> ProjectInfo:
+    """
+    Reads PEP 621 `[project]` and Poetry `[tool.poetry]` ownership fields.
+
+    Fields of an unexpected type (`tool = "x"`, `authors = "Jane"`) are
+    ignored rather than rejected.
+
+    Raises:
+        tomllib.TOMLDecodeError: If the file is not valid TOML.
+    """
+    data = tomllib.loads(content)
+    info = ProjectInfo()
+    project = _table(data, "project")
+    if project:
+        for key, target in (
+            ("authors", info.authors),
+            ("maintainers", info.maintainers),
+        ):
+            for entry in _array(project, key):
+                if isinstance(entry, dict):
+                    name, email = entry.get("name"), entry.get("email")
+                    target.append(
+                        (
+                            name if isinstance(name, str) else None,
+                            email if isinstance(email, str) else None,
+                        )
+                    )
+        info.urls.extend(
+            (label, url)
+            for label, url in _table(project, "urls").items()
+            if isinstance(url, str)
+        )
+
+    poetry = _table(_table(data, "tool"), "poetry")
+    if poetry:
+        for key, target in (
+            ("authors", info.authors),
+            ("maintainers", info.maintainers),
+        ):
+            for entry in _array(poetry, key):
+                if isinstance(entry, str):
+                    target.append(_split_contact(entry))
+        for key, label in POETRY_URL_KEYS.items():
+            if isinstance(url := poetry.get(key), str):
+                info.urls.append((label, url))
+        info.urls.extend(
+            (label, url)
+            for label, url in _table(poetry, "urls").items()
+            if isinstance(url, str)
+        )
+    return info
+
+
+def parse_setup_cfg(content: str) -> ProjectInfo:
+    """
+    Reads the `[metadata]` section of a setup.cfg file.
+
+    Raises:
+        configparser.Error: If the file cannot be parsed.
+    """
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read_string(content)
+    info = ProjectInfo()
+    if not parser.has_section("metadata"):
+        return info
+    metadata = parser["metadata"]
+    info.authors = _pair_contacts(metadata.get("author"), metadata.get("author_email"))
+    info.maintainers = _pair_contacts(
+        metadata.get("maintainer"), metadata.get("maintainer_email")
+    )
+    for key, label in SETUP_URL_KEYWORDS.items():
+        if url := metadata.get(key, "").strip():
+            info.urls.append((label, url))
+    for line in metadata.get("project_urls", "").splitlines():
+        label, sep, url = line.partition("=")
+        if sep and url.strip():
+            info.urls.append((label.strip(), url.strip()))
+    return info
+
+
+def _literal_strings(tree: ast.Module) -> Dict[str, str]:
+    """Collects module-level `NAME = "string"` assignments."""
+    constants: Dict[str, str] = {}
+    for node in tree.body:
+        if (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        ):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constants[target.id] = node.value.value
+    return constants
+
+
+def _resolve(node: ast.expr, constants: Dict[str, str]) -> Any:
+    """Evaluates a string, a name bound to one, or a dict of those; else None."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.Name):
+        return constants.get(node.id)
+    if isinstance(node, ast.Dict):
+        resolved = {}
+        for key, value in zip(node.keys, node.values):
+            if key is None:
+                continue
+            label, url = _resolve(key, constants), _resolve(value, constants)
+            if isinstance(label, str) and isinstance(url, str):
+                resolved[label] = url
+        return resolved
+    return None
+
+
+def _is_setup_call(node: ast.Call) -> bool:
+    """Matches `setup(...)` and `setuptools.setup(...)` calls."""
+    func = node.func
+    return (isinstance(func, ast.Name) and func.id == "setup") or (
+        isinstance(func, ast.Attribute) and func.attr == "setup"
+    )
+
+
+def parse_setup_py(content: str) -> ProjectInfo:
+    """
+    Reads literal keyword arguments of the `setup()` call in a setup.py file.
+
+    The file is parsed, never executed. Values are only taken from string
+    literals and module-level names bound to them.
+
+    Raises:
+        SyntaxError, ValueError: If the file cannot be parsed.
+    """
+    tree = ast.parse(content)
+    constants = _literal_strings(tree)
+    keywords: Dict[str, Any] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and _is_setup_call(node):
+            for keyword in node.keywords:
+                if keyword.arg:
+                    keywords[keyword.arg] = _resolve(keyword.value, constants)
+
+    info = ProjectInfo()
+
+    def text(key: str) -> Optional[str]:
+        value = keywords.get(key)
+        return value if isinstance(value, str) else None
+
+    info.authors = _pair_contacts(text("author"), text("author_email"))
+    info.maintainers = _pair_contacts(text("maintainer"), text("maintainer_email"))
+    for key, label in SETUP_URL_KEYWORDS.items():
+        if url := (text(key) or "").strip():
+            info.urls.append((label, url))
+    project_urls = keywords.get("project_urls")
+    if isinstance(project_urls, dict):
+        info.urls.extend(project_urls.items())
+    return info
+
+
+def _contact_records(
+    contact: Contact,
+    role: str,
+    locator: str,
+    filename: str,
+    now: datetime.datetime,
+) -> List[EvidenceRecord]:
+    """Creates PERSON and EMAIL evidence for one declared author or maintainer."""
+    name, email = contact
+    name = name.strip() if name else None
+    email = is_valid_email(email.strip()) if email else None
+    source = EvidenceSource.WHEEL
+    records = []
+    if name:
+        value: Dict[str, Any] = {"name": name}
+        records.append(
+            EvidenceRecord(
+                id=generate_evidence_id(
+                    source, EvidenceKind.PERSON, locator, str(value), name
+                ),
+                source=source,
+                locator=locator,
+                kind=EvidenceKind.PERSON,
+                value=value,
+                observed_at=now,
+                confidence=NAME_CONFIDENCE,
+                notes=f"Found {role} name '{name}' declared in {filename}.",
+            )
+        )
+    if email:
+        value = {"email": email}
+        slug = name or email.split("@")[0]
+        records.append(
+            EvidenceRecord(
+                id=generate_evidence_id(
+                    source, EvidenceKind.EMAIL, locator, str(value), slug
+                ),
+                source=source,
+                locator=locator,
+                kind=EvidenceKind.EMAIL,
+                value=value,
+                observed_at=now,
+                confidence=EMAIL_CONFIDENCE,
+                notes=f"Found {role} email for '{slug}' declared in {filename}.",
+            )
+        )
+    return records
+
+
+def extract_project_evidence(
+    content: str,
+    relative_path: str,
+    locator_prefix: str,
+    now: datetime.datetime,
+) -> Optional[List[EvidenceRecord]]:
+    """
+    Extracts declared authors, maintainers and URLs from a build configuration file.
+
+    Args:
+        content: The decoded text of the file.
+        relative_path: The file's path relative to the package root.
+        locator_prefix: A prefix for the evidence locator (e.g., package name/version).
+        now: The observation timestamp for new records.
+
+    Returns:
+        The evidence found, or None if the file could not be parsed or
+        declares nothing (e.g. a setup.py without a `setup()` call).
+    """
+    filename = os.path.basename(relative_path)
+    try:
+        if filename == "pyproject.toml":
+            info = parse_pyproject(content)
+        elif filename == "setup.cfg":
+            info = parse_setup_cfg(content)
+        else:
+            info = parse_setup_py(content)
+    except (
+        tomllib.TOMLDecodeError,
+        configparser.Error,
+        SyntaxError,
+        ValueError,
+    ) as e:
+        logger.debug(f"Could not parse {relative_path}, scanning it as text: {e}")
+        return None
+
+    locator = f"{locator_prefix}/{relative_path}"
+    evidence: List[EvidenceRecord] = []
+    for role, contacts in (("author", info.authors), ("maintainer", info.maintainers)):
+        for contact in contacts:
+            evidence.extend(_contact_records(contact, role, locator, filename, now))
+
+    seen_urls = set()
+    for label, url in info.urls:
+        url = url.strip()
+        if not url or (label, url) in seen_urls:
+            continue
+        seen_urls.add((label, url))
+        value = {"label": label, "url": url}
+        evidence.append(
+            EvidenceRecord(
+                id=generate_evidence_id(
+                    EvidenceSource.WHEEL,
+                    EvidenceKind.PROJECT_URL,
+                    locator,
+                    str(value),
+                    label,
+                    hint="project-file",
+                ),
+                source=EvidenceSource.WHEEL,
+                locator=locator,
+                kind=EvidenceKind.PROJECT_URL,
+                value=value,
+                observed_at=now,
+                confidence=URL_CONFIDENCE,
+                notes=f"Found project URL '{label}' declared in {filename}.",
+            )
+        )
+    logger.debug(f"Extracted {len(evidence)} evidence records from {relative_path}")
+    return evidence or None
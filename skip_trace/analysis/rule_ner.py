@@ -0,0 +1,250 @@
+# skip_trace/analysis/rule_ner.py
+from __future__ import annotations
+
+import logging
+import re
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the rules change what they report for the same text
+RULES_VERSION = 2
+
+# Last words that make a capitalized run an organization
+ORG_SUFFIXES = {
+    "ab",
+    "ag",
+    "as",
+    "association",
+    "authority",
+    "bv",
+    "co",
+    "collective",
+    "community",
+    "company",
+    "consortium",
+    "corp",
+    "corporation",
+    "developers",
+    "foundation",
+    "gmbh",
+    "group",
+    "inc",
+    "incorporated",
+    "institute",
+    "kg",
+    "lab",
+    "labs",
+    "limited",
+    "llc",
+    "llp",
+    "ltd",
+    "nv",
+    "oy",
+    "organisation",
+    "organization",
+    "pbc",
+    "plc",
+    "project",
+    "pty",
+    "sa",
+    "sarl",
+    "sas",
+    "se",
+    "society",
+    "software",
+    "srl",
+    "systems",
+    "team",
+    "technologies",
+    "ug",
+    "university",
+}
+# Words that make a run an organization wherever they appear in it
+ORG_MARKERS = {"university", "institute", "foundation", "laboratory"}
+# Abbreviated company forms, which keep their full stop
+COMPANY_FORMS = (
+    "inc",
+    "llc",
+    "ltd",
+    "gmbh",
+    "corp",
+    "co",
+    "plc",
+    "ag",
+    "sa",
+    "bv",
+    "nv",
+)
+# Lowercase particles allowed inside a name ("Guido van Rossum")
+CONNECTORS = {"van", "von", "der", "den", "de", "da", "di", "du", "la", "le", "of"}
+# Capitalized words of license boilerplate that are never part of a name
+STOP_WORDS = {
+    "all",
+    "copyright",
+    "copyrights",
+    "distributed",
+    "license",
+    "licensed",
+    "notice",
+    "permission",
+    "portions",
+    "released",
+    "reserved",
+    "rights",
+    "see",
+    "some",
+    "the",
+    "this",
+    "version",
+}
+# License acronyms, never a holder on their own ("Licensed under MIT", "GPL-3.0")
+LICENSE_ACRONYMS = {"agpl", "bsd", "epl", "gpl", "isc", "lgpl", "mit", "mpl", "psf"}
+# Words license names are made of, in front of "License" ("GNU Lesser General
+# Public License", "Python Software Foundation License")
+LICENSE_NAME_WORDS = LICENSE_ACRONYMS | {
+    "academic",
+    "affero",
+    "apache",
+    "artistic",
+    "boost",
+    "clause",
+    "commons",
+    "creative",
+    "documentation",
+    "eclipse",
+    "foundation",
+    "free",
+    "general",
+    "gnu",
+    "lesser",
+    "library",
+    "modified",
+    "mozilla",
+    "new",
+    "public",
+    "python",
+    "revised",
+    "simplified",
+    "software",
+    "zlib",
+}
+# Longest run of words still taken for a person's name
+MAX_PERSON_WORDS = 4
+
+# Noise removed before looking for names
+NOISE_RE = re.compile(
+    r"<[^>]*>|\S+@\S+|https?://\S+|www\.\S+|\(c\)|©|"
+    r"\ball rights reserved\b|\b(?:19|20)\d\d\b(?:\s*[-,]\s*(?:19|20)?\d\d\b)*",
+    re.IGNORECASE,
+)
+# A license's name ("MIT License", "Apache License, Version 2.0")
+LICENSE_RE = re.compile(
+    rf"\b(?:(?:{'|'.join(sorted(LICENSE_NAME_WORDS))})[\s-]+(?:\d[\d.]*[\s-]+)?)+"
+    r"licen[cs]e\b(?:,?\s+(?:version\s+)?v?\d[\w.]*)?",
+    re.IGNORECASE,
+)
+# Company forms set off by a comma ("Google, Inc.") stay with the name
+SUFFIX_COMMA_RE = re.compile(rf",\s*(?=(?:{'|'.join(COMPANY_FORMS)})\b)", re.IGNORECASE)
+# Separators between several holders
+SEPARATOR_RE = re.compile(r"[,;:/()\[\]\"|]|\s+and\s+|\s+by\s+", re.IGNORECASE)
+# Words, with initials ("J."), domains ("Amazon.com") and names like
+# "O'Brien" or "Jean-Luc"
+WORD_RE = re.compile(r"[^\W\d_][\w'’\-]*(?:\.\w+)*\.?|&")
+
+
+def _is_name_word(word: str) -> bool:
+    """Capitalized words, initials, acronyms and "&" can be part of a name."""
+    lowered = word.rstrip(".").lower()
+    return word == "&" or (
+        word[0].isupper()
+        and lowered not in STOP_WORDS
+        and lowered.split("-")[0] not in LICENSE_ACRONYMS
+    )
+
+
+def _runs(segment: str) -> List[List[re.Match]]:
+    """Splits a segment into runs of name words, joined by connectors."""
+    runs: List[List[re.Match]] = []
+    current: List[re.Match] = []
+    for match in WORD_RE.finditer(segment):
+        word = match.group(0)
+        if _is_name_word(word):
+            current.append(match)
+        elif word in CONNECTORS and current:
+            current.append(match)
+        else:
+            if current:
+                runs.append(current)
+            current = []
+    if current:
+        runs.append(current)
+    # Connectors only join words, they never end a name
+    trimmed = []
+    for run in runs:
+        while run and (run[-1].group(0) in CONNECTORS or run[-1].group(0) == "&"):
+            run.pop()
+        if run:
+            trimmed.append(run)
+    return trimmed
+
+
+def _label(words: List[str]) -> str:
+    """Labels a run ORG, PERSON or "" (neither)."""
+    lowered = [w.rstrip(".").lower() for w in words]
+    if lowered[-1] in ORG_SUFFIXES or ORG_MARKERS.intersection(lowered):
+        return "ORG"
+    if "&" in words:
+        return "ORG"
+    if len(words) == 1:
+        # A lone acronym ("IBM") is an organization, a lone word is too vague
+        word = words[0].rstrip(".")
+        return "ORG" if len(word) > 1 and word.isupper() else ""
+    names = [w for w in words if w not in CONNECTORS]
+    if len(names) <= MAX_PERSON_WORDS and all(
+        (len(w) == 2 and w.endswith(".")) or not w.isupper() for w in names
+    ):
+        return "PERSON"
+    return ""
+
+
+def extract_entities(text: str) -> List[Tuple[str, str]]:
+    """
+    Finds people and organizations with patterns instead of a model.
+
+    Meant for the short strings claims are made of: copyright holders and
+    "Name <email>" contacts. Emails, URLs, years, license names ("MIT
+    License") and boilerplate are removed, the rest is split on separators
+    (commas, "and", ...) and each run of capitalized words is labeled: ORG
+    when it ends in a company or organization word (Inc, LLC, GmbH,
+    Foundation, Team, ...), PERSON when it has at most MAX_PERSON_WORDS words.
+
+    Args:
+        text: The text to process.
+
+    Returns:
+        (entity_text, entity_label) tuples, like `ner.extract_entities`.
+    """
+    cleaned = LICENSE_RE.sub(" ", NOISE_RE.sub(" ", text))
+    cleaned = SUFFIX_COMMA_RE.sub(" ", cleaned)
+    entities: List[Tuple[str, str]] = []
+    for segment in SEPARATOR_RE.split(cleaned):
+        for run in _runs(segment):
+            words = [m.group(0) for m in run]
+            if "&" in words:
+                # "Alice Smith & Bob Jones" are two people, else it is a firm
+                sides = " ".join(words).split("&")
+                people = [side.split() for side in sides]
+                if all(len(p) > 1 and _label(p) == "PERSON" for p in people):
+                    entities.extend((" ".join(p), "PERSON") for p in people)
+                    continue
+            label = _label(words)
+            if label:
+                entity = segment[run[0].start() : run[-1].end()]
+                if words[-1].rstrip(".").lower() not in COMPANY_FORMS:
+                    # A sentence's full stop, not an abbreviation's
+                    entity = entity.rstrip(".")
+                entities.append((entity.strip(), label))
+    for entity, label in entities:
+        logger.debug(f"Rule NER found entity: '{entity}' (Label: {label})")
+    return entities
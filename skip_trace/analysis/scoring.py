@@ -6,8 +6,6 @@ import logging
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import tldextract
-
 from ..analysis.evidence import _parse_contact_string  # Import the parser for reuse
 from ..config import CONFIG
 from ..schemas import (
@@ -18,6 +16,7 @@ from ..schemas import (
     OwnerCandidate,
     OwnerKind,
 )
+from ..utils import domains
 
 # Words that indicate a regex grabbed junk from a license instead of a name.
 JUNK_WORDS = {
@@ -120,7 +119,7 @@ def _get_entity_from_record(record: EvidenceRecord) -> Tuple[Optional[str], Owne
         kind = OwnerKind.INDIVIDUAL
     elif record.kind == EvidenceKind.PROJECT_URL:
         url = record.value.get("url", "")
-        domain_info = tldextract.extract(url)
+        domain_info = domains.extract(url)
         if domain_info.domain and domain_info.suffix:
             name = domain_info.domain.capitalize()
             kind = OwnerKind.COMPANY
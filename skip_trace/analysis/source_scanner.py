@@ -6,12 +6,16 @@ import logging
 import os
 import re
 import string
-from typing import List
+from typing import List, Optional
 
 from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
 from ..utils.validation import is_valid_email
-from . import ner
-from .evidence import _parse_contact_string, generate_evidence_id
+from . import license_text, ner, prefilter
+from .evidence import (
+    _parse_contact_string,
+    _parse_contact_strings,
+    generate_evidence_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -85,32 +89,26 @@ TEXT_FILENAMES = {
 }
 
 
-def _is_binary_file(filepath: str, chunk_size: int = 1024) -> bool:
+def is_binary_content(filename: str, chunk: bytes) -> bool:
     """
-    Heuristically determines if a file is binary using a multi-step check.
+    Heuristically determines if file content is binary using a multi-step check.
 
     1. Checks against an allowlist of common text filenames (e.g., 'LICENSE').
     2. Checks for the presence of NULL bytes.
     3. Checks the ratio of non-printable text characters.
 
     Args:
-        filepath: The path to the file to check.
-        chunk_size: The number of bytes to read from the beginning of the file.
+        filename: The file name or path, used for the allowlist.
+        chunk: The first bytes of the file (1024 are enough).
 
     Returns:
-        True if the file is likely binary, False otherwise.
+        True if the content is likely binary, False otherwise.
     """
     # 1. Check filename allowlist first.
-    basename = os.path.basename(filepath).lower()
+    basename = os.path.basename(filename).lower()
     if basename in TEXT_FILENAMES:
         return False
 
-    try:
-        with open(filepath, "rb") as f:
-            chunk = f.read(chunk_size)
-    except IOError:
-        return True  # Cannot read, so skip it.
-
     if not chunk:
         return False  # Empty file is not binary.
 
@@ -128,6 +126,32 @@ def _is_binary_file(filepath: str, chunk_size: int = 1024) -> bool:
     return ratio > 0.3
 
 
+def decode_text(data: bytes) -> str:
+    """Decodes file bytes the way text-mode open() with errors='ignore' would."""
+    text = data.decode("utf-8", errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def copyright_candidates(
+    content: str, triggers: Optional[prefilter.Triggers] = None
+) -> List[str]:
+    """
+    Returns the holder text of every copyright notice, as handed to NER.
+
+    License boilerplate is cut out of each text, and texts that are all
+    boilerplate (the "copyright notice" of a license body) are left out.
+
+    Args:
+        content: The decoded text of a file.
+        triggers: The file's prefilter triggers, if already known.
+    """
+    if triggers is not None and "copyright" not in triggers:
+        return []
+    return license_text.strip_boilerplate(
+        [m.group(1).strip().rstrip(",.") for m in COPYRIGHT_RE.finditer(content)]
+    )
+
+
 def _process_authors_file(
     content: str, locator: str, now: datetime.datetime
 ) -> List[EvidenceRecord]:
@@ -135,11 +159,8 @@ def _process_authors_file(
     evidence_list = []
     logger.debug(f"Processing AUTHORS file at: {locator}")
     lines = [line.strip() for line in content.splitlines()]
-    for line in lines:
-        if not line or line.startswith("#"):
-            continue
-
-        parsed = _parse_contact_string(line)
+    lines = [line for line in lines if line and not line.startswith("#")]
+    for line, parsed in zip(lines, _parse_contact_strings(lines)):
         if not parsed.get("name") and not parsed.get("email"):
             continue
 
@@ -227,6 +248,177 @@ skip_extensions = {
 }
 
 
+def scan_file_content(
+    content: str,
+    relative_path: str,
+    locator_prefix: str,
+    evidence_list: List[EvidenceRecord],
+    now: datetime.datetime,
+    triggers: Optional[prefilter.Triggers] = None,
+    copyright_texts: Optional[List[str]] = None,
+) -> None:
+    """
+    Scans the text of one file for ownership evidence.
+
+    Records are appended to `evidence_list`, which is also used to skip
+    copyright holders and contact emails already found in earlier files.
+    Extractors whose trigger keyword does not occur in the file are skipped.
+
+    Args:
+        content: The decoded text of the file.
+        relative_path: The file's path relative to the package root.
+        locator_prefix: A prefix for the evidence locator (e.g., package name/version).
+        evidence_list: The evidence gathered so far for this package.
+        now: The observation timestamp for new records.
+        triggers: The extractors to run, from `prefilter.find_triggers`
+            over the raw bytes; computed from `content` when omitted.
+        copyright_texts: The file's `copyright_candidates`, if the caller
+            already extracted them (e.g. to batch NER over many files).
+    """
+    locator = f"{locator_prefix}/{relative_path}"
+
+    # 1. Special handling for AUTHORS files
+    filename = os.path.basename(relative_path)
+    if filename.lower().startswith("authors") or filename.lower().startswith(
+        "contributors"
+    ):
+        evidence_list.extend(_process_authors_file(content, locator, now))
+        return  # Don't process this file further for generic matches
+
+    if triggers is None:
+        triggers = prefilter.find_triggers(content)
+    if not triggers:
+        return
+
+    # Use NER for copyright lines, all of the file's in one batch
+    if copyright_texts is None:
+        copyright_texts = copyright_candidates(content, triggers)
+    batch = ner.extract_entities_batch(copyright_texts)
+    for copyright_text, entities in zip(copyright_texts, batch):
+        if entities:
+            for entity_name, entity_label in entities:
+                if entity_name.lower() not in JUNK_WORDS:
+                    value: dict[str, str | None] = {
+                        "holder": entity_name,
+                        "file": relative_path,
+                    }
+                    notes = f"Found copyright holder '{entity_name}' via NER ({entity_label})."
+                    record = EvidenceRecord(
+                        id=generate_evidence_id(
+                            EvidenceSource.WHEEL,
+                            EvidenceKind.COPYRIGHT,
+                            locator,
+                            str(value),
+                            entity_name,
+                        ),
+                        source=EvidenceSource.WHEEL,
+                        locator=locator,
+                        kind=EvidenceKind.COPYRIGHT,
+                        value=value,
+                        observed_at=now,
+                        confidence=0.40,  # Higher confidence for NER
+                        notes=notes,
+                    )
+                    already_in = False
+                    for already in evidence_list:
+                        if already.notes == notes:
+                            already_in = True
+                    if not already_in:
+                        evidence_list.append(record)
+        # else:
+        #     # --- Stricter filtering for the regex fallback ---
+        #     # 1. Reject if it's too long to be a name.
+        #     if len(copyright_text) > 50: continue
+        #     # 2. Reject if it contains common license garbage words.
+        #     if any(word in copyright_text.lower() for word in JUNK_WORDS): continue
+        #
+        #     value = {"holder": copyright_text, "file": relative_path}
+        #     record = EvidenceRecord(
+        #         id=generate_evidence_id(EvidenceSource.WHEEL, EvidenceKind.COPYRIGHT, locator, str(value),
+        #                                 copyright_text),
+        #         source=EvidenceSource.WHEEL, locator=locator, kind=EvidenceKind.COPYRIGHT,
+        #         value=value, observed_at=now, confidence=0.25,
+        #         notes=f"Found copyright notice for '{copyright_text}' in file (regex fallback)."
+        #     )
+        #     evidence_list.append(record)else:
+        #     # --- Stricter filtering for the regex fallback ---
+        #     # 1. Reject if it's too long to be a name.
+        #     if len(copyright_text) > 50: continue
+        #     # 2. Reject if it contains common license garbage words.
+        #     if any(word in copyright_text.lower() for word in JUNK_WORDS): continue
+        #
+        #     value = {"holder": copyright_text, "file": relative_path}
+        #     record = EvidenceRecord(
+        #         id=generate_evidence_id(EvidenceSource.WHEEL, EvidenceKind.COPYRIGHT, locator, str(value),
+        #                                 copyright_text),
+        #         source=EvidenceSource.WHEEL, locator=locator, kind=EvidenceKind.COPYRIGHT,
+        #         value=value, observed_at=now, confidence=0.25,
+        #         notes=f"Found copyright notice for '{copyright_text}' in file (regex fallback)."
+        #     )
+        #     evidence_list.append(record)
+
+    # 3. Scan for __author__ tags in Python files
+    if filename.endswith(".py") and "author" in triggers:
+        for match in AUTHOR_RE.finditer(content):
+            author_str = match.group(1).strip()
+            parsed = _parse_contact_string(author_str)
+            if not parsed.get("name") and not parsed.get("email"):
+                continue
+
+            value = {"name": parsed["name"], "email": parsed["email"]}
+            name_for_slug = parsed["name"] or parsed["email"] or "unknown"
+            record = EvidenceRecord(
+                id=generate_evidence_id(
+                    EvidenceSource.WHEEL,
+                    EvidenceKind.AUTHOR_TAG,
+                    locator,
+                    str(value),
+                    name_for_slug,
+                ),
+                source=EvidenceSource.WHEEL,
+                locator=locator,
+                kind=EvidenceKind.AUTHOR_TAG,
+                value=value,
+                observed_at=now,
+                confidence=0.20,
+                notes=f"Found __author__ tag for '{author_str}' in file.",
+            )
+            evidence_list.append(record)
+
+    # 4. Scan for any standalone email address (lower confidence)
+    # First, find candidates with regex, then validate them properly.
+    email_matches = (
+        prefilter.finditer(EMAIL_RE, content, "@") if "email" in triggers else iter(())
+    )
+    for match in email_matches:
+        potential_email = match.group(0)
+        if valid_email := is_valid_email(potential_email):
+            value = {"name": None, "email": valid_email}
+            notes = f"Found validated contact email '{valid_email}' in file."
+            record = EvidenceRecord(
+                id=generate_evidence_id(
+                    EvidenceSource.WHEEL,
+                    EvidenceKind.CONTACT,
+                    locator,
+                    str(value),
+                    valid_email,
+                ),
+                source=EvidenceSource.WHEEL,
+                locator=locator,
+                kind=EvidenceKind.CONTACT,
+                value=value,
+                observed_at=now,
+                confidence=0.15,  # Slightly higher confidence now that it's validated
+                notes=notes,
+            )
+            already_in = False
+            for already in evidence_list:
+                if already.notes == notes:
+                    already_in = True
+            if not already_in:
+                evidence_list.append(record)
+
+
 def scan_directory(directory_path: str, locator_prefix: str) -> List[EvidenceRecord]:
     """
     Scans a directory of files for ownership evidence.
@@ -238,177 +430,7 @@ def scan_directory(directory_path: str, locator_prefix: str) -> List[EvidenceRec
     Returns:
         A list of EvidenceRecord objects found in the files.
     """
-    evidence_list: List[EvidenceRecord] = []
-    now = datetime.datetime.now(datetime.timezone.utc)
-
-    file_count = 0
-    for root, dirs, files in os.walk(directory_path):
-        # Modify dirs in-place to prune the search
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
+    # Local import, file_scanner builds on this module
+    from .file_scanner import scan_directory as scan_all
 
-        for filename in files:
-            file_path = os.path.join(root, filename)
-            relative_path = os.path.relpath(file_path, directory_path)
-            file_count += 1
-
-            _, extension = os.path.splitext(filename)
-            if extension.lower() in skip_extensions:
-                continue
-
-            if _is_binary_file(file_path):
-                logger.debug(
-                    f"Skipping binary file detected by content: {relative_path}"
-                )
-                continue
-
-            logger.debug(f"Scanning file: {relative_path}")
-
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-
-                locator = f"{locator_prefix}/{relative_path}"
-
-                # 1. Special handling for AUTHORS files
-                if filename.lower().startswith(
-                    "authors"
-                ) or filename.lower().startswith("contributors"):
-                    evidence_list.extend(_process_authors_file(content, locator, now))
-                    continue  # Don't process this file further for generic matches
-
-                # Use NER for copyright lines
-                for match in COPYRIGHT_RE.finditer(content):
-                    copyright_text = match.group(1).strip().rstrip(",.")
-
-                    # Try NER first
-                    entities = ner.extract_entities(copyright_text)
-                    if entities:
-                        for entity_name, entity_label in entities:
-                            if entity_name.lower() not in JUNK_WORDS:
-                                value: dict[str, str | None] = {
-                                    "holder": entity_name,
-                                    "file": relative_path,
-                                }
-                                notes = f"Found copyright holder '{entity_name}' via NER ({entity_label})."
-                                record = EvidenceRecord(
-                                    id=generate_evidence_id(
-                                        EvidenceSource.WHEEL,
-                                        EvidenceKind.COPYRIGHT,
-                                        locator,
-                                        str(value),
-                                        entity_name,
-                                    ),
-                                    source=EvidenceSource.WHEEL,
-                                    locator=locator,
-                                    kind=EvidenceKind.COPYRIGHT,
-                                    value=value,
-                                    observed_at=now,
-                                    confidence=0.40,  # Higher confidence for NER
-                                    notes=notes,
-                                )
-                                already_in = False
-                                for already in evidence_list:
-                                    if already.notes == notes:
-                                        already_in = True
-                                if not already_in:
-                                    evidence_list.append(record)
-                    # else:
-                    #     # --- Stricter filtering for the regex fallback ---
-                    #     # 1. Reject if it's too long to be a name.
-                    #     if len(copyright_text) > 50: continue
-                    #     # 2. Reject if it contains common license garbage words.
-                    #     if any(word in copyright_text.lower() for word in JUNK_WORDS): continue
-                    #
-                    #     value = {"holder": copyright_text, "file": relative_path}
-                    #     record = EvidenceRecord(
-                    #         id=generate_evidence_id(EvidenceSource.WHEEL, EvidenceKind.COPYRIGHT, locator, str(value),
-                    #                                 copyright_text),
-                    #         source=EvidenceSource.WHEEL, locator=locator, kind=EvidenceKind.COPYRIGHT,
-                    #         value=value, observed_at=now, confidence=0.25,
-                    #         notes=f"Found copyright notice for '{copyright_text}' in file (regex fallback)."
-                    #     )
-                    #     evidence_list.append(record)else:
-                    #     # --- Stricter filtering for the regex fallback ---
-                    #     # 1. Reject if it's too long to be a name.
-                    #     if len(copyright_text) > 50: continue
-                    #     # 2. Reject if it contains common license garbage words.
-                    #     if any(word in copyright_text.lower() for word in JUNK_WORDS): continue
-                    #
-                    #     value = {"holder": copyright_text, "file": relative_path}
-                    #     record = EvidenceRecord(
-                    #         id=generate_evidence_id(EvidenceSource.WHEEL, EvidenceKind.COPYRIGHT, locator, str(value),
-                    #                                 copyright_text),
-                    #         source=EvidenceSource.WHEEL, locator=locator, kind=EvidenceKind.COPYRIGHT,
-                    #         value=value, observed_at=now, confidence=0.25,
-                    #         notes=f"Found copyright notice for '{copyright_text}' in file (regex fallback)."
-                    #     )
-                    #     evidence_list.append(record)
-
-                # 3. Scan for __author__ tags in Python files
-                if filename.endswith(".py"):
-                    for match in AUTHOR_RE.finditer(content):
-                        author_str = match.group(1).strip()
-                        parsed = _parse_contact_string(author_str)
-                        if not parsed.get("name") and not parsed.get("email"):
-                            continue
-
-                        value = {"name": parsed["name"], "email": parsed["email"]}
-                        name_for_slug = parsed["name"] or parsed["email"] or "unknown"
-                        record = EvidenceRecord(
-                            id=generate_evidence_id(
-                                EvidenceSource.WHEEL,
-                                EvidenceKind.AUTHOR_TAG,
-                                locator,
-                                str(value),
-                                name_for_slug,
-                            ),
-                            source=EvidenceSource.WHEEL,
-                            locator=locator,
-                            kind=EvidenceKind.AUTHOR_TAG,
-                            value=value,
-                            observed_at=now,
-                            confidence=0.20,
-                            notes=f"Found __author__ tag for '{author_str}' in file.",
-                        )
-                        evidence_list.append(record)
-
-                # 4. Scan for any standalone email address (lower confidence)
-                # First, find candidates with regex, then validate them properly.
-                for match in EMAIL_RE.finditer(content):
-                    potential_email = match.group(0)
-                    if valid_email := is_valid_email(potential_email):
-                        value = {"name": None, "email": valid_email}
-                        notes = (
-                            f"Found validated contact email '{valid_email}' in file."
-                        )
-                        record = EvidenceRecord(
-                            id=generate_evidence_id(
-                                EvidenceSource.WHEEL,
-                                EvidenceKind.CONTACT,
-                                locator,
-                                str(value),
-                                valid_email,
-                            ),
-                            source=EvidenceSource.WHEEL,
-                            locator=locator,
-                            kind=EvidenceKind.CONTACT,
-                            value=value,
-                            observed_at=now,
-                            confidence=0.15,  # Slightly higher confidence now that it's validated
-                            notes=notes,
-                        )
-                        already_in = False
-                        for already in evidence_list:
-                            if already.notes == notes:
-                                already_in = True
-                        if not already_in:
-                            evidence_list.append(record)
-
-            except (IOError, UnicodeDecodeError) as e:
-                logger.debug(f"Could not read or process file {file_path}: {e}")
-                continue
-
-    logger.info(
-        f"Scanned {file_count} files in directory, found {len(evidence_list)} potential evidence records."
-    )
-    return evidence_list
+    return scan_all(directory_path, locator_prefix, urls=False)
@@ -14,9 +14,6 @@ from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
 from ..utils.http_client import normalize_url
 from .evidence import generate_evidence_id
 
-# Import directory scanning utilities from the existing source_scanner
-from .source_scanner import _is_binary_file, skip_dirs, skip_extensions
-
 logger = logging.getLogger(__name__)
 
 # --- Start of new context-aware extraction logic ---
@@ -164,6 +161,16 @@ def scan_text_for_urls(
     return evidence_list
 
 
+def file_type_for(filename: str) -> str:
+    """Maps a filename to the content type used to pick URL extractors."""
+    extension = os.path.splitext(filename.lower())[1].lstrip(".")
+    if extension in ("html", "htm"):
+        return "html"
+    if extension in ("md", "rst"):
+        return extension
+    return "txt"
+
+
 def scan_directory_for_urls(
     directory_path: str, locator_prefix: str
 ) -> List[EvidenceRecord]:
@@ -177,55 +184,7 @@ def scan_directory_for_urls(
     Returns:
         A list of EvidenceRecord objects found in the files.
     """
-    evidence_list: List[EvidenceRecord] = []
-    file_count = 0
-
-    for root, dirs, files in os.walk(directory_path):
-        # Prune the search by removing directories to skip
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
-
-        for filename in files:
-            file_path = os.path.join(root, filename)
-            relative_path = os.path.relpath(file_path, directory_path)
-            file_count += 1
-
-            _, extension = os.path.splitext(filename.lower())
-            extension = extension.lstrip(".")
-
-            if extension in skip_extensions or _is_binary_file(file_path):
-                continue
-
-            # still don't want to scan binary files!
-            if _is_binary_file(file_path):
-                continue
-
-            file_type = "txt"
-            if extension in ("html", "htm"):
-                file_type = "html"
-            elif extension == "md":
-                file_type = "md"
-            elif extension == "rst":
-                file_type = "rst"
-
-            logger.debug(
-                f"Scanning for URLs in file: {relative_path} (type: {file_type})"
-            )
-
-            try:
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-
-                locator = f"{locator_prefix}/{relative_path}"
-                url_evidence = scan_text_for_urls(
-                    content, locator, EvidenceSource.WHEEL, file_type=file_type
-                )
-                evidence_list.extend(url_evidence)
-
-            except (IOError, UnicodeDecodeError) as e:
-                logger.debug(f"Could not read or process file {file_path}: {e}")
-                continue
-
-    logger.info(
-        f"Scanned {file_count} files for URLs, found {len(evidence_list)} records."
-    )
-    return evidence_list
+    # Local import, file_scanner builds on this module
+    from .file_scanner import scan_directory as scan_all
+
+    return scan_all(directory_path, locator_prefix, claims=False)
@@ -0,0 +1,158 @@
+# skip_trace/analysis/vendored.py
+from __future__ import annotations
+
+import logging
+import posixpath
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..config import CONFIG
+from ..exceptions import ConfigurationError
+from ..schemas import EvidenceRecord
+
+logger = logging.getLogger(__name__)
+
+# Directory names that by convention hold copies of other projects
+VENDOR_DIR_NAMES = {
+    "_vendor",
+    "vendor",
+    "vendored",
+    "_vendored",
+    "third_party",
+    "thirdparty",
+    "3rdparty",
+    "extern",
+    "_extern",
+}
+# Manifests listing the projects vendored into the directory they sit in
+VENDOR_MANIFESTS = {"vendor.txt", "vendored.txt"}
+
+# Distinctive files of libraries that are often vendored, by path suffix. A
+# match below another package marks the matching module as a vendored copy.
+KNOWN_VENDORED_FILES = {
+    "six.py": "six",
+    "typing_extensions.py": "typing_extensions",
+    "attr/_make.py": "attrs",
+    "cachecontrol/controller.py": "cachecontrol",
+    "certifi/cacert.pem": "certifi",
+    "chardet/universaldetector.py": "chardet",
+    "colorama/ansitowin32.py": "colorama",
+    "dateutil/relativedelta.py": "python-dateutil",
+    "distlib/locators.py": "distlib",
+    "idna/idnadata.py": "idna",
+    "importlib_metadata/_meta.py": "importlib_metadata",
+    "more_itertools/more.py": "more_itertools",
+    "msgpack/fallback.py": "msgpack",
+    "packaging/specifiers.py": "packaging",
+    "platformdirs/api.py": "platformdirs",
+    "pygments/lexer.py": "pygments",
+    "pyparsing/core.py": "pyparsing",
+    "requests/sessions.py": "requests",
+    "resolvelib/providers.py": "resolvelib",
+    "rich/console.py": "rich",
+    "tomli/_parser.py": "tomli",
+    "truststore/_api.py": "truststore",
+    "urllib3/connectionpool.py": "urllib3",
+}
+
+# What to do with vendored files: leave them out, scan them and tag their
+# evidence, or scan them like the package's own code
+VENDORED_MODES = ("skip", "tag", "scan")
+# Tagged evidence describes another project, so it counts for much less
+VENDORED_CONFIDENCE_FACTOR = 0.25
+# Prefix of the linkage entry that marks evidence from vendored code
+VENDORED_LINKAGE_PREFIX = "vendored:"
+
+
+def vendored_mode() -> str:
+    """
+    Returns the configured handling of vendored files, `scan.vendored`.
+
+    Raises:
+        ConfigurationError: If the setting is not one of VENDORED_MODES.
+    """
+    mode = CONFIG.get("scan", {}).get("vendored", "skip")
+    if mode not in VENDORED_MODES:
+        raise ConfigurationError(
+            f"scan.vendored must be one of {', '.join(VENDORED_MODES)}, not {mode!r}"
+        )
+    return mode
+
+
+def _fingerprint_root(relative_path: str) -> Optional[Tuple[str, str]]:
+    """Returns (module root, project) for a known library file nested in a package."""
+    for suffix, project in KNOWN_VENDORED_FILES.items():
+        if relative_path.endswith("/" + suffix):
+            parent = relative_path[: -len(suffix) - 1]
+            # The project itself, possibly in a src layout, is not vendored
+            if parent not in ("", "src"):
+                return f"{parent}/{suffix.split('/')[0]}", project
+    return None
+
+
+def find_vendored_roots(paths: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Finds the directories (or single modules) that hold vendored code.
+
+    Three signals are used: directories named like `_vendor/` or
+    `third_party/`, directories holding a `vendor.txt` manifest, and nested
+    copies of well-known libraries recognized by a distinctive file.
+
+    Args:
+        paths: POSIX paths relative to the package root.
+
+    Returns:
+        Vendored root path -> the project vendored there, when known from
+        the fingerprint index, else None (a directory of vendored projects).
+    """
+    roots: Dict[str, Optional[str]] = {}
+    for path in paths:
+        parts = path.split("/")
+        for depth, part in enumerate(parts[:-1]):
+            if part.lower() in VENDOR_DIR_NAMES:
+                roots.setdefault("/".join(parts[: depth + 1]), None)
+                break
+        parent, basename = posixpath.split(path)
+        if basename.lower() in VENDOR_MANIFESTS and parent:
+            roots.setdefault(parent, None)
+        if fingerprint := _fingerprint_root(path):
+            root, project = fingerprint
+            roots[root] = project
+    if roots:
+        logger.info(f"Found {len(roots)} vendored code roots: {sorted(roots)}")
+    return roots
+
+
+def vendored_project(
+    relative_path: str, roots: Dict[str, Optional[str]]
+) -> Optional[str]:
+    """
+    Names the vendored project a file belongs to.
+
+    Args:
+        relative_path: The POSIX path relative to the package root.
+        roots: Vendored roots from `find_vendored_roots`.
+
+    Returns:
+        The project (from the fingerprint index, or the first path part below
+        a vendor directory), or None if the file is the package's own.
+    """
+    if not roots:
+        return None
+    parts = relative_path.split("/")
+    for depth in range(len(parts), 0, -1):
+        root = "/".join(parts[:depth])
+        if root in roots:
+            if project := roots[root]:
+                return project
+            # Files directly inside a vendor directory are named after it
+            name = parts[depth] if depth < len(parts) - 1 else parts[depth - 1]
+            return posixpath.splitext(name)[0]
+    return None
+
+
+def tag_vendored(records: List[EvidenceRecord], project: str) -> None:
+    """Marks evidence found in a vendored copy of `project` and discounts it."""
+    for record in records:
+        record.linkage.append(f"{VENDORED_LINKAGE_PREFIX}{project}")
+        record.confidence *= VENDORED_CONFIDENCE_FACTOR
+        record.notes = f"{record.notes} (vendored copy of {project})"
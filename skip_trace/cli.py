@@ -7,7 +7,8 @@ from typing import List, Optional
 from rich_argparse import RichHelpFormatter
 
 from .__about__ import __version__
-from .main import run_command
+from .analysis.ner import NER_BACKENDS
+from .config import SCAN_DEPTHS
 from .utils.cli_suggestions import SmartParser
 
 
@@ -66,12 +67,24 @@ def create_parser() -> SmartParser:
         default="auto",
         help="Control LLM-assisted Named Entity Recognition.",
     )
+    parser.add_argument(
+        "--ner-backend",
+        choices=NER_BACKENDS,
+        default=None,
+        help="Named Entity Recognition engine: a 'spacy' model (default) or "
+        "fast 'rules' that never load spaCy.",
+    )
     parser.add_argument(
         "--jobs", type=int, default=None, help="Number of concurrent jobs to run."
     )
     parser.add_argument(
         "--cache-dir", type=str, default=None, help="Path to the cache directory."
     )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Never touch the network; serve everything from the local cache.",
+    )
 
     sub = parser.add_subparsers(dest="command", required=True, title="Commands")
 
@@ -86,6 +99,15 @@ def create_parser() -> SmartParser:
         action="store_true",
         help="Emit skip_trace's pypi_profile exchange JSON for this package.",
     )
+    p_who.add_argument(
+        "--scan-depth",
+        choices=SCAN_DEPTHS,
+        default="quick",
+        help="'metadata' reads only the core metadata PyPI serves for wheels; "
+        "'lazy' reads .dist-info files and module headers via HTTP Range "
+        "requests; 'quick' scans the most promising files within a budget "
+        "(default); 'full' downloads and scans the whole distribution.",
+    )
 
     # --- `venv` subcommand ---
     p_venv = sub.add_parser(
@@ -97,9 +119,19 @@ def create_parser() -> SmartParser:
 
     # --- `reqs` subcommand ---
     p_reqs = sub.add_parser(
-        "reqs", help="Scan packages from a requirements file (not yet implemented)."
+        "reqs", help="Find ownership for every package in a requirements file."
+    )
+    p_reqs.add_argument(
+        "requirements_file",
+        help="Path to a requirements.txt, uv.lock, poetry.lock, pylock.toml "
+        "or Pipfile.lock.",
+    )
+    p_reqs.add_argument(
+        "--scan-depth",
+        choices=SCAN_DEPTHS,
+        default="metadata",
+        help="How much of each distribution to read (default: metadata).",
     )
-    p_reqs.add_argument("requirements_file", help="Path to the requirements.txt file.")
 
     # --- `explain` subcommand ---
     p_explain = sub.add_parser(
@@ -132,15 +164,64 @@ def create_parser() -> SmartParser:
 
     # --- `cache` subcommand ---
     p_cache = sub.add_parser("cache", help="Manage the local cache.")
-    cache_group = p_cache.add_mutually_exclusive_group(required=True)
-    cache_group.add_argument(
-        "--clear",
+    cache_sub = p_cache.add_subparsers(
+        dest="cache_command", required=True, title="Cache commands"
+    )
+    cache_sub.add_parser("show", help="Show cache statistics and location.")
+    cache_sub.add_parser("clear", help="Clear all cached data (not yet implemented).")
+    cache_sub.add_parser(
+        "gc",
+        help="Remove downloaded artifacts that are too old or over the size budget.",
+    )
+    p_warm = cache_sub.add_parser(
+        "warm",
+        help="Prefetch PyPI metadata, artifacts, RDAP and homepages for packages.",
+    )
+    p_warm.add_argument(
+        "packages",
+        nargs="*",
+        help="Package names, optionally pinned (e.g., 'requests==2.32.3').",
+    )
+    p_warm.add_argument(
+        "-r",
+        "--requirements",
+        action="append",
+        default=[],
+        help="A requirements file to read packages from (repeatable).",
+    )
+    p_warm.add_argument(
+        "-l",
+        "--lockfile",
+        action="append",
+        default=[],
+        help="A uv.lock, poetry.lock, pylock.toml or Pipfile.lock (repeatable).",
+    )
+    p_warm.add_argument(
+        "--no-artifacts",
         action="store_true",
-        help="Clear all cached data (not yet implemented).",
+        help="Do not download distribution artifacts.",
     )
-    cache_group.add_argument(
-        "--show", action="store_true", help="Show cache statistics and location."
+    p_warm.add_argument(
+        "--scan-depth",
+        choices=SCAN_DEPTHS,
+        default="quick",
+        help="The scan depth the audit will use, which decides the distribution "
+        "file fetched; 'metadata' fetches only its core metadata (default: quick).",
     )
+    p_export = cache_sub.add_parser(
+        "export", help="Write cache namespaces to a portable bundle."
+    )
+    p_export.add_argument("output", help="Path of the .tar.gz bundle to write.")
+    p_export.add_argument(
+        "--namespace",
+        action="append",
+        choices=["pypi", "rdap", "url", "artifacts"],
+        help="A cache namespace to include (repeatable; default: all of them).",
+    )
+    p_import = cache_sub.add_parser(
+        "import", help="Merge a bundle written by 'cache export' into the cache."
+    )
+    p_import.add_argument("bundle", help="Path of the bundle to import.")
 
     # --- `policy` subcommand ---
     p_policy = sub.add_parser(
@@ -183,6 +264,10 @@ def main(argv: Optional[List[str]] = None) -> int:
     ):
         args.output_format = "json"
 
+    # Imported once a command is known: `--version` and `--help` never load
+    # the collectors and their dependencies
+    from .main import run_command
+
     try:
         return run_command(args)
     except Exception as e:
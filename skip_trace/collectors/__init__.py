@@ -1,4 +1,17 @@
 # skip_trace/collectors/__init__.py
-from . import github, github_files, package_files, pypi, sigstore, whois
+from __future__ import annotations
 
-__all__ = ["github", "github_files", "package_files", "pypi", "whois", "sigstore"]
+from ..utils.lazy_imports import submodule_getattr
+
+__all__ = [
+    "github",
+    "github_files",
+    "package_files",
+    "pypi",
+    "whois",
+    "sigstore",
+]
+
+# Submodules load PyGithub, sigstore, python-whois/whoisit and
+# BeautifulSoup; they are imported when first accessed.
+__getattr__ = submodule_getattr(__name__, __all__)
@@ -2,27 +2,33 @@
 from __future__ import annotations
 
 import datetime
-import glob
+import hashlib
 import logging
 import os
-import shutil
 import tarfile
 import zipfile
 from email.parser import Parser
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from ..analysis import url_scanner  # <-- IMPORT THE NEW URL SCANNER
-from ..analysis import source_scanner
+from ..analysis import evidence_cache, file_scanner, vendored
 from ..analysis.evidence import generate_evidence_id
+from ..config import CONFIG
 from ..exceptions import CollectorError, NetworkError
 from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
-from ..utils import http_client
-from ..utils.safe_targz import safe_extract_auto
+from ..utils import archive_reader, artifact_store, http_client, remote_zip
+from ..utils.cache import get_cached_data, set_cached_data
 from ..utils.validation import is_valid_email
-from . import sigstore
+from . import pypi, sigstore
 
 logger = logging.getLogger(__name__)
-PACKAGE_DOWNLOAD_DIR = ".packages"
+
+# Distribution files never change once published, so neither does their metadata
+CORE_METADATA_TTL_SECONDS = float("inf")
+# A lazy scan reads only the start of top-level modules, where headers live
+LAZY_HEADER_BYTES = 8 * 1024
+LAZY_MAX_MEMBER_BYTES = 1024 * 1024
+# Larger archive members are data, not something a person wrote a header in
+MAX_MEMBER_BYTES = 5 * 1024 * 1024
 
 
 def _create_evidence_from_contact(
@@ -145,35 +151,88 @@ def _parse_metadata_file(content: str, locator: str) -> List[EvidenceRecord]:
     return evidence_list
 
 
-def _ensure_download_dir():
-    """Ensures the package download directory and .gitignore exist."""
-    os.makedirs(PACKAGE_DOWNLOAD_DIR, exist_ok=True)
-    gitignore_path = os.path.join(PACKAGE_DOWNLOAD_DIR, ".gitignore")
-    if not os.path.exists(gitignore_path):
-        with open(gitignore_path, "w", encoding="utf-8") as f:
-            f.write("*\n")
+def _is_pure_wheel(filename: str) -> bool:
+    """Returns True for wheels tagged `<python>-none-any`."""
+    tags = filename[: -len(".whl")].split("-")
+    return len(tags) >= 5 and tags[-2] == "none" and tags[-1] == "any"
+
+
+def _size(distribution: Dict[str, Any]) -> float:
+    """The published size in bytes; unknown sizes sort last."""
+    size = distribution.get("size")
+    return size if isinstance(size, int) else float("inf")
+
 
+def select_distribution(
+    metadata: Dict[str, Any], scan_depth: str = "quick"
+) -> Optional[Tuple[Dict[str, Any], str]]:
+    """
+    Picks the distribution file to analyze from PyPI metadata.
+
+    A pure-Python wheel is preferred, then the smallest wheel, then the
+    sdist, using the sizes PyPI publishes. A full scan takes the sdist when
+    there is one, because wheels leave out AUTHORS files, tests and build
+    configuration. Yanked files are passed over.
 
-def _find_download_url(metadata: Dict[str, Any]) -> Optional[str]:
-    """Finds the best distribution URL from PyPI metadata."""
+    Args:
+        metadata: The PyPI JSON metadata for the package.
+        scan_depth: The scan depth the file is chosen for.
+
+    Returns:
+        (distribution entry with url, filename, size and digests, reason for
+        the choice), or None if no files are published.
+    """
     urls = metadata.get("urls", [])
     if not urls:
         return None
-
-    # Prioritize wheels, then sdist, then anything else
-    wheel_url = None
-    sdist_url = None
-    for url_info in urls:
-        if url_info.get("yanked"):
-            continue
-        packagetype = url_info.get("packagetype")
-        if packagetype == "bdist_wheel":
-            wheel_url = url_info.get("url")
-        elif packagetype == "sdist":
-            sdist_url = url_info.get("url")
-
-    # Return in order of preference: wheel, then sdist, then fallback
-    return wheel_url or sdist_url or (urls[0].get("url") if urls else None)
+    available = [u for u in urls if not u.get("yanked")]
+    wheels = [u for u in available if u.get("packagetype") == "bdist_wheel"]
+    sdists = [u for u in available if u.get("packagetype") == "sdist"]
+    pure_wheels = [w for w in wheels if _is_pure_wheel(w.get("filename", ""))]
+
+    if scan_depth == "full" and sdists:
+        return (
+            min(sdists, key=_size),
+            "sdist, as a full scan needs files wheels leave out "
+            "(AUTHORS, tests, build configuration)",
+        )
+    if pure_wheels:
+        return min(pure_wheels, key=_size), "pure-Python wheel"
+    if wheels:
+        return (
+            min(wheels, key=_size),
+            f"smallest of {len(wheels)} platform-specific wheels",
+        )
+    if sdists:
+        return min(sdists, key=_size), "sdist, no wheels are published"
+    return (available or urls)[0], "only distribution file published"
+
+
+def _artifact_evidence(distribution: Dict[str, Any], reason: str) -> EvidenceRecord:
+    """Records which distribution file was analyzed and why it was chosen."""
+    filename = distribution.get("filename") or os.path.basename(distribution["url"])
+    value = {
+        "filename": filename,
+        "packagetype": distribution.get("packagetype"),
+        "size": distribution.get("size"),
+        "reason": reason,
+    }
+    return EvidenceRecord(
+        id=generate_evidence_id(
+            EvidenceSource.WHEEL,
+            EvidenceKind.ARTIFACT,
+            distribution["url"],
+            str(value),
+            filename,
+        ),
+        source=EvidenceSource.WHEEL,
+        locator=distribution["url"],
+        kind=EvidenceKind.ARTIFACT,
+        value=value,
+        observed_at=datetime.datetime.now(datetime.timezone.utc),
+        confidence=0.0,
+        notes=f"Analyzed {filename}: {reason}.",
+    )
 
 
 def _download_file(url: str, download_dir: str) -> str | None:
@@ -182,7 +241,11 @@ def _download_file(url: str, download_dir: str) -> str | None:
     download_path = os.path.join(download_dir, filename)
 
     if not os.path.exists(download_path):
+        if http_client.is_offline():
+            logger.info(f"Offline mode, {filename} is not available locally")
+            return None
         logger.info(f"Downloading {filename} from {url}")
+        response = None
         try:
             with http_client.get_client().stream("GET", url) as response:
                 response.raise_for_status()
@@ -195,7 +258,7 @@ def _download_file(url: str, download_dir: str) -> str | None:
             http_client.httpx.HTTPStatusError,
         ) as e:
             # A 404 is expected for bundles, so we don't raise a CollectorError
-            if response and response.status_code == 404:
+            if response is not None and response.status_code == 404:
                 logger.info(f"No file found at {url} (404 Not Found)")
                 return None
             raise CollectorError(f"Failed to download file {filename}: {e}") from e
@@ -203,12 +266,301 @@ def _download_file(url: str, download_dir: str) -> str | None:
     return download_path
 
 
-def collect_from_package_files(metadata: Dict[str, Any]) -> List[EvidenceRecord]:
+def fetch_core_metadata(
+    distribution: Dict[str, Any], package_name: str
+) -> Optional[str]:
+    """
+    Fetches only the core metadata of a distribution (PEP 658/714).
+
+    PyPI serves the METADATA file of every wheel at `<file url>.metadata`,
+    which is a few KB instead of the whole artifact.
+
+    Args:
+        distribution: The PyPI JSON `urls` entry for the file.
+        package_name: The name of the package.
+
+    Returns:
+        The METADATA text, or None if the index does not serve it or it
+        could not be fetched and verified.
+    """
+    metadata_url = f"{distribution['url']}.metadata"
+    cached = get_cached_data(
+        pypi.PYPI_CACHE_NAMESPACE,
+        metadata_url,
+        ttl_seconds=CORE_METADATA_TTL_SECONDS,
+    )
+    if cached:
+        logger.debug(f"Using cached core metadata from {metadata_url}")
+        return str(cached["content"])
+
+    filename = distribution.get("filename") or os.path.basename(distribution["url"])
+    try:
+        hashes = pypi.fetch_core_metadata_hashes(package_name).get(filename)
+        if hashes is None:
+            logger.info(f"The index does not serve core metadata for {filename}")
+            return None
+        logger.info(f"Downloading core metadata from {metadata_url}")
+        response = http_client.get_client().get(metadata_url)
+        response.raise_for_status()
+    except (NetworkError, http_client.httpx.HTTPError) as e:
+        logger.warning(f"Could not fetch core metadata for {filename}: {e}")
+        return None
+
+    expected = hashes.get("sha256")
+    if expected and hashlib.sha256(response.content).hexdigest() != expected:
+        logger.warning(f"Core metadata for {filename} failed sha256 verification")
+        return None
+
+    content = response.content.decode("utf-8", errors="replace")
+    set_cached_data(pypi.PYPI_CACHE_NAMESPACE, metadata_url, {"content": content})
+    return content
+
+
+def _collect_from_core_metadata(
+    distribution: Dict[str, Any], package_name: str, package_version: str
+) -> Optional[List[EvidenceRecord]]:
+    """Parses the separately served METADATA file, or returns None if unavailable."""
+    content = fetch_core_metadata(distribution, package_name)
+    if content is None:
+        return None
+    # Use the same locator the file has inside the wheel, so evidence IDs match
+    # those of a full scan.
+    filename = distribution.get("filename") or os.path.basename(distribution["url"])
+    dist_info = "-".join(filename.split("-")[:2])
+    locator = f"{package_name}-{package_version}/{dist_info}.dist-info/METADATA"
+    evidence = _parse_metadata_file(content, locator)
+    logger.info(
+        f"Extracted {len(evidence)} evidence records from core metadata of {filename}."
+    )
+    return evidence
+
+
+def _select_for_scan(path: str, size: int) -> Optional[int]:
+    """Skips members by name and size, before they are decompressed."""
+    if file_scanner.is_skipped_path(path):
+        return None
+    if size > MAX_MEMBER_BYTES:
+        logger.debug(f"Skipping large archive member {path} ({size} bytes)")
+        return None
+    return -1
+
+
+def _select_lazy_members(path: str, size: int) -> Optional[int]:
+    """
+    Picks the wheel members worth fetching in a lazy scan.
+
+    Whole .dist-info files (except RECORD) are read, and only the first
+    LAZY_HEADER_BYTES of top-level modules, where headers live.
+    """
+    if _select_for_scan(path, size) is None or size > LAZY_MAX_MEMBER_BYTES:
+        return None
+    parts = path.split("/")
+    if parts[0].endswith(".dist-info") and len(parts) > 1:
+        return None if parts[-1] == "RECORD" else -1
+    if path.endswith(".py") and (
+        len(parts) == 1 or (len(parts) == 2 and parts[1] == "__init__.py")
+    ):
+        return LAZY_HEADER_BYTES
+    return None
+
+
+def _plan_quick_scan(entries: List[Tuple[str, int]]) -> List[str]:
+    """Picks the archive members a quick scan reads, within the configured budget."""
+    scan_config = CONFIG.get("scan", {})
+    plan = file_scanner.plan_scan(
+        entries,
+        max_files=scan_config.get("quick_max_files", 200),
+        max_bytes=scan_config.get("quick_max_bytes", 4 * 1024 * 1024),
+        max_member_bytes=MAX_MEMBER_BYTES,
+    )
+    logger.info(f"Quick scan reads {len(plan)} of {len(entries)} archive members")
+    return plan
+
+
+def _quick_stop_condition() -> Optional[file_scanner.StopCondition]:
+    """Builds the early-stop predicate for quick scans, if one is configured."""
+    scan_config = CONFIG.get("scan", {})
+    min_records = scan_config.get("early_stop_records")
+    if not min_records:
+        return None
+    return file_scanner.enough_evidence(
+        min_records, scan_config.get("early_stop_confidence", 0.35)
+    )
+
+
+def _scan_members(
+    members: Iterable[Tuple[str, bytes]],
+    locator_prefix: str,
+    stop_when: Optional[file_scanner.StopCondition] = None,
+    vendored_roots: Optional[file_scanner.VendoredRoots] = None,
+    digests: Optional[Dict[str, str]] = None,
+    workers: Optional[int] = None,
+) -> List[EvidenceRecord]:
+    """
+    Runs the file scanner over archive members and parses the metadata file.
+
+    Args:
+        members: (path relative to the package root, bytes) pairs.
+        locator_prefix: A prefix for the evidence locator (e.g., package name/version).
+        stop_when: Optional early-stop predicate, see `file_scanner.scan_files`.
+        vendored_roots: Vendored code roots, see `file_scanner.scan_files`.
+        digests: Known content digests by path, e.g. from the wheel's RECORD.
+        workers: Number of scan processes, see `file_scanner.scan_files`.
+
+    Returns:
+        Source evidence, then URL evidence, then package metadata evidence.
+    """
+    # .dist-info / .egg-info dir -> {"METADATA" or "PKG-INFO": content}
+    info_files: Dict[str, Dict[str, str]] = {}
+
+    def remember_info_file(path: str, content: str) -> None:
+        parent, _, basename = path.rpartition("/")
+        if parent.endswith((".dist-info", ".egg-info")) and basename in (
+            "METADATA",
+            "PKG-INFO",
+        ):
+            info_files.setdefault(parent, {})[basename] = content
+
+    evidence = file_scanner.scan_files(
+        members,
+        locator_prefix,
+        on_text=remember_info_file,
+        stop_when=stop_when,
+        vendored_roots=vendored_roots,
+        digests=digests,
+        workers=workers,
+    )
+
+    # --- Parse the PKG-INFO/METADATA file, preferring .dist-info over .egg-info ---
+    info_dirs = sorted(info_files, key=lambda d: not d.endswith(".dist-info"))
+    if info_dirs:
+        files = info_files[info_dirs[0]]
+        basename = "METADATA" if "METADATA" in files else "PKG-INFO"
+        locator = f"{locator_prefix}/{info_dirs[0]}/{basename}"
+        logger.info(f"Found package metadata file: {info_dirs[0]}/{basename}")
+        metadata_evidence = _parse_metadata_file(files[basename], locator)
+        evidence.extend(metadata_evidence)
+        logger.info(
+            f"Extracted {len(metadata_evidence)} evidence records from package metadata file."
+        )
+
+    return evidence
+
+
+def _record_digests(archive: archive_reader.OpenArchive) -> Dict[str, str]:
+    """Reads the per-file sha256 digests a wheel lists in its RECORD file."""
+    record_paths = [
+        path
+        for path, _ in archive.listing
+        if path.count("/") == 1 and path.endswith(".dist-info/RECORD")
+    ]
+    if not record_paths:
+        return {}
+    [(_, data)] = archive.read_in_order(record_paths[:1])
+    return evidence_cache.parse_record_digests(data.decode("utf-8", errors="replace"))
+
+
+def _scan_archive(
+    archive: archive_reader.OpenArchive, locator_prefix: str, scan_depth: str
+) -> List[EvidenceRecord]:
+    """
+    Scans an opened distribution archive at "lazy", "quick" or "full" depth.
+
+    A lazy scan of a stored artifact reads the members a remote one would.
+    Lazy and quick scans read few enough files to run in this process,
+    without starting a worker pool and preloading NER into it.
+
+    Vendored code is found from the member listing first. Quick scans never
+    read it; full scans skip, tag or scan it according to `scan.vendored`.
+    """
+    roots = vendored.find_vendored_roots(path for path, _ in archive.listing)
+    digests = _record_digests(archive)
+
+    def own_code(path: str) -> bool:
+        return vendored.vendored_project(path, roots) is None
+
+    if scan_depth == "lazy":
+        return _scan_members(
+            archive.iter_selected(_select_lazy_members),
+            locator_prefix,
+            digests=digests,
+            workers=1,
+        )
+    if scan_depth == "quick":
+        plan = _plan_quick_scan([e for e in archive.listing if own_code(e[0])])
+        return _scan_members(
+            archive.read_in_order(plan),
+            locator_prefix,
+            stop_when=_quick_stop_condition(),
+            digests=digests,
+            workers=1,
+        )
+
+    skip_vendored = vendored.vendored_mode() == "skip"
+
+    def select(path: str, size: int) -> Optional[int]:
+        if skip_vendored and not own_code(path):
+            return None
+        return _select_for_scan(path, size)
+
+    return _scan_members(
+        archive.iter_selected(select),
+        locator_prefix,
+        vendored_roots=roots,
+        digests=digests,
+    )
+
+
+def _collect_lazily(
+    distribution: Dict[str, Any], locator_prefix: str
+) -> Optional[List[EvidenceRecord]]:
+    """
+    Scans selected wheel members fetched with HTTP Range requests.
+
+    Returns:
+        The evidence found, or None when a lazy read is not possible (not a
+        wheel, or the server ignores Range requests) and the caller should
+        fall back to a full download.
+    """
+    filename = distribution.get("filename") or os.path.basename(distribution["url"])
+    if not filename.endswith(archive_reader.ZIP_SUFFIXES):
+        return None
+    try:
+        archive, remote = remote_zip.open_remote_zip(distribution["url"])
+        with archive:
+            evidence = _scan_members(
+                archive_reader.iter_zip_members(archive, _select_lazy_members),
+                locator_prefix,
+                workers=1,
+            )
+    except (NetworkError, zipfile.BadZipFile) as e:
+        logger.info(f"Lazy read of {filename} not possible ({e})")
+        return None
+    logger.info(
+        f"Read {filename} lazily: {remote.bytes_fetched} of {remote.size} "
+        f"bytes in {remote.requests} range requests"
+    )
+    return evidence
+
+
+def collect_from_package_files(
+    metadata: Dict[str, Any], scan_depth: str = "full"
+) -> List[EvidenceRecord]:
     """
     Downloads, extracts, and scans a package's files for evidence.
 
     Args:
         metadata: The PyPI JSON metadata for the package.
+        scan_depth: "metadata" to read only the core metadata file when the
+            index serves one, "lazy" to read .dist-info files and top-level
+            module headers of a wheel through HTTP Range requests (or from
+            the stored artifact), "quick" to scan only the most promising
+            files of the distribution, or "full" to download and scan the
+            whole distribution. With `scan.early_stop_records` set, a quick
+            scan reads the core metadata first and downloads nothing when it
+            already holds enough confident claims. The cheaper depths fall
+            back to a full scan when they are not possible. Sigstore bundles
+            are verified whenever the artifact is downloaded.
 
     Returns:
         A list of EvidenceRecord objects found within the package files.
@@ -218,26 +570,48 @@ def collect_from_package_files(metadata: Dict[str, Any]) -> List[EvidenceRecord]
     package_version = info.get("version", "latest")
     logger.info(f"Starting file analysis for {package_name} v{package_version}")
 
-    download_url = _find_download_url(metadata)
-    if not download_url:
+    selection = select_distribution(metadata, scan_depth)
+    download_url = selection[0].get("url") if selection else None
+    if not selection or not download_url:
         logger.warning(
             f"No download URL found for {package_name}. Skipping file analysis."
         )
         return []
+    distribution, reason = selection
+    artifact = _artifact_evidence(distribution, reason)
+    logger.info(artifact.notes)
+
+    stop_when = _quick_stop_condition() if scan_depth == "quick" else None
+    if scan_depth == "metadata" or stop_when:
+        core_evidence = _collect_from_core_metadata(
+            distribution, package_name, package_version
+        )
+        if core_evidence is not None and (
+            scan_depth == "metadata" or (stop_when and stop_when(core_evidence))
+        ):
+            return [artifact] + core_evidence
+        # The file scan reads METADATA again, with the same evidence IDs
+        logger.info(f"Scanning the files of {package_name}")
+
+    # A stored artifact is free to read, so only go lazy when it is not local
+    filename = distribution.get("filename") or os.path.basename(download_url)
+    sha256 = (distribution.get("digests") or {}).get("sha256")
+    locator_prefix = f"{package_name}-{package_version}"
+    if scan_depth == "lazy" and not (sha256 and artifact_store.lookup(sha256)):
+        lazy_evidence = _collect_lazily(distribution, locator_prefix)
+        if lazy_evidence is not None:
+            return [artifact] + lazy_evidence
+        logger.info(f"Falling back to a full download of {filename}")
 
-    _ensure_download_dir()
-
-    # Download the main package artifact
-    artifact_path = _download_file(download_url, PACKAGE_DOWNLOAD_DIR)
-    if not artifact_path:
-        return []  # Can't proceed without the artifact
+    # Fetch the main package artifact into the content-addressed store
+    artifact_path = artifact_store.fetch_artifact(download_url, filename, sha256)
 
-    # Attempt to download the corresponding Sigstore bundle
+    # Attempt to download the corresponding Sigstore bundle next to the artifact
     bundle_url = f"{download_url}.sigstore"
-    bundle_path = _download_file(bundle_url, PACKAGE_DOWNLOAD_DIR)
+    bundle_path = _download_file(bundle_url, os.path.dirname(artifact_path))
 
     # Initialize evidence list
-    evidence: list[EvidenceRecord] = []
+    evidence: list[EvidenceRecord] = [artifact]
 
     # Verify with Sigstore if the bundle was found
     if bundle_path:
@@ -246,104 +620,15 @@ def collect_from_package_files(metadata: Dict[str, Any]) -> List[EvidenceRecord]
         )
         evidence.extend(sigstore_evidence)
 
-    # Determine the persistent extraction directory path from the filename
-    filename = os.path.basename(artifact_path)
-    base_filename, _ = os.path.splitext(filename)
-    if filename.endswith(".tar.gz"):
-        base_filename, _ = os.path.splitext(base_filename)
-    extract_dir = os.path.join(PACKAGE_DOWNLOAD_DIR, base_filename)
-
-    # Extract the archive ONLY if the destination directory doesn't already exist
-    if not os.path.exists(extract_dir):
-        logger.info(f"Extracting {artifact_path} to {extract_dir}")
-        os.makedirs(extract_dir, exist_ok=True)
-        try:
-            if artifact_path.endswith((".whl", ".zip")):
-                with zipfile.ZipFile(artifact_path, "r") as zf:
-                    zf.extractall(extract_dir)  # nosec
-            elif artifact_path.endswith(
-                (".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".tar")
-            ):
-                safe_extract_auto(artifact_path, extract_dir)
-            else:
-                logger.warning(
-                    f"Unsupported archive format for {filename}. Skipping file scan."
-                )
-                shutil.rmtree(extract_dir)  # Clean up the empty dir
-                return evidence  # Return any Sigstore evidence found
-        except (zipfile.BadZipFile, tarfile.TarError, PermissionError) as e:
-            logger.error(f"Failed to extract archive {artifact_path}: {e}")
-            shutil.rmtree(extract_dir, ignore_errors=True)
-            return evidence  # Return any Sigstore evidence found
-    else:
-        logger.info(f"Using cached package files from {extract_dir}")
-
-    # Determine the actual directory to scan (handles sdists with a single top-level folder)
-    scan_target_dir = extract_dir
-    # This logic applies to sdists, which often have a root folder. Wheels do not.
-    if filename.endswith((".tar.gz", ".tgz", ".tar.bz2")):
-        try:
-            dir_contents = os.listdir(extract_dir)
-            if len(dir_contents) == 1 and os.path.isdir(
-                os.path.join(extract_dir, dir_contents[0])
-            ):
-                scan_target_dir = os.path.join(extract_dir, dir_contents[0])
-        except FileNotFoundError:
-            logger.error(
-                f"Extraction directory {extract_dir} not found after apparent success. Check permissions."
-            )
-            return evidence
-
-    locator_prefix = f"{package_name}-{package_version}"
-    # --- Scan for standard claims (copyright, authors, etc.) ---
-    source_scan_evidence = source_scanner.scan_directory(
-        scan_target_dir, locator_prefix
-    )
-    evidence.extend(source_scan_evidence)
-
-    # --- NEW: Scan separately for URLs ---
-    url_scan_evidence = url_scanner.scan_directory_for_urls(
-        scan_target_dir, locator_prefix
-    )
-    evidence.extend(url_scan_evidence)
-
-    # --- Scan for PKG-INFO/METADATA file ---
-    metadata_file_path = None
-    # Use a recursive glob to find the relevant .dist-info or .egg-info directory
-    # This is more robust for sdists that may have a nested src/ directory.
-    dist_info_pattern = os.path.join(scan_target_dir, "**", "*.dist-info")
-    egg_info_pattern = os.path.join(scan_target_dir, "**", "*.egg-info")
-
-    info_dirs = glob.glob(dist_info_pattern, recursive=True) + glob.glob(
-        egg_info_pattern, recursive=True
-    )
-
-    if info_dirs:
-        info_dir_path = info_dirs[0]  # Assume there's only one
-        potential_files = [
-            os.path.join(info_dir_path, "METADATA"),
-            os.path.join(info_dir_path, "PKG-INFO"),
-        ]
-        for f_path in potential_files:
-            if os.path.exists(f_path):
-                metadata_file_path = f_path
-                break
-
-    if metadata_file_path:
-        rel_path = os.path.relpath(metadata_file_path, PACKAGE_DOWNLOAD_DIR)
-        logger.info(f"Found package metadata file: {rel_path}")
-        try:
-            with open(metadata_file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-            # Create a locator relative to the package root
-            relative_locator_path = os.path.relpath(metadata_file_path, scan_target_dir)
-            locator = f"{locator_prefix}/{relative_locator_path}"
-            metadata_evidence = _parse_metadata_file(content, locator)
-            evidence.extend(metadata_evidence)
-            logger.info(
-                f"Extracted {len(metadata_evidence)} evidence records from package metadata file."
-            )
-        except IOError as e:
-            logger.warning(f"Could not read metadata file {metadata_file_path}: {e}")
-
+    # Members are read straight from the stored archive; nothing is extracted
+    if not archive_reader.is_supported_archive(filename):
+        logger.warning(
+            f"Unsupported archive format for {filename}. Skipping file scan."
+        )
+        return evidence  # Return any Sigstore evidence found
+    try:
+        with archive_reader.open_archive(artifact_path, filename) as archive:
+            evidence.extend(_scan_archive(archive, locator_prefix, scan_depth))
+    except (zipfile.BadZipFile, tarfile.TarError, OSError) as e:
+        logger.error(f"Failed to read archive {artifact_path}: {e}")
     return evidence
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import datetime
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, cast
 
 from bs4 import BeautifulSoup
 
@@ -12,10 +12,18 @@ from ..analysis.evidence import generate_evidence_id
 from ..exceptions import NetworkError, NoEvidenceError
 from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
 from ..utils import http_client
+from ..utils.cache import get_cached_data, set_cached_data
 
 logger = logging.getLogger(__name__)
 PYPI_JSON_API_URL = "https://pypi.org/pypi"
 PYPI_PROJECT_URL = "https://pypi.org/project"
+PYPI_SIMPLE_API_URL = "https://pypi.org/simple"
+PYPI_CACHE_NAMESPACE = "pypi"
+# The unversioned JSON and the Simple index change with every release, so they
+# are refetched after an hour; pinned versions use the configured cache TTL
+PYPI_INDEX_TTL_SECONDS = 3600
+# PEP 691 JSON flavour of the Simple Repository API
+SIMPLE_JSON_CONTENT_TYPE = "application/vnd.pypi.simple.v1+json"
 
 
 def fetch_package_metadata(
@@ -32,12 +40,21 @@ def fetch_package_metadata(
     """
     if version:
         url = f"{PYPI_JSON_API_URL}/{package_name}/{version}/json"
+        ttl_seconds = None
     else:
         url = f"{PYPI_JSON_API_URL}/{package_name}/json"
+        ttl_seconds = PYPI_INDEX_TTL_SECONDS
+
+    cached = get_cached_data(PYPI_CACHE_NAMESPACE, url, ttl_seconds=ttl_seconds)
+    if cached:
+        logger.debug(f"Using cached PyPI metadata for {package_name}")
+        return cast(Dict[str, Any], cached)
 
     try:
         response = http_client.make_request(url)
-        return response.json()
+        metadata = response.json()
+        set_cached_data(PYPI_CACHE_NAMESPACE, url, metadata)
+        return cast(Dict[str, Any], metadata)
     except NetworkError as e:
         if "404" in str(e):
             raise NoEvidenceError(
@@ -47,6 +64,49 @@ def fetch_package_metadata(
         raise
 
 
+def fetch_core_metadata_hashes(package_name: str) -> Dict[str, Dict[str, str]]:
+    """
+    Lists the files of a project that have a separately served core metadata file.
+
+    Uses the JSON Simple API, where PEP 658/714 expose a `core-metadata` (or
+    the older `data-dist-info-metadata`) key per file.
+
+    :param package_name: The name of the package.
+    :raises NetworkError: If the index cannot be fetched.
+    :return: A mapping of filename to the hashes of its `.metadata` file
+        (empty when the index advertises the file without hashes).
+    """
+    url = f"{PYPI_SIMPLE_API_URL}/{package_name}/"
+    cached = get_cached_data(
+        PYPI_CACHE_NAMESPACE, url, ttl_seconds=PYPI_INDEX_TTL_SECONDS
+    )
+    if cached:
+        return cast(Dict[str, Dict[str, str]], cached["files"])
+
+    try:
+        response = http_client.get_client().get(
+            url, headers={"Accept": SIMPLE_JSON_CONTENT_TYPE}
+        )
+        response.raise_for_status()
+        files = response.json().get("files", [])
+    except (http_client.httpx.HTTPError, ValueError) as e:
+        raise NetworkError(f"Could not read Simple API index {url}: {e}") from e
+
+    hashes: Dict[str, Dict[str, str]] = {}
+    for file_info in files:
+        core_metadata = file_info.get(
+            "core-metadata", file_info.get("data-dist-info-metadata")
+        )
+        if core_metadata and file_info.get("filename"):
+            hashes[file_info["filename"]] = (
+                core_metadata if isinstance(core_metadata, dict) else {}
+            )
+
+    # Only the metadata-bearing files are kept; full indexes can be megabytes
+    set_cached_data(PYPI_CACHE_NAMESPACE, url, {"files": hashes})
+    return hashes
+
+
 def _scrape_user_profile_url(package_name: str) -> Optional[str]:
     """Scrapes the PyPI project page to find the user profile URL."""
     try:
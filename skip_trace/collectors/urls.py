@@ -4,7 +4,7 @@ from __future__ import annotations
 import datetime
 import logging
 import os
-from typing import List, Set
+from typing import List, Set, Tuple
 
 from bs4 import BeautifulSoup
 
@@ -27,6 +27,36 @@ def _ensure_download_dir():
             f.write("*\n")
 
 
+def fetch_url_content(url: str) -> Tuple[int, str]:
+    """
+    Fetches a URL's status code and body, using the "url" cache namespace.
+
+    Only responses are cached. Connection failures (status -1), including
+    every uncached URL in offline mode, are retried on the next run rather
+    than stored, where they would shadow the real page for the whole TTL and
+    win over it when a cache bundle is imported.
+
+    Args:
+        url: The URL to fetch.
+
+    Returns:
+        A tuple of (status_code, content); content is empty unless status is 200.
+    """
+    cached_data = get_cached_data("url", url)
+    # Failures cached by earlier versions are refetched
+    if cached_data and cached_data.get("status_code", -1) != -1:
+        logger.debug(f"Using cached content for {url}")
+        return cached_data["status_code"], cached_data.get("content", "")
+
+    response = http_client.make_request_safe(url)
+    if response is None:
+        return -1, ""
+    status_code = response.status_code
+    content = response.text if status_code == 200 else ""
+    set_cached_data("url", url, {"status_code": status_code, "content": content})
+    return status_code, content
+
+
 def collect_from_urls(urls: Set[str]) -> List[EvidenceRecord]:
     """
     Downloads, caches, and scans a list of URLs for evidence.
@@ -43,28 +73,7 @@ def collect_from_urls(urls: Set[str]) -> List[EvidenceRecord]:
 
     for url in urls:
         logger.info(f"Analyzing URL: {url}")
-        cached_data = get_cached_data("url", url)
-
-        status_code = -1
-        content = ""
-
-        if cached_data:
-            logger.debug(f"Using cached content for {url}")
-            status_code = cached_data.get("status_code", -1)
-            content = cached_data.get("content", "")
-        else:
-            response = http_client.make_request_safe(url)
-            if response:
-                status_code = response.status_code
-                if status_code == 200:
-                    content = response.text
-                set_cached_data(
-                    "url", url, {"status_code": status_code, "content": content}
-                )
-            else:
-                set_cached_data(
-                    "url", url, {"status_code": -1, "content": ""}
-                )  # Cache connection failure
+        status_code, content = fetch_url_content(url)
 
         # Create an evidence record for the URL status itself
         status_value = {"status_code": status_code}
@@ -3,16 +3,18 @@ from __future__ import annotations
 
 import datetime as _dt
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, cast
 
 import whois as python_whois
 from whoisit import domain as rdap_domain
 
 from ..analysis.evidence import generate_evidence_id
 from ..schemas import EvidenceKind, EvidenceRecord, EvidenceSource
+from ..utils import http_client
 from ..utils.cache import get_cached_data, set_cached_data
 
 logger = logging.getLogger(__name__)
+RDAP_CACHE_NAMESPACE = "rdap"  # new namespace; do not collide with legacy "whois"
 
 
 def _normalize_org_name(name: Optional[str]) -> Optional[str]:
@@ -141,6 +143,23 @@ def _lookup(domain: str) -> Dict[str, Any]:
     return {"error": "No RDAP/WHOIS client available or no usable data returned."}
 
 
+def lookup_domain(domain: str) -> Dict[str, Any]:
+    """
+    Returns normalized RDAP/WHOIS data for a domain, using the "rdap" cache namespace.
+
+    Failed lookups are cached as {"error": ...} so they are not retried.
+    """
+    cached = get_cached_data(RDAP_CACHE_NAMESPACE, domain)
+    if cached:
+        logger.debug("Using cached RDAP/WHOIS data for %s", domain)
+        return cast(Dict[str, Any], cached)
+    if http_client.is_offline():
+        return {"error": "Offline mode and no cached RDAP/WHOIS data."}
+    info = _lookup(domain)
+    set_cached_data(RDAP_CACHE_NAMESPACE, domain, info if info else {"error": "empty"})
+    return info
+
+
 def collect_from_domain(domain: str) -> List[EvidenceRecord]:
     """
     Collect registration ownership signals for a domain using RDAP (preferred) with WHOIS fallback.
@@ -148,16 +167,9 @@ def collect_from_domain(domain: str) -> List[EvidenceRecord]:
     """
     logger.info("Checking %s", domain)
     now = _dt.datetime.now(_dt.timezone.utc)
-    cache_key_ns = "rdap"  # new namespace; do not collide with legacy "whois"
     locator_base = "rdap://"
 
-    cached = get_cached_data(cache_key_ns, domain)
-    if cached:
-        logger.debug("Using cached RDAP/WHOIS data for %s", domain)
-        info = cached
-    else:
-        info = _lookup(domain)
-        set_cached_data(cache_key_ns, domain, info if info else {"error": "empty"})
+    info = lookup_domain(domain)
 
     if not info or "error" in info:
         logger.warning(
@@ -17,6 +17,15 @@ from .exceptions import ConfigurationError
 # Load .env file at module level
 load_dotenv()
 
+# How much of a distribution `package_files` reads, defined here so the CLI can
+# offer them without importing the collectors.
+# "metadata" reads only the core metadata file PyPI serves next to wheels;
+# "lazy" reads selected wheel members through HTTP Range requests;
+# "quick" downloads the distribution but scans only its most promising files,
+# within the `scan.quick_max_files` / `scan.quick_max_bytes` budget;
+# "full" downloads and scans the whole distribution.
+SCAN_DEPTHS = ("metadata", "lazy", "quick", "full")
+
 DEFAULT_CONFIG: Dict[str, Any] = {
     "default_min_score": 0.70,
     "default_fail_under": 0.50,
@@ -50,6 +59,56 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "enabled": True,
         "dir": ".skip_trace_cache",
         "ttl_seconds": 604800,  # 7 days
+        # Content-addressed artifact store garbage collection limits
+        "artifact_max_bytes": 2 * 1024**3,  # 2 GiB
+        "artifact_max_age_seconds": 2592000,  # 30 days
+    },
+    # Package file scanning
+    "scan": {
+        # Worker processes for large trees; None means one per CPU
+        "workers": None,
+        # "preload" loads NER once and forks workers sharing it copy-on-write;
+        # "spawn" starts workers as fresh interpreters that load their own
+        "worker_start": "preload",
+        # Trees with fewer files are scanned in-process, pool start-up isn't worth it
+        "parallel_min_files": 200,
+        # Budget of a "quick" scan, filled with the most promising files first;
+        # quick scans always run in-process, whatever parallel_min_files says
+        "quick_max_files": 200,
+        "quick_max_bytes": 4 * 1024 * 1024,
+        # Stop a quick scan once this many claims reach early_stop_confidence;
+        # None scans the whole budget
+        "early_stop_records": None,
+        "early_stop_confidence": 0.35,
+        # Vendored third-party code: "skip" it, "tag" its evidence (scanned
+        # separately, discounted) or "scan" it like the package's own code
+        "vendored": "skip",
+        # Reuse per-file evidence for content scanned before (any version/package)
+        "evidence_cache": True,
+        # Skip claim regexes (and NER) over files that lack their trigger keywords
+        "prefilter": True,
+        # Cut standard license text out of copyright holders before NER
+        "license_boilerplate": True,
+    },
+    # Named Entity Recognition result caching
+    "ner": {
+        # "spacy" runs the model of `profile`, "rules" the pattern-based
+        # rule_ner engine, which never imports spaCy
+        "backend": "spacy",
+        # Model and components to load, see ner.NER_PROFILES: "fast" (small
+        # model, NER only), "balanced", "accurate" or "full" (every component)
+        "profile": "fast",
+        "persistent_cache": True,
+        "memory_cache_size": 50000,
+        # Texts per nlp.pipe batch
+        "batch_size": 256,
+        # Processes for batches of at least n_process_min_texts texts
+        "n_process": 1,
+        "n_process_min_texts": 1000,
+        # Longer texts are run in windows of this many characters (capped at
+        # the model's max_length), overlapping by window_overlap
+        "max_chars_per_call": 100_000,
+        "window_overlap": 200,
     },
     # Domains to ignore for WHOIS lookups
     "whois_ignored_domains": [
@@ -176,6 +235,7 @@ def load_config(test_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     config["lenient_mode_enabled"] = (
         os.getenv("SKIP_TRACE_INCLUDE_TOOL_ORGS") is not None
     )
+    config["offline"] = os.getenv("SKIP_TRACE_OFFLINE") is not None
 
     return cast(Dict[str, Any], config)
 
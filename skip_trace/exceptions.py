@@ -20,3 +20,11 @@ class NoEvidenceError(SkipTraceError):
 
 class CollectorError(SkipTraceError):
     """Raised when a specific data collector fails."""
+
+
+class CacheBundleError(SkipTraceError):
+    """Raised when a cache bundle cannot be read or is malformed."""
+
+
+class RangeNotSupportedError(NetworkError):
+    """Raised when a server does not honour HTTP Range requests."""
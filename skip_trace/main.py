@@ -5,30 +5,25 @@ import argparse
 import dataclasses
 import json
 import logging
+import os
 import sys
-from typing import Set
+from typing import List, Set
 from urllib.parse import urlparse
 
-import tldextract
 from rich.logging import RichHandler
 
 from . import schemas
-from .analysis import backlinks  # Import the new module
-from .analysis import evidence as evidence_analyzer
-from .analysis import scoring
-from .collectors import (
-    github,
-    github_files,
-    package_files,
-    pypi,
-    pypi_attestations,
-    urls,
-    whois,
-)
 from .config import CONFIG
-from .exceptions import CollectorError, NetworkError, NoEvidenceError
-from .pypi_profile_export import PypiProfileExchange, build_exchange
+from .exceptions import (
+    CacheBundleError,
+    CollectorError,
+    ConfigurationError,
+    NetworkError,
+    NoEvidenceError,
+)
 from .reporting import json_reporter, md_reporter
+from .utils import cache, domains, requirements
+from .utils.requirements import PackageSpec
 
 # Create a logger instance for this module
 logger = logging.getLogger(__name__)
@@ -48,8 +43,32 @@ def setup_logging(level: str = "INFO"):
     )
 
 
-def analyze_package(package: str, version: str | None = None) -> schemas.PackageResult:
-    """Analyze a package and return the full ownership result."""
+def analyze_package(
+    package: str, version: str | None = None, scan_depth: str = "full"
+) -> schemas.PackageResult:
+    """Analyze a package and return the full ownership result.
+
+    Args:
+        package: The name of the package.
+        version: The specific version, or None for the latest release.
+        scan_depth: How much of the distribution to read, one of
+            `config.SCAN_DEPTHS`.
+    """
+    # Collectors pull in PyGithub, sigstore, whois and bs4, so they are
+    # imported by the commands that use them, not at startup
+    from .analysis import backlinks, ner, scoring
+    from .analysis import evidence as evidence_analyzer
+    from .collectors import (
+        github,
+        github_files,
+        package_files,
+        pypi,
+        pypi_attestations,
+        urls,
+        whois,
+    )
+    from .utils import http_client
+
     metadata = pypi.fetch_package_metadata(package, version)
     package_name = metadata.get("info", {}).get("name", package)
     package_version = metadata.get("info", {}).get("version")
@@ -65,7 +84,9 @@ def analyze_package(package: str, version: str | None = None) -> schemas.Package
     )
 
     try:
-        package_files_evidence = package_files.collect_from_package_files(metadata)
+        package_files_evidence = package_files.collect_from_package_files(
+            metadata, scan_depth=scan_depth
+        )
         evidence_records.extend(package_files_evidence)
         logger.info(
             f"Evidence records so far {len(evidence_records)} -- collected from source code in package"
@@ -87,6 +108,10 @@ def analyze_package(package: str, version: str | None = None) -> schemas.Package
             if url and "github.com" in url:
                 repo_urls.add(url)
 
+    if repo_urls and http_client.is_offline():
+        logger.info("Offline mode, skipping GitHub API analysis.")
+        repo_urls = set()
+
     for url in repo_urls:
         logger.info(f"Analyzing GitHub repository: {url}")
         try:
@@ -131,11 +156,10 @@ def analyze_package(package: str, version: str | None = None) -> schemas.Package
             except Exception as e:
                 logger.debug(f"Could not parse user URL from {url}: {e}")
 
-            extracted = tldextract.extract(url)
-            if extracted.registered_domain:
-                if extracted.registered_domain not in ignored_domains:
-                    domains_to_check.add(extracted.registered_domain)
-                    urls_to_scan.add(url)
+            registered = domains.registered_domain(url)
+            if registered and registered not in ignored_domains:
+                domains_to_check.add(registered)
+                urls_to_scan.add(url)
 
     logger.info(f"Domains for WHOIS: {', '.join(sorted(list(domains_to_check)))}")
     if domains_to_check:
@@ -175,6 +199,12 @@ def analyze_package(package: str, version: str | None = None) -> schemas.Package
         )
 
     owner_candidates = scoring.score_owners(evidence_records)
+    ner_stats = ner.get_cache_stats()
+    logger.info(
+        f"NER cache: {ner_stats['lookups']} lookups, "
+        f"{ner_stats['memory_hits']} memory hits, {ner_stats['disk_hits']} disk hits, "
+        f"hit rate {ner_stats['hit_rate']:.0%}"
+    )
     return schemas.PackageResult(
         package=package_name,
         version=package_version,
@@ -184,12 +214,25 @@ def analyze_package(package: str, version: str | None = None) -> schemas.Package
     )
 
 
+def is_anonymous(result: schemas.PackageResult) -> bool:
+    """
+    Returns True if no owner of a package scores at least the configured
+    `default_fail_under` threshold; commands exit with 101 for such packages.
+    """
+    fail_under = float(CONFIG.get("default_fail_under", 0.50))
+    return not result.owners or result.owners[0].score < fail_under
+
+
 def run_who_owns(args: argparse.Namespace) -> int:
     """Handler for the 'who-owns' command."""
+    from .pypi_profile_export import build_exchange
+
     logger.info(f"Executing 'who-owns' for package: {args.package}")
 
     try:
-        package_result = analyze_package(args.package, args.version)
+        package_result = analyze_package(
+            args.package, args.version, scan_depth=args.scan_depth
+        )
         if getattr(args, "for_pypi_profile", False):
             exchange = build_exchange(package_result)
             json_reporter.render_data(exchange.model_dump(mode="json"))
@@ -198,8 +241,7 @@ def run_who_owns(args: argparse.Namespace) -> int:
         else:
             md_reporter.render(package_result)
 
-        top_score = package_result.owners[0].score if package_result.owners else 0
-        return 0 if top_score >= 0.5 else 101
+        return 101 if is_anonymous(package_result) else 0
     except NoEvidenceError as e:
         logger.error(f"{type(e).__name__}: {e}")
         return 101  # As per the PEP for "No usable evidence"
@@ -211,6 +253,9 @@ def run_who_owns(args: argparse.Namespace) -> int:
 # --- Handler for the `explain` command ---
 def run_explain(args: argparse.Namespace) -> int:
     """Handler for the 'explain' command."""
+    from .analysis import evidence as evidence_analyzer
+    from .collectors import pypi
+
     logger.info(f"Explaining evidence for package: {args.package}")
     try:
         metadata = pypi.fetch_package_metadata(args.package)
@@ -240,6 +285,8 @@ def run_explain(args: argparse.Namespace) -> int:
 def run_schema(args: argparse.Namespace) -> int:
     """Handler for the 'schema' command."""
     if args.target == "pypi-profile":
+        from .pypi_profile_export import PypiProfileExchange
+
         json_reporter.render_data(PypiProfileExchange.model_json_schema())
         return 0
     print(f"Error: Unknown schema target '{args.target}'.", file=sys.stderr)
@@ -256,10 +303,108 @@ def run_venv(args: argparse.Namespace) -> int:
 
 def run_reqs(args: argparse.Namespace) -> int:
     """Handler for the 'reqs' command."""
-    print("Executing 'reqs' command...")
-    print(f"  Requirements File: {args.requirements_file}")
-    # TODO: Implement the actual logic
-    return 200  # Placeholder for "No anonymous"
+    try:
+        specs = requirements.dedupe_specs(
+            requirements.parse_package_file(args.requirements_file)
+        )
+    except ConfigurationError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    logger.info(f"Executing 'reqs' for {len(specs)} packages")
+
+    results: List[schemas.PackageResult] = []
+    for name, version in specs:
+        try:
+            results.append(analyze_package(name, version, scan_depth=args.scan_depth))
+        except (NoEvidenceError, NetworkError) as e:
+            logger.error(f"Skipping {name}: {type(e).__name__}: {e}")
+
+    if args.output_format == "json":
+        json_reporter.render_data([dataclasses.asdict(r) for r in results])
+    else:
+        for result in results:
+            md_reporter.render(result)
+
+    if any(map(is_anonymous, results)) or len(results) < len(specs):
+        return 101
+    return 0
+
+
+def run_cache(args: argparse.Namespace) -> int:
+    """Handler for the 'cache' command."""
+    from .utils import artifact_store, cache_bundle
+
+    if args.cache_command == "gc":
+        result = artifact_store.collect_garbage()
+        print(
+            f"Removed {result['removed']} stored artifacts, "
+            f"freed {result['freed']} bytes ({result['remaining']} bytes remain)."
+        )
+        return 0
+    if args.cache_command == "show":
+        print(f"Cache directory: {os.path.abspath(cache.get_cache_dir())}")
+        for namespace, stats in cache.get_cache_stats().items():
+            print(f"  {namespace}: {stats['files']} files, {stats['bytes']} bytes")
+        return 0
+    if args.cache_command == "warm":
+        return run_cache_warm(args)
+    if args.cache_command == "export":
+        manifest = cache_bundle.export_bundle(args.output, args.namespace or None)
+        print(f"Exported {len(manifest['entries'])} cache entries to {args.output}.")
+        return 0
+    if args.cache_command == "import":
+        try:
+            summary = cache_bundle.import_bundle(args.bundle)
+        except CacheBundleError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        print(
+            f"Imported {summary['imported']} cache entries "
+            f"({summary['kept']} newer local entries kept, "
+            f"{summary['rejected']} rejected)."
+        )
+        return 0 if summary["rejected"] == 0 else 1
+    print(
+        f"Error: 'cache {args.cache_command}' is not yet implemented.", file=sys.stderr
+    )
+    return 2
+
+
+def run_cache_warm(args: argparse.Namespace) -> int:
+    """Handler for the 'cache warm' command."""
+    from . import prefetch
+
+    specs: List[PackageSpec] = []
+    for package in args.packages:
+        if parsed := requirements.parse_package_spec(package):
+            specs.append(parsed)
+    try:
+        for path in args.requirements:
+            specs.extend(requirements.parse_requirements_file(path))
+        for path in args.lockfile:
+            specs.extend(requirements.parse_lockfile(path))
+    except ConfigurationError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    specs = requirements.dedupe_specs(specs)
+    if not specs:
+        print("Error: No packages given to warm the cache for.", file=sys.stderr)
+        return 2
+
+    print(f"Warming caches for {len(specs)} packages...")
+    summary = prefetch.warm_caches(
+        specs,
+        jobs=args.jobs,
+        artifacts=not args.no_artifacts,
+        scan_depth=args.scan_depth,
+    )
+    print(
+        f"Fetched {summary['metadata']} metadata documents, "
+        f"{summary['artifacts']} artifacts, {summary['domains']} domains and "
+        f"{summary['urls']} URLs ({summary['failed']} failures)."
+    )
+    return 0 if summary["failed"] == 0 else 1
 
 
 # ... Add placeholder functions for other commands ...
@@ -278,6 +423,14 @@ def run_command(args: argparse.Namespace) -> int:
     # Prefer --verbose if set
     log_level = "DEBUG" if args.log_level == "DEBUG" else args.log_level
     setup_logging(log_level)
+    if getattr(args, "cache_dir", None):
+        CONFIG.setdefault("cache", {})["dir"] = args.cache_dir
+    if getattr(args, "offline", False):
+        CONFIG["offline"] = True
+    if getattr(args, "jobs", None):
+        CONFIG.setdefault("scan", {})["workers"] = args.jobs
+    if getattr(args, "ner_backend", None):
+        CONFIG.setdefault("ner", {})["backend"] = args.ner_backend
     command_handlers = {
         "who-owns": run_who_owns,
         "explain": run_explain,
@@ -285,7 +438,7 @@ def run_command(args: argparse.Namespace) -> int:
         "venv": run_venv,
         "reqs": run_reqs,
         # "graph": run_graph,
-        # "cache": run_cache,
+        "cache": run_cache,
         # "policy": run_policy,
     }
 
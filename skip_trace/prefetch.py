@@ -0,0 +1,165 @@
+# skip_trace/prefetch.py
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+from email.utils import getaddresses
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .collectors import package_files, pypi, urls, whois
+from .config import CONFIG
+from .exceptions import SkipTraceError
+from .utils import artifact_store
+from .utils.domains import registered_domain
+from .utils.requirements import PackageSpec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS = 8
+
+
+def _discover_targets(metadata: Dict[str, Any]) -> Tuple[Set[str], Set[str]]:
+    """
+    Finds the domains and homepage URLs an audit of this package would fetch.
+
+    Args:
+        metadata: The PyPI JSON metadata for the package.
+
+    Returns:
+        A tuple of (registered domains for RDAP, URLs for page content).
+    """
+    info = metadata.get("info", {}) or {}
+    ignored_domains = set(CONFIG.get("whois_ignored_domains", []))
+    domains: Set[str] = set()
+    page_urls: Set[str] = set()
+
+    for field in ("author_email", "maintainer_email"):
+        for _name, address in getaddresses([info.get(field) or ""]):
+            if "@" in address:
+                domain = address.rsplit("@", 1)[1].lower()
+                if domain not in ignored_domains:
+                    domains.add(domain)
+
+    candidate_urls = [info.get("home_page")]
+    project_urls = info.get("project_urls")
+    if isinstance(project_urls, dict):
+        candidate_urls.extend(project_urls.values())
+
+    for url in candidate_urls:
+        if not url or not isinstance(url, str):
+            continue
+        page_urls.add(url)
+        registered = registered_domain(url)
+        if registered and registered not in ignored_domains:
+            domains.add(registered)
+
+    return domains, page_urls
+
+
+def _run_all(
+    pool: concurrent.futures.ThreadPoolExecutor,
+    label: str,
+    func: Callable[[Any], Any],
+    items: List[Any],
+    summary: Dict[str, int],
+) -> List[Any]:
+    """Runs `func` over `items` in the pool, counting successes and failures."""
+    futures = {pool.submit(func, item): item for item in items}
+    results = []
+    for future in concurrent.futures.as_completed(futures):
+        item = futures[future]
+        try:
+            results.append(future.result())
+            summary[label] += 1
+        except SkipTraceError as e:
+            logger.warning(f"Could not prefetch {label} for {item}: {e}")
+            summary["failed"] += 1
+    return results
+
+
+def _fetch_distribution(
+    distribution: Dict[str, Any], package_name: str, scan_depth: str
+) -> None:
+    """
+    Fetches what a scan at `scan_depth` reads of a distribution: the core
+    metadata file for "metadata" (the artifact when none is served, as the
+    scan would fall back to it), else the artifact itself.
+    """
+    if scan_depth == "metadata" and (
+        package_files.fetch_core_metadata(distribution, package_name) is not None
+    ):
+        return
+    artifact_store.fetch_artifact(
+        distribution["url"],
+        distribution.get("filename") or distribution["url"].rsplit("/", 1)[-1],
+        (distribution.get("digests") or {}).get("sha256"),
+    )
+
+
+def warm_caches(
+    specs: List[PackageSpec],
+    jobs: Optional[int] = None,
+    artifacts: bool = True,
+    scan_depth: str = "quick",
+) -> Dict[str, int]:
+    """
+    Pre-populates the caches used by `who-owns` for a list of packages.
+
+    Fetches PyPI JSON, distribution artifacts, RDAP records for discovered
+    domains and homepage content concurrently. No scoring or NER is run.
+
+    Args:
+        specs: (name, version) tuples; a None version means the latest release.
+        jobs: Number of concurrent fetches.
+        artifacts: Whether to download distribution artifacts.
+        scan_depth: The scan depth the caches are warmed for, one of
+            `config.SCAN_DEPTHS`. It picks the distribution file the same way
+            the audit will, and "metadata" fetches only its core metadata.
+
+    Returns:
+        A dict counting fetched "metadata", "artifacts", "domains" and "urls",
+        plus the number of "failed" fetches.
+    """
+    summary = {"metadata": 0, "artifacts": 0, "domains": 0, "urls": 0, "failed": 0}
+    workers = jobs or DEFAULT_JOBS
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        all_metadata = _run_all(
+            pool,
+            "metadata",
+            lambda spec: pypi.fetch_package_metadata(spec[0], spec[1]),
+            specs,
+            summary,
+        )
+
+        # key -> (distribution entry, package name)
+        distributions: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        domains: Set[str] = set()
+        page_urls: Set[str] = set()
+        for metadata in all_metadata:
+            selection = package_files.select_distribution(metadata, scan_depth)
+            if artifacts and selection:
+                dist = selection[0]
+                key = (dist.get("digests") or {}).get("sha256") or dist.get("url")
+                if key and dist.get("url"):
+                    name = (metadata.get("info") or {}).get("name") or ""
+                    distributions[key] = (dist, name)
+            found_domains, found_urls = _discover_targets(metadata)
+            domains.update(found_domains)
+            page_urls.update(found_urls)
+
+        logger.info(
+            f"Prefetching {len(distributions)} artifacts, {len(domains)} domains "
+            f"and {len(page_urls)} URLs."
+        )
+        _run_all(
+            pool,
+            "artifacts",
+            lambda item: _fetch_distribution(item[0], item[1], scan_depth),
+            list(distributions.values()),
+            summary,
+        )
+        _run_all(pool, "domains", whois.lookup_domain, sorted(domains), summary)
+        _run_all(pool, "urls", urls.fetch_url_content, sorted(page_urls), summary)
+
+    return summary
@@ -73,6 +73,7 @@ class EvidenceKind(str, Enum):
     USER_PROFILE = "user-profile"
     USER_COMPANY = "user-company"
     URL_STATUS = "url-status"  # To track HTTP status of found URLs
+    ARTIFACT = "artifact"  # Which distribution file was scanned, and why
     # Sigstore-specific evidence kinds
     SIGSTORE_SIGNER_IDENTITY = "sigstore-signer-identity"
     SIGSTORE_BUILD_PROVENANCE = "sigstore-build-provenance"
@@ -1,4 +1,16 @@
 # skip_trace/utils/__init__.py
-from . import cache, http_client, validation
+from __future__ import annotations
 
-__all__ = ["cache", "http_client", "validation"]
+from .lazy_imports import submodule_getattr
+
+__all__ = [
+    "artifact_store",
+    "cache",
+    "domains",
+    "http_client",
+    "validation",
+]
+
+# Submodules load httpx (http_client) and email_validator (validation);
+# they are imported when first accessed.
+__getattr__ = submodule_getattr(__name__, __all__)
@@ -0,0 +1,162 @@
+# skip_trace/utils/archive_reader.py
+from __future__ import annotations
+
+import contextlib
+import functools
+import logging
+import posixpath
+import tarfile
+import zipfile
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .safe_targz import is_bad_path
+
+logger = logging.getLogger(__name__)
+
+ZIP_SUFFIXES = (".whl", ".zip")
+TAR_SUFFIXES = (".tar.gz", ".tgz", ".tar.bz2", ".tar.xz", ".tar")
+
+# Decides, from a member's path and uncompressed size alone, how many bytes to
+# read: None skips the member, -1 reads all of it.
+MemberSelector = Callable[[str, int], Optional[int]]
+
+
+def is_supported_archive(filename: str) -> bool:
+    """Returns True for the zip and tar formats `iter_members` can read."""
+    return filename.endswith(ZIP_SUFFIXES + TAR_SUFFIXES)
+
+
+def _member_path(name: str) -> Optional[str]:
+    """Normalizes a member name, or returns None if it is absolute or escapes the root."""
+    path = posixpath.normpath(name.replace("\\", "/"))
+    return None if is_bad_path(path) else path
+
+
+def _single_root(names: List[str]) -> Optional[str]:
+    """Returns the one top-level folder all names live under, if there is one."""
+    roots = {name.split("/", 1)[0] for name in names}
+    if len(roots) == 1 and all("/" in name for name in names):
+        return roots.pop()
+    return None
+
+
+def _zip_entries(archive: zipfile.ZipFile) -> List[Tuple[str, int, Any]]:
+    """Lists (path, size, member) for the regular files of a zip archive."""
+    entries = []
+    for member in archive.infolist():
+        name = _member_path(member.filename)
+        if not member.is_dir() and name is not None:
+            entries.append((name, member.file_size, member))
+    return entries
+
+
+def _tar_entries(archive: tarfile.TarFile) -> List[Tuple[str, int, Any]]:
+    """
+    Lists (path, size, member) for the regular files of a tar archive.
+
+    An sdist's single top-level `<name>-<version>/` folder is stripped, so
+    paths are relative to the project root. Links and special files are
+    skipped.
+    """
+    regular = [(m, _member_path(m.name)) for m in archive.getmembers() if m.isreg()]
+    members = [(m, name) for m, name in regular if name is not None]
+    root = _single_root([name for _, name in members])
+    return [
+        (name[len(root) + 1 :] if root else name, member.size, member)
+        for member, name in members
+    ]
+
+
+def _read_zip_member(archive: zipfile.ZipFile, member: Any, limit: int) -> bytes:
+    with archive.open(member) as f:
+        return f.read(limit)
+
+
+def _read_tar_member(archive: tarfile.TarFile, member: Any, limit: int) -> bytes:
+    f = archive.extractfile(member)
+    if f is None:
+        return b""
+    with f:
+        return f.read(limit)
+
+
+def iter_zip_members(
+    archive: zipfile.ZipFile, select: MemberSelector
+) -> Iterator[Tuple[str, bytes]]:
+    """
+    Yields (path, bytes) for the selected regular files of an open zip archive.
+
+    Members are filtered on their central-directory entry, so skipped members
+    are never decompressed (or, for remote archives, never fetched).
+    """
+    for name, size, member in _zip_entries(archive):
+        limit = select(name, size)
+        if limit is not None:
+            yield name, _read_zip_member(archive, member, limit)
+
+
+class OpenArchive:
+    """
+    A zip or tar archive opened for in-memory reads, see `open_archive`.
+
+    Attributes:
+        listing: (path, uncompressed size) of every regular file, in archive
+            order, with paths relative to the project root.
+    """
+
+    def __init__(
+        self,
+        entries: List[Tuple[str, int, Any]],
+        read: Callable[[Any, int], bytes],
+    ) -> None:
+        self._entries = entries
+        self._read = read
+        self.listing = [(name, size) for name, size, _ in entries]
+
+    def iter_selected(self, select: MemberSelector) -> Iterator[Tuple[str, bytes]]:
+        """Yields (path, bytes) for the members `select` picks, in archive order."""
+        for name, size, member in self._entries:
+            limit = select(name, size)
+            if limit is not None:
+                yield name, self._read(member, limit)
+
+    def iter_paths(self, paths: Iterable[str]) -> Iterator[Tuple[str, bytes]]:
+        """Yields (path, bytes) for the given members, in archive order."""
+        wanted = set(paths)
+        return self.iter_selected(lambda name, size: -1 if name in wanted else None)
+
+    def read_in_order(self, paths: List[str]) -> List[Tuple[str, bytes]]:
+        """
+        Reads the given members, returning them in the order asked for.
+
+        Members are still decompressed in archive order, which keeps tar
+        streams sequential.
+        """
+        data = dict(self.iter_paths(paths))
+        return [(name, data[name]) for name in paths if name in data]
+
+
+@contextlib.contextmanager
+def open_archive(path: str, filename: str) -> Iterator[OpenArchive]:
+    """
+    Opens a wheel, zip or tar archive for in-memory member reads.
+
+    The member listing is available before anything is decompressed, so
+    callers can decide what to read from the whole picture.
+
+    Args:
+        path: The local path of the archive.
+        filename: The published filename, used to detect the format.
+
+    Raises:
+        zipfile.BadZipFile, tarfile.TarError: If the archive is corrupt.
+        ValueError: If the format is not supported.
+    """
+    if filename.endswith(ZIP_SUFFIXES):
+        with zipfile.ZipFile(path) as zf:
+            yield OpenArchive(_zip_entries(zf), functools.partial(_read_zip_member, zf))
+    elif filename.endswith(TAR_SUFFIXES):
+        with tarfile.open(path, "r:*") as tf:
+            yield OpenArchive(_tar_entries(tf), functools.partial(_read_tar_member, tf))
+    else:
+        raise ValueError(f"Unsupported archive format for {filename}")
@@ -0,0 +1,242 @@
+# skip_trace/utils/artifact_store.py
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import CONFIG
+from ..exceptions import CollectorError, NetworkError
+from . import http_client
+from .cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Sub-directory of the cache dir holding the content-addressed artifacts
+ARTIFACT_NAMESPACE = "artifacts"
+# Extracted trees and their completion markers, left by versions that
+# unpacked archives next to them; archives are now scanned in memory.
+EXTRACTED_DIRNAME = "extracted"
+COMPLETE_MARKER = ".extracted"
+PARTIAL_SUFFIX = ".partial"
+
+
+def get_store_dir() -> str:
+    """Returns the root directory of the artifact store, creating it if needed."""
+    store_dir = os.path.join(get_cache_dir(), ARTIFACT_NAMESPACE)
+    os.makedirs(store_dir, exist_ok=True)
+    gitignore_path = os.path.join(store_dir, ".gitignore")
+    if not os.path.exists(gitignore_path):
+        with open(gitignore_path, "w", encoding="utf-8") as f:
+            f.write("*\n")
+    return store_dir
+
+
+def get_digest_dir(sha256: str) -> str:
+    """Returns the sharded directory that holds everything for one digest."""
+    sha256 = sha256.lower()
+    return os.path.join(get_store_dir(), sha256[:2], sha256)
+
+
+def _touch(path: str) -> None:
+    """Marks a store entry as recently used, for age-based garbage collection."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass  # nosec # noqa
+
+
+def lookup(sha256: str) -> Optional[str]:
+    """
+    Finds an already stored artifact by its sha256 digest.
+
+    Any filename stored under the digest is acceptable, since identical
+    content published under different version numbers is shared.
+
+    Args:
+        sha256: The hex sha256 digest published by PyPI.
+
+    Returns:
+        The path to the stored artifact, or None if it is not present.
+    """
+    digest_dir = get_digest_dir(sha256)
+    if not os.path.isdir(digest_dir):
+        return None
+    for entry in sorted(os.listdir(digest_dir)):
+        path = os.path.join(digest_dir, entry)
+        if (
+            os.path.isfile(path)
+            and not entry.startswith(".")
+            and not entry.endswith((PARTIAL_SUFFIX, ".sigstore"))
+        ):
+            _touch(digest_dir)
+            return path
+    return None
+
+
+def _stream_to_file(url: str, target_path: str) -> Tuple[str, int]:
+    """Streams a URL to a file, returning the sha256 hex digest and size."""
+    hasher = hashlib.sha256()
+    size = 0
+    with http_client.get_client().stream("GET", url) as response:
+        response.raise_for_status()
+        with open(target_path, "wb") as f:
+            for chunk in response.iter_bytes():
+                hasher.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+    return hasher.hexdigest(), size
+
+
+def fetch_artifact(url: str, filename: str, sha256: Optional[str]) -> str:
+    """
+    Returns a local path for an artifact, downloading it into the store if needed.
+
+    The digest is verified while streaming; a mismatch discards the download.
+    When no digest is published, the artifact is stored under the digest
+    computed from the downloaded bytes.
+
+    Args:
+        url: The download URL of the artifact.
+        filename: The artifact's filename, used to preserve the archive suffix.
+        sha256: The expected sha256 hex digest, if known.
+
+    Raises:
+        CollectorError: If the download fails or the digest does not match.
+
+    Returns:
+        The path to the verified artifact inside the store.
+    """
+    if sha256 and (existing := lookup(sha256)):
+        logger.info(f"Using stored artifact {existing} for sha256 {sha256[:12]}")
+        return existing
+
+    # Stage outside any digest dir so failed downloads never look like entries
+    partial_path = os.path.join(
+        get_store_dir(),
+        f"{filename}.{os.getpid()}-{threading.get_ident()}{PARTIAL_SUFFIX}",
+    )
+
+    logger.info(f"Downloading {filename} from {url}")
+    try:
+        actual, size = _stream_to_file(url, partial_path)
+    except (
+        NetworkError,
+        http_client.httpx.RequestError,
+        http_client.httpx.HTTPStatusError,
+        OSError,
+    ) as e:
+        _remove_quietly(partial_path)
+        raise CollectorError(f"Failed to download file {filename}: {e}") from e
+
+    if sha256 and actual != sha256.lower():
+        _remove_quietly(partial_path)
+        raise CollectorError(
+            f"Digest mismatch for {filename}: expected {sha256}, got {actual}"
+        )
+
+    final_dir = get_digest_dir(actual)
+    os.makedirs(final_dir, exist_ok=True)
+    final_path = os.path.join(final_dir, filename)
+    os.replace(partial_path, final_path)
+    logger.debug(f"Stored {filename} ({size} bytes) as sha256 {actual}")
+    return final_path
+
+
+def _remove_quietly(path: str) -> None:
+    """Removes a file, ignoring errors."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass  # nosec # noqa
+
+
+def _dir_size(path: str) -> int:
+    """Returns the total size in bytes of all files below a directory."""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+def list_entries() -> List[Dict[str, Any]]:
+    """
+    Lists the digests held by the store.
+
+    Returns:
+        A list of dicts with "sha256", "path", "size" and "last_used" keys.
+    """
+    store_dir = get_store_dir()
+    entries: List[Dict[str, Any]] = []
+    for shard in sorted(os.listdir(store_dir)):
+        shard_dir = os.path.join(store_dir, shard)
+        if not os.path.isdir(shard_dir):
+            continue
+        for digest in sorted(os.listdir(shard_dir)):
+            digest_dir = os.path.join(shard_dir, digest)
+            if not os.path.isdir(digest_dir):
+                continue
+            entries.append(
+                {
+                    "sha256": digest,
+                    "path": digest_dir,
+                    "size": _dir_size(digest_dir),
+                    "last_used": os.path.getmtime(digest_dir),
+                }
+            )
+    return entries
+
+
+def collect_garbage(
+    max_bytes: Optional[int] = None, max_age_seconds: Optional[float] = None
+) -> Dict[str, int]:
+    """
+    Removes store entries that are too old or exceed the size budget.
+
+    Entries unused for longer than `max_age_seconds` are removed first, then
+    the least recently used entries are removed until the store fits in
+    `max_bytes`. Limits default to the `cache` section of the configuration.
+
+    Args:
+        max_bytes: The maximum total size of the store.
+        max_age_seconds: The maximum time since an entry was last used.
+
+    Returns:
+        A dict with the number of "removed" entries, "freed" bytes and the
+        "remaining" store size.
+    """
+    cache_config = CONFIG.get("cache", {})
+    if max_bytes is None:
+        max_bytes = cache_config.get("artifact_max_bytes")
+    if max_age_seconds is None:
+        max_age_seconds = cache_config.get("artifact_max_age_seconds")
+
+    now = time.time()
+    entries = sorted(list_entries(), key=lambda e: e["last_used"])
+    total = sum(e["size"] for e in entries)
+    removed = 0
+    freed = 0
+
+    for entry in entries:
+        too_old = (
+            max_age_seconds is not None and (now - entry["last_used"]) > max_age_seconds
+        )
+        too_big = max_bytes is not None and total > max_bytes
+        if not (too_old or too_big):
+            continue
+        logger.debug(f"Removing stored artifact {entry['sha256']}")
+        shutil.rmtree(entry["path"], ignore_errors=True)
+        total -= entry["size"]
+        freed += entry["size"]
+        removed += 1
+
+    logger.info(f"Artifact store GC removed {removed} entries, freed {freed} bytes.")
+    return {"removed": removed, "freed": freed, "remaining": total}
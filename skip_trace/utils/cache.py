@@ -1,36 +1,77 @@
 # skip_trace/utils/cache.py
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import os
+import tempfile
 import time
-from typing import Any, Optional
+from typing import Any, Dict, Optional, cast
 
 from ..config import CONFIG
 
 logger = logging.getLogger(__name__)
 
 
-def get_cache_path(cache_type: str, key: str) -> str:
-    """Constructs the full path for a given cache type and key."""
+def get_cache_dir() -> str:
+    """Returns the root cache directory from the configuration."""
     cache_config = CONFIG.get("cache", {})
-    base_dir = cache_config.get("dir", ".skip_trace_cache")
-    cache_dir = os.path.join(base_dir, cache_type)
-    os.makedirs(cache_dir, exist_ok=True)
+    return cast(str, cache_config.get("dir", ".skip_trace_cache"))
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Summarizes the cache contents per namespace.
+
+    Returns:
+        A dict mapping each namespace to its "files" count and total "bytes".
+    """
+    stats: Dict[str, Dict[str, int]] = {}
+    base_dir = get_cache_dir()
+    if not os.path.isdir(base_dir):
+        return stats
+    for namespace in sorted(os.listdir(base_dir)):
+        namespace_dir = os.path.join(base_dir, namespace)
+        if not os.path.isdir(namespace_dir):
+            continue
+        files = 0
+        size = 0
+        for root, _dirs, names in os.walk(namespace_dir):
+            for name in names:
+                try:
+                    size += os.path.getsize(os.path.join(root, name))
+                    files += 1
+                except OSError:
+                    continue
+        stats[namespace] = {"files": files, "bytes": size}
+    return stats
 
-    # Sanitize key for filesystem compatibility
-    safe_key = "".join(c for c in key if c.isalnum() or c in ("-", "_", "."))
-    return os.path.join(cache_dir, f"{safe_key}.json")
+
+def get_cache_path(cache_type: str, key: str) -> str:
+    """
+    Constructs the full path for a given cache type and key.
+
+    The filename is the sha256 of the full key, sharded two levels deep
+    (e.g. `url/3f/a2/3fa2....json`), so distinct keys never collide and no
+    single directory grows huge.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    cache_dir = os.path.join(get_cache_dir(), cache_type, digest[:2], digest[2:4])
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, f"{digest}.json")
 
 
-def get_cached_data(cache_type: str, key: str) -> Optional[Any]:
+def get_cached_data(
+    cache_type: str, key: str, ttl_seconds: Optional[float] = None
+) -> Optional[Any]:
     """
     Retrieves data from the cache if it exists and is not expired.
 
     Args:
         cache_type: The category of the cache (e.g., 'whois').
         key: The unique identifier for the cached item.
+        ttl_seconds: Overrides the configured time-to-live for this lookup.
 
     Returns:
         The cached data, or None if not found or expired.
@@ -40,17 +81,26 @@ def get_cached_data(cache_type: str, key: str) -> Optional[Any]:
         return None
 
     file_path = get_cache_path(cache_type, key)
-    ttl = cache_config.get("ttl_seconds", 604800)  # Default to 7 days
+    ttl = ttl_seconds
+    if ttl is None:
+        ttl = cache_config.get("ttl_seconds", 604800)  # Default to 7 days
+    # Offline runs can't refresh anything, so any cached entry is usable
+    offline = CONFIG.get("offline", False)
 
     if os.path.exists(file_path):
         mod_time = os.path.getmtime(file_path)
-        if (time.time() - mod_time) < ttl:
+        if offline or (time.time() - mod_time) < ttl:
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                    entry = json.load(f)
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Could not read cache file {file_path}: {e}")
                 return None
+            # The entry records its original key; anything else is not ours
+            if not isinstance(entry, dict) or entry.get("key") != key:
+                logger.warning(f"Cache file {file_path} does not match key '{key}'")
+                return None
+            return entry.get("data")
     return None
 
 
@@ -58,6 +108,9 @@ def set_cached_data(cache_type: str, key: str, data: Any):
     """
     Writes data to the cache.
 
+    The entry is written to a temp file and renamed into place, so concurrent
+    readers see either the old entry or the new one, never a torn file.
+
     Args:
         cache_type: The category of the cache (e.g., 'whois').
         key: The unique identifier for the item to cache.
@@ -70,8 +123,16 @@ def set_cached_data(cache_type: str, key: str, data: Any):
         return
 
     file_path = get_cache_path(cache_type, key)
+    entry = {"key": key, "stored_at": time.time(), "data": data}
+    temp_path = None
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
-    except IOError as e:
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path), suffix=".partial"
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, indent=2, default=str)
+        os.replace(temp_path, file_path)
+    except (IOError, TypeError, ValueError) as e:
         logger.error(f"Could not write to cache file {file_path}: {e}")
+        if temp_path and os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -0,0 +1,262 @@
+# skip_trace/utils/cache_bundle.py
+from __future__ import annotations
+
+import datetime
+import hashlib
+import io
+import json
+import logging
+import os
+import tarfile
+import tempfile
+from typing import IO, Any, Dict, Iterable, List, Optional
+
+from ..exceptions import CacheBundleError
+from .artifact_store import ARTIFACT_NAMESPACE, COMPLETE_MARKER, EXTRACTED_DIRNAME
+from .cache import get_cache_dir
+from .safe_targz import is_bad_path, sanitize_member_name
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+# Members live under this prefix so the manifest can never be shadowed
+ENTRY_PREFIX = "cache/"
+DEFAULT_NAMESPACES = ["pypi", "rdap", "url", ARTIFACT_NAMESPACE]
+# Imports only ever write into these; the bundle's own manifest is not trusted
+IMPORTABLE_NAMESPACES = frozenset(DEFAULT_NAMESPACES)
+# Sidecars stored next to an artifact; they do not hash to its digest
+ARTIFACT_SIDECAR_SUFFIXES = (".sigstore",)
+
+
+def _sha256_file(path: str) -> str:
+    """Computes the sha256 hex digest of a file."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _is_exportable(relative_path: str) -> bool:
+    """Skips derived or transient files: extracted trees, markers, partials."""
+    parts = relative_path.split("/")
+    name = parts[-1]
+    if name in (".gitignore", COMPLETE_MARKER) or name.endswith(".partial"):
+        return False
+    return not (parts[0] == ARTIFACT_NAMESPACE and EXTRACTED_DIRNAME in parts[1:-1])
+
+
+def _iter_namespace_files(namespaces: Iterable[str]) -> Iterable[str]:
+    """Yields cache-relative POSIX paths of every exportable file."""
+    base_dir = get_cache_dir()
+    for namespace in namespaces:
+        namespace_dir = os.path.join(base_dir, namespace)
+        if not os.path.isdir(namespace_dir):
+            logger.info(f"Cache namespace '{namespace}' is empty, skipping.")
+            continue
+        for root, dirs, files in os.walk(namespace_dir):
+            dirs.sort()
+            for name in sorted(files):
+                relative = os.path.relpath(os.path.join(root, name), base_dir)
+                relative = relative.replace(os.sep, "/")
+                if _is_exportable(relative):
+                    yield relative
+
+
+def export_bundle(
+    output_path: str, namespaces: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Writes selected cache namespaces to a single portable .tar.gz bundle.
+
+    The bundle holds a manifest listing every entry with its size, sha256 and
+    modification time, which `import_bundle` uses for verification and for
+    resolving conflicts.
+
+    Args:
+        output_path: Where to write the bundle.
+        namespaces: The cache namespaces to include (defaults to pypi, rdap,
+            url and artifacts).
+
+    Returns:
+        The manifest that was written.
+    """
+    namespaces = namespaces or list(DEFAULT_NAMESPACES)
+    base_dir = get_cache_dir()
+    entries: List[Dict[str, Any]] = []
+
+    with tarfile.open(output_path, "w:gz") as tf:
+        for relative in _iter_namespace_files(namespaces):
+            full_path = os.path.join(base_dir, *relative.split("/"))
+            stat = os.stat(full_path)
+            entries.append(
+                {
+                    "path": relative,
+                    "size": stat.st_size,
+                    "sha256": _sha256_file(full_path),
+                    "mtime": stat.st_mtime,
+                }
+            )
+            tf.add(full_path, arcname=f"{ENTRY_PREFIX}{relative}", recursive=False)
+
+        manifest = {
+            "format": BUNDLE_FORMAT_VERSION,
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "namespaces": namespaces,
+            "entries": entries,
+        }
+        payload = json.dumps(manifest, indent=2).encode("utf-8")
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(payload)
+        info.mtime = int(datetime.datetime.now().timestamp())
+        tf.addfile(info, io.BytesIO(payload))
+
+    logger.info(f"Exported {len(entries)} cache entries to {output_path}")
+    return manifest
+
+
+def _is_importable(relative: str, entry: Dict[str, Any]) -> bool:
+    """
+    Checks that a bundle entry may be written to `relative` in the cache.
+
+    The namespace must be one the cache owns. Artifacts are content-addressed
+    as `artifacts/<shard>/<sha256>/<filename>`, so their manifest sha256 must
+    also be the digest of the directory they land in; `_write_verified` then
+    holds the bytes to that sha256.
+    """
+    if is_bad_path(relative):
+        return False
+    parts = relative.split("/")
+    if parts[0] not in IMPORTABLE_NAMESPACES:
+        return False
+    if parts[0] != ARTIFACT_NAMESPACE:
+        return True
+    if len(parts) != 4:
+        return False
+    _, shard, digest, name = parts
+    if len(digest) != 64 or shard != digest[:2]:
+        return False
+    try:
+        int(digest, 16)
+    except ValueError:
+        return False
+    if name.endswith(ARTIFACT_SIDECAR_SUFFIXES):
+        return True
+    return str(entry.get("sha256", "")).lower() == digest.lower()
+
+
+def _read_manifest(tf: tarfile.TarFile) -> Dict[str, Any]:
+    """Loads and sanity-checks the bundle manifest."""
+    try:
+        member = tf.getmember(MANIFEST_NAME)
+        stream = tf.extractfile(member)
+        if stream is None:
+            raise KeyError(MANIFEST_NAME)
+        manifest = json.load(stream)
+    except (KeyError, ValueError) as e:
+        raise CacheBundleError(f"Bundle has no readable manifest: {e}") from e
+    if manifest.get("format") != BUNDLE_FORMAT_VERSION:
+        raise CacheBundleError(
+            f"Unsupported bundle format {manifest.get('format')!r}, "
+            f"expected {BUNDLE_FORMAT_VERSION}"
+        )
+    return manifest
+
+
+def _write_verified(
+    target: str, stream: IO[bytes], entry: Dict[str, Any], mtime: float
+) -> bool:
+    """
+    Streams a bundle member to `target` via a temp file + rename.
+
+    The member is only moved into place when its size and sha256 match the
+    manifest entry. The original mtime is restored afterwards.
+
+    Returns:
+        True if the entry was written, False on a checksum mismatch.
+    """
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".partial")
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+                hasher.update(chunk)
+                size += len(chunk)
+                f.write(chunk)
+        if size != entry.get("size") or hasher.hexdigest() != entry.get("sha256"):
+            os.remove(temp_path)
+            return False
+        os.replace(temp_path, target)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    # Cache freshness is judged by mtime, so keep the fetch time from the bastion
+    os.utime(target, (mtime, mtime))
+    return True
+
+
+def import_bundle(bundle_path: str) -> Dict[str, int]:
+    """
+    Merges a bundle written by `export_bundle` into the local cache.
+
+    Every entry is checked against the manifest's size and sha256, and only
+    lands in the cache's own namespaces; stored artifacts must also hash to
+    their digest directory. When an entry already exists locally, the copy
+    with the newer timestamp wins.
+
+    Args:
+        bundle_path: Path to the bundle to import.
+
+    Raises:
+        CacheBundleError: If the bundle or its manifest is unreadable.
+
+    Returns:
+        A dict counting "imported", "kept" (local copy was newer) and
+        "rejected" (unsafe path, unknown namespace or checksum mismatch)
+        entries.
+    """
+    summary = {"imported": 0, "kept": 0, "rejected": 0}
+    base_dir = get_cache_dir()
+
+    try:
+        tf = tarfile.open(bundle_path, "r:*")
+    except (OSError, tarfile.TarError) as e:
+        raise CacheBundleError(f"Could not open cache bundle {bundle_path}: {e}") from e
+
+    with tf:
+        manifest = _read_manifest(tf)
+        for entry in manifest.get("entries", []):
+            relative = sanitize_member_name(str(entry.get("path", "")))
+            if not _is_importable(relative, entry):
+                logger.warning(f"Rejecting unsafe bundle entry {entry.get('path')!r}")
+                summary["rejected"] += 1
+                continue
+
+            target = os.path.join(base_dir, *relative.split("/"))
+            mtime = float(entry.get("mtime", 0))
+            if os.path.exists(target) and os.path.getmtime(target) >= mtime:
+                summary["kept"] += 1
+                continue
+
+            try:
+                member = tf.getmember(f"{ENTRY_PREFIX}{relative}")
+                stream = tf.extractfile(member) if member.isreg() else None
+            except KeyError:
+                stream = None
+            if stream is None or not _write_verified(target, stream, entry, mtime):
+                logger.warning(f"Checksum mismatch for bundle entry {relative}")
+                summary["rejected"] += 1
+                continue
+
+            summary["imported"] += 1
+
+    logger.info(
+        f"Imported {summary['imported']} cache entries from {bundle_path} "
+        f"({summary['kept']} kept, {summary['rejected']} rejected)."
+    )
+    return summary
@@ -0,0 +1,161 @@
+# skip_trace/utils/domains.py
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import re
+from typing import FrozenSet, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ICANN section of the Public Suffix List, bundled so that splitting a domain
+# never downloads anything. Refresh it with scripts/update_public_suffix_list.py.
+SUFFIX_LIST_PATH = os.path.join(os.path.dirname(__file__), "public_suffix_list.dat")
+# URLs seen in one run repeat a lot (project URLs, homepages, emails)
+EXTRACT_CACHE_SIZE = 4096
+
+# Scheme ("https://") or protocol-relative ("//") prefix of a URL
+SCHEME_RE = re.compile(r"^(?:[a-z][a-z0-9+.\-]*:)?//", re.IGNORECASE)
+VERSION_RE = re.compile(r"^//\s*VERSION:\s*(\S+)")
+IPV4_RE = re.compile(r"^\d{1,3}(?:\.\d{1,3}){3}$")
+
+
+class SuffixList(NamedTuple):
+    """The public suffix rules, as sets of dotted, lowercase names."""
+
+    version: str
+    rules: FrozenSet[str]
+    # "*.ck" is stored as "ck": every label under it is a suffix
+    wildcards: FrozenSet[str]
+    # "!www.ck" is stored as "www.ck": not a suffix despite a wildcard
+    exceptions: FrozenSet[str]
+
+
+class DomainParts(NamedTuple):
+    """A host split on its public suffix, like `tldextract.ExtractResult`."""
+
+    subdomain: str
+    domain: str
+    suffix: str
+
+    @property
+    def registered_domain(self) -> str:
+        """The domain plus its public suffix, "" when either is missing."""
+        if self.domain and self.suffix:
+            return f"{self.domain}.{self.suffix}"
+        return ""
+
+
+def _idna(name: str) -> Optional[str]:
+    """The punycode spelling of a non-ASCII rule, so encoded hosts match."""
+    if name.isascii():
+        return None
+    try:
+        return name.encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def load_suffix_list(path: str = SUFFIX_LIST_PATH) -> SuffixList:
+    """
+    Parses a public suffix list file once per process.
+
+    Args:
+        path: A file in the publicsuffix.org format.
+
+    Returns:
+        The rules, with every non-ASCII rule also stored in punycode.
+    """
+    version = "unknown"
+    rules: set = set()
+    wildcards: set = set()
+    exceptions: set = set()
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if match := VERSION_RE.match(line):
+                version = match.group(1)
+            if not line or line.startswith("//"):
+                continue
+            rule = line.split()[0].lower()
+            if rule.startswith("!"):
+                target, rule = exceptions, rule[1:]
+            elif rule.startswith("*."):
+                target, rule = wildcards, rule[2:]
+            else:
+                target = rules
+            target.add(rule)
+            if encoded := _idna(rule):
+                target.add(encoded)
+    logger.debug(f"Loaded public suffix list {version}: {len(rules)} rules")
+    return SuffixList(
+        version, frozenset(rules), frozenset(wildcards), frozenset(exceptions)
+    )
+
+
+def hostname(url: str) -> str:
+    """
+    Returns the lowercase host of a URL, or of a bare host name.
+
+    Scheme, user info, port, path, query and fragment are dropped.
+    """
+    rest = SCHEME_RE.sub("", url.strip(), count=1)
+    netloc = re.split(r"[/?#]", rest, maxsplit=1)[0]
+    host = netloc.rsplit("@", 1)[-1]
+    if host.startswith("["):
+        return host.split("]", 1)[0][1:].lower()  # IPv6 literal
+    return host.split(":", 1)[0].strip(".").lower()
+
+
+def _split_suffix(labels: Tuple[str, ...], suffixes: SuffixList) -> int:
+    """Returns the index of the first label of the longest public suffix."""
+    for index in range(len(labels)):
+        candidate = ".".join(labels[index:])
+        if candidate in suffixes.exceptions:
+            return index + 1
+        if candidate in suffixes.rules:
+            return index
+        if index + 1 < len(labels) and ".".join(labels[index + 1 :]) in (
+            suffixes.wildcards
+        ):
+            return index
+    return len(labels)
+
+
+@functools.lru_cache(maxsize=EXTRACT_CACHE_SIZE)
+def extract(url: str) -> DomainParts:
+    """
+    Splits the host of a URL into subdomain, domain and public suffix.
+
+    Uses the bundled suffix list, so no network is touched. Hosts without a
+    known suffix (IP addresses, "localhost", unknown TLDs) keep their last
+    label as the domain and get an empty suffix.
+
+    Args:
+        url: A URL or a bare host name.
+
+    Returns:
+        The parts, empty strings where a part is missing.
+    """
+    host = hostname(url)
+    if not host:
+        return DomainParts("", "", "")
+    if IPV4_RE.match(host) or ":" in host:
+        return DomainParts("", host, "")
+    labels = tuple(host.split("."))
+    start = _split_suffix(labels, load_suffix_list())
+    if start == 0:
+        return DomainParts("", "", host)
+    return DomainParts(
+        ".".join(labels[: start - 1]), labels[start - 1], ".".join(labels[start:])
+    )
+
+
+def registered_domain(url: str) -> str:
+    """
+    Returns the domain a URL's host is registered under ("docs.python.org" ->
+    "python.org"), or "" when it has none.
+    """
+    return extract(url).registered_domain
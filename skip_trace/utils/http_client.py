@@ -49,9 +49,20 @@ def normalize_url(url: str) -> Optional[str]:
     return cleaned_url
 
 
+def is_offline() -> bool:
+    """Returns True when the run must be served purely from the local cache."""
+    return bool(CONFIG.get("offline", False))
+
+
 def get_client() -> httpx.Client:
-    """Returns a shared httpx.Client instance."""
+    """
+    Returns a shared httpx.Client instance.
+
+    :raises NetworkError: In offline mode, where no request may be made.
+    """
     global _client
+    if is_offline():
+        raise NetworkError("Offline mode is enabled; network access is disabled.")
     if _client is None:
         http_config = CONFIG.get("http", {})
         _client = httpx.Client(
@@ -122,6 +133,9 @@ def make_request_safe(url: str) -> Optional[httpx.Response]:
     if not clean_url:
         logger.debug(f"Skipping invalid or unsupported URL: '{url}'")
         return None
+    if is_offline():
+        logger.debug(f"Offline mode, not fetching {clean_url}")
+        return None
 
     logger.info(f"Looking at {clean_url}")
     client = get_client()
@@ -0,0 +1,29 @@
+# skip_trace/utils/lazy_imports.py
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Sequence
+
+
+def submodule_getattr(package: str, submodules: Sequence[str]) -> Callable[[str], Any]:
+    """
+    Builds a module-level `__getattr__` (PEP 562) for a package.
+
+    The returned function imports a listed submodule the first time it is
+    accessed as an attribute of the package, so `from .utils import cache`
+    keeps working while importing the package loads none of them.
+
+    Args:
+        package: The package's `__name__`.
+        submodules: The submodule names to expose, usually its `__all__`.
+
+    Returns:
+        The function to bind to `__getattr__` in the package's `__init__`.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -0,0 +1,149 @@
+# skip_trace/utils/remote_zip.py
+from __future__ import annotations
+
+import io
+import logging
+import re
+import zipfile
+from typing import List, Optional, Tuple
+
+from ..exceptions import NetworkError, RangeNotSupportedError
+from . import http_client
+
+logger = logging.getLogger(__name__)
+
+# The first request fetches this much of the archive tail, which holds the
+# central directory of all but the largest wheels.
+TAIL_FETCH_BYTES = 64 * 1024
+# Reads smaller than this are widened, so a member's local header and its
+# data usually arrive in a single request.
+MIN_FETCH_BYTES = 32 * 1024
+CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+class HttpRangeFile(io.RawIOBase):
+    """
+    A read-only, seekable file backed by HTTP Range requests.
+
+    Fetched spans are kept in memory, so `zipfile` can re-read the central
+    directory and member headers without touching the network again.
+    """
+
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self.url = url
+        self.requests = 0
+        self.bytes_fetched = 0
+        self._pos = 0
+        self._spans: List[Tuple[int, bytes]] = []
+        start, data, self.size = self._fetch(f"bytes=-{TAIL_FETCH_BYTES}")
+        self._spans.append((start, data))
+
+    def _fetch(self, byte_range: str) -> Tuple[int, bytes, int]:
+        """
+        Issues one Range request.
+
+        Raises:
+            RangeNotSupportedError: If the server answers with the full body.
+            NetworkError: On connection or HTTP errors.
+
+        Returns:
+            A tuple of (start offset, data, total archive size).
+        """
+        try:
+            with http_client.get_client().stream(
+                "GET", self.url, headers={"Range": byte_range}
+            ) as response:
+                if response.status_code != 206:
+                    response.raise_for_status()
+                    raise RangeNotSupportedError(
+                        f"{self.url} does not support range requests "
+                        f"(status {response.status_code})"
+                    )
+                match = CONTENT_RANGE_RE.match(
+                    response.headers.get("Content-Range", "")
+                )
+                if not match:
+                    raise RangeNotSupportedError(
+                        f"{self.url} sent no usable Content-Range header"
+                    )
+                data = response.read()
+        except http_client.httpx.HTTPError as e:
+            raise NetworkError(f"Range request to {self.url} failed: {e}") from e
+
+        self.requests += 1
+        self.bytes_fetched += len(data)
+        return int(match.group(1)), data, int(match.group(3))
+
+    def _cached(self, start: int, end: int) -> Optional[bytes]:
+        """Returns bytes [start, end) if a single fetched span covers them."""
+        for span_start, data in self._spans:
+            if span_start <= start and end <= span_start + len(data):
+                return data[start - span_start : end - span_start]
+        return None
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._pos = max(0, self._pos)
+        return self._pos
+
+    def readinto(self, buffer) -> int:  # type: ignore[no-untyped-def]
+        end = min(self._pos + len(buffer), self.size)
+        if end <= self._pos:
+            return 0
+        data = self._cached(self._pos, end)
+        if data is None:
+            fetch_end = min(max(end, self._pos + MIN_FETCH_BYTES), self.size)
+            start, fetched, _ = self._fetch(f"bytes={self._pos}-{fetch_end - 1}")
+            self._spans.append((start, fetched))
+            data = fetched[self._pos - start : end - start]
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+
+def open_remote_zip(url: str) -> Tuple[zipfile.ZipFile, HttpRangeFile]:
+    """
+    Opens a remote zip archive without downloading it.
+
+    Only the central directory is fetched up front; member data is fetched
+    on demand when a member is read.
+
+    Args:
+        url: The URL of the archive.
+
+    Raises:
+        RangeNotSupportedError: If the server does not honour Range requests.
+        NetworkError: On connection or HTTP errors, or if the archive is not
+            a valid zip file.
+
+    Returns:
+        A tuple of the ZipFile and the underlying range file, whose
+        `requests` and `bytes_fetched` counters describe the transfer.
+    """
+    remote = HttpRangeFile(url)
+    try:
+        archive = zipfile.ZipFile(remote)
+    except zipfile.BadZipFile as e:
+        raise NetworkError(f"Remote archive {url} is not a valid zip: {e}") from e
+    logger.debug(
+        f"Read central directory of {url} ({remote.size} bytes) "
+        f"with {remote.requests} range requests"
+    )
+    return archive, remote
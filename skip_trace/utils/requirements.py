@@ -0,0 +1,180 @@
+# skip_trace/utils/requirements.py
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Use tomllib if available (Python 3.11+), otherwise fall back to tomli
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # type: ignore
+
+from ..exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# (package name, pinned version or None)
+PackageSpec = Tuple[str, Optional[str]]
+
+# A PEP 508 name, optional extras, then whatever specifier follows
+REQUIREMENT_RE = re.compile(
+    r"^(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*"
+    r"(?:\[[^\]]*\])?\s*(?P<spec>.*)$"
+)
+# An exact pin, the only specifier that identifies a single release
+PIN_RE = re.compile(r"^===?\s*(?P<version>[^\s,;*]+)$")
+# Per-requirement pip options ("--hash=sha256:...", "--config-settings ...")
+# and everything after the first of them
+OPTIONS_RE = re.compile(r"\s+-{1,2}[A-Za-z].*$", re.DOTALL)
+
+TOML_LOCKFILES = {"uv.lock": "package", "poetry.lock": "package"}
+
+
+def parse_package_spec(spec: str) -> Optional[PackageSpec]:
+    """
+    Parses a single requirement such as "requests==2.32.3" or "rich[jupyter]>=13".
+
+    Line continuations and per-requirement options such as the `--hash`
+    values pip-compile adds are ignored, so hashed pins keep their version.
+
+    Args:
+        spec: The requirement string.
+
+    Returns:
+        A (name, version) tuple, where version is only set for exact pins, or
+        None for URLs, paths and unparsable lines.
+    """
+    spec = OPTIONS_RE.sub("", spec.replace("\\\n", " "))
+    spec = spec.split(";", 1)[0].strip()
+    if not spec or "://" in spec or spec.startswith((".", "/", "git+")):
+        return None
+    match = REQUIREMENT_RE.match(spec)
+    if not match:
+        return None
+    version = None
+    if pin := PIN_RE.match(match.group("spec").strip()):
+        version = pin.group("version")
+    return match.group("name"), version
+
+
+def parse_requirements_file(
+    path: str, _seen: Optional[Set[str]] = None
+) -> List[PackageSpec]:
+    """
+    Parses a pip requirements file, following nested `-r` includes.
+
+    Args:
+        path: Path to the requirements file.
+
+    Returns:
+        A list of (name, version) tuples in file order.
+    """
+    seen = _seen if _seen is not None else set()
+    real_path = os.path.realpath(path)
+    if real_path in seen:
+        return []
+    seen.add(real_path)
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            raw = f.read()
+    except OSError as e:
+        raise ConfigurationError(f"Could not read requirements file {path}: {e}") from e
+
+    specs: List[PackageSpec] = []
+    for line in raw.replace("\\\n", " ").splitlines():
+        line = re.sub(r"(^|\s)#.*$", "", line).strip()
+        if not line:
+            continue
+        if line.startswith("-"):
+            include = re.match(r"^(?:-r|--requirement)[\s=]+(\S+)", line)
+            if include:
+                nested = os.path.join(os.path.dirname(path), include.group(1))
+                specs.extend(parse_requirements_file(nested, seen))
+            continue  # Other pip options don't name packages
+        if parsed := parse_package_spec(line):
+            specs.append(parsed)
+        else:
+            logger.debug(f"Skipping unsupported requirement line: {line}")
+    return specs
+
+
+def _parse_toml_lockfile(data: Dict[str, Any], table: str) -> List[PackageSpec]:
+    """Reads name/version pairs from the package array of a TOML lockfile."""
+    specs: List[PackageSpec] = []
+    for package in data.get(table, []) or []:
+        source = package.get("source") or {}
+        # Skip the project itself and local path dependencies
+        if isinstance(source, dict) and (
+            source.get("editable") or source.get("virtual") or source.get("directory")
+        ):
+            continue
+        if name := package.get("name"):
+            specs.append((name, package.get("version")))
+    return specs
+
+
+def parse_lockfile(path: str) -> List[PackageSpec]:
+    """
+    Parses uv.lock, poetry.lock, pylock.toml or Pipfile.lock files.
+
+    Args:
+        path: Path to the lockfile.
+
+    Raises:
+        ConfigurationError: If the file cannot be read or its format is unknown.
+
+    Returns:
+        A list of (name, version) tuples in file order.
+    """
+    filename = os.path.basename(path).lower()
+    try:
+        if filename == "pipfile.lock":
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            specs: List[PackageSpec] = []
+            for section in ("default", "develop"):
+                for name, entry in (data.get(section) or {}).items():
+                    version = str(entry.get("version", "")).lstrip("=") or None
+                    specs.append((name, version))
+            return specs
+
+        with open(path, "rb") as f:
+            toml_data = tomllib.load(f)
+    except (OSError, ValueError) as e:
+        raise ConfigurationError(f"Could not read lockfile {path}: {e}") from e
+
+    if filename in TOML_LOCKFILES:
+        return _parse_toml_lockfile(toml_data, TOML_LOCKFILES[filename])
+    if filename.startswith("pylock.") and filename.endswith(".toml"):
+        return _parse_toml_lockfile(toml_data, "packages")
+    raise ConfigurationError(f"Unsupported lockfile format: {path}")
+
+
+def parse_package_file(path: str) -> List[PackageSpec]:
+    """Parses a requirements file or lockfile, detected from its filename."""
+    filename = os.path.basename(path).lower()
+    if (
+        filename in TOML_LOCKFILES
+        or filename == "pipfile.lock"
+        or (filename.startswith("pylock.") and filename.endswith(".toml"))
+    ):
+        return parse_lockfile(path)
+    return parse_requirements_file(path)
+
+
+def dedupe_specs(specs: List[PackageSpec]) -> List[PackageSpec]:
+    """Removes repeated packages (by normalized name), keeping the first entry."""
+    seen: Set[str] = set()
+    unique: List[PackageSpec] = []
+    for name, version in specs:
+        key = re.sub(r"[-_.]+", "-", name).lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append((name, version))
+    return unique
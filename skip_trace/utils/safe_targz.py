@@ -28,15 +28,19 @@ def _is_within(base: Path, target: Path) -> bool:
         return False
 
 
-def _sanitize_member_name(name: str) -> str:
-    # Tar paths are POSIX; normalize and strip leading "./"
+def sanitize_member_name(name: str) -> str:
+    """Normalizes an archive member path; tar paths are POSIX, "./" is stripped."""
     name = name.lstrip("./")
     name = posix_normpath(name)
     return name
 
 
-def _is_bad_path(name: str) -> bool:
-    # Reject absolute paths, Windows drive letters, parent traversal
+def is_bad_path(name: str) -> bool:
+    """
+    Returns True for member paths that must not be written under a target
+    directory: empty, absolute, Windows drive-letter or parent-traversal paths.
+    Pass them through `sanitize_member_name` first.
+    """
     if not name or name == ".":
         return True
     if name.startswith("/") or name.startswith("\\"):
@@ -51,8 +55,8 @@ def _iter_safe_members(
     tf: TarFile, dest: Path, allow_symlinks: bool
 ) -> Iterable[Tuple[TarInfo, Path]]:
     for m in tf.getmembers():
-        clean = _sanitize_member_name(m.name)
-        if _is_bad_path(clean):
+        clean = sanitize_member_name(m.name)
+        if is_bad_path(clean):
             continue
         out_path = dest / Path(*PurePosixPath(clean).parts)
         if not _is_within(dest, out_path):
@@ -68,8 +72,8 @@ def _iter_safe_members(
                 continue
             # Only allow relative symlink targets that stay inside dest
             link = m.linkname or ""
-            link = _sanitize_member_name(link)
-            if _is_bad_path(link):
+            link = sanitize_member_name(link)
+            if is_bad_path(link):
                 continue
             # Compute where the symlink would point to
             # (symlink is created relative to out_path.parent)
@@ -1,7 +1,9 @@
 # skip_trace/utils/validation.py
 from __future__ import annotations
 
+import functools
 import logging
+import re
 from typing import Optional
 
 from email_validator import EmailNotValidError, validate_email
@@ -17,36 +19,72 @@ RESERVED_DOMAINS = {
 }
 
 RESERVED_SUFFIXES = {".test", ".example", ".invalid", ".localhost"}
+# The same, as last labels: "test", "example", ...
+RESERVED_TLDS = frozenset(suffix.lstrip(".") for suffix in RESERVED_SUFFIXES)
 
+# Scans see the same addresses in file after file, so results are memoized
+EMAIL_CACHE_SIZE = 65536
+# Longest address email_validator accepts
+MAX_EMAIL_LENGTH = 254
+# Shape every address email_validator accepts has: one "@", no whitespace and
+# a dotted domain. Strings without it are rejected without calling it.
+EMAIL_SHAPE_RE = re.compile(r"[^@\s.][^@\s]*@[^@\s.][^@\s]*\.[^@\s]*[^@\s.]")
 
-def is_valid_email(email_string: str) -> Optional[str]:
+
+def is_reserved_domain(domain: str) -> bool:
     """
-    Checks if a string is a valid email address using a robust library.
+    Checks whether a domain is, or is under, a domain or TLD reserved for
+    examples and testing ("example.com", "docs.example.org", "foo.test").
+    """
+    labels = domain.lower().rstrip(".").split(".")
+    if labels[-1] in RESERVED_TLDS:
+        return True
+    return any(".".join(labels[i:]) in RESERVED_DOMAINS for i in range(len(labels)))
 
-    Args:
-        email_string: The string to validate.
 
-    Returns:
-        The normalized email address if valid, otherwise None.
-    """
-    if not isinstance(email_string, str):
+def _looks_like_email(email_string: str) -> bool:
+    """Cheap syntactic pre-check that only rejects what validation would."""
+    return len(email_string) <= MAX_EMAIL_LENGTH and bool(
+        EMAIL_SHAPE_RE.fullmatch(email_string)
+    )
+
+
+@functools.lru_cache(maxsize=EMAIL_CACHE_SIZE)
+def _validate(email_string: str) -> Optional[str]:
+    """Validates one candidate string, see `is_valid_email`."""
+    if not _looks_like_email(email_string):
+        return None
+    if is_reserved_domain(email_string.rsplit("@", 1)[1]):
         return None
 
     try:
         # We only care about syntactic validity, not whether the domain's
         # mail server is reachable, so we disable deliverability checks.
         valid = validate_email(email_string, check_deliverability=False)
+    except EmailNotValidError as e:
+        logger.debug(f"String '{email_string}' is not a valid email: {e}")
+        return None
 
-        for reserved in RESERVED_DOMAINS:
-            if valid.domain.endswith(reserved):
-                return None
+    # IDNA normalization can turn a domain into a reserved one
+    if is_reserved_domain(valid.domain):
+        return None
+    return valid.normalized
 
-        if valid.domain in RESERVED_DOMAINS or any(
-            valid.domain.endswith(suffix) for suffix in RESERVED_SUFFIXES
-        ):
-            return None
 
-        return valid.normalized
-    except EmailNotValidError as e:
-        logger.debug(f"String '{email_string}' is not a valid email: {e}")
+def is_valid_email(email_string: str) -> Optional[str]:
+    """
+    Checks if a string is a valid email address using a robust library.
+
+    Strings without the shape of an address and addresses at reserved
+    domains are rejected before the full validator runs, and results are
+    memoized, so only new candidates reach it.
+
+    Args:
+        email_string: The string to validate.
+
+    Returns:
+        The normalized email address if valid, otherwise None.
+    """
+    if not isinstance(email_string, str):
         return None
+    return _validate(email_string)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import pytest
 
+from skip_trace.config import CONFIG
 from skip_trace.exceptions import NetworkError
 from skip_trace.utils import http_client
 
@@ -17,3 +18,10 @@ def require_pypi():
         http_client.make_request(PYPI_PING_URL)
     except NetworkError as e:
         pytest.skip(f"PyPI unreachable for integration tests: {e}")
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path_factory, monkeypatch):
+    """Keep caches written by scans out of the working tree and between tests."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setitem(CONFIG, "cache", {**CONFIG["cache"], "dir": str(cache_dir)})
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+
+from skip_trace.analysis import evidence_cache, file_scanner
+from skip_trace.config import CONFIG
+
+LICENSE = b"Copyright (c) 2020 Jane Doe <jane@acme.io>\nSee https://acme.io/license\n"
+CODE = b'__author__ = "Jane Doe <jane@acme.io>"\n'
+
+
+def snapshot(evidence):
+    return [(e.id, e.locator, e.value, e.notes, e.confidence) for e in evidence]
+
+
+def test_cached_evidence_is_relocated(monkeypatch) -> None:
+    file_scanner.scan_files(
+        [("LICENSE", LICENSE), ("demo/__init__.py", CODE)], "demo-1.0", workers=1
+    )
+    moved = [("LICENSE", LICENSE), ("src/demo/__init__.py", CODE)]
+
+    cached = file_scanner.scan_files(moved, "demo-2.0", workers=1)
+    monkeypatch.setitem(CONFIG, "scan", {**CONFIG["scan"], "evidence_cache": False})
+    fresh = file_scanner.scan_files(moved, "demo-2.0", workers=1)
+
+    assert cached and snapshot(cached) == snapshot(fresh)
+
+
+def test_unseen_content_is_scanned(monkeypatch) -> None:
+    file_scanner.scan_files([("LICENSE", LICENSE)], "demo-1.0", workers=1)
+    scanned = []
+    real_scan_text = file_scanner._scan_text
+
+    def counting_scan_text(content, relative_path, *args):
+        scanned.append(relative_path)
+        return real_scan_text(content, relative_path, *args)
+
+    monkeypatch.setattr(file_scanner, "_scan_text", counting_scan_text)
+    file_scanner.scan_files(
+        [("LICENSE", LICENSE), ("demo/__init__.py", CODE)], "demo-1.1", workers=1
+    )
+
+    assert scanned == ["demo/__init__.py"]
+
+
+def test_only_files_that_did_work_are_stored(monkeypatch) -> None:
+    stored = []
+    monkeypatch.setattr(
+        evidence_cache, "store", lambda digest, path, *args: stored.append(path)
+    )
+    file_scanner.scan_files(
+        [
+            ("LICENSE", LICENSE),
+            ("demo/util.py", b"def add(a, b):\n    return a + b\n"),
+            ("demo/deco.py", b"@property\ndef x(self):\n    pass\n"),
+        ],
+        "demo-1.0",
+        workers=1,
+    )
+
+    # deco.py gave no evidence, but its "@" ran the email extractor
+    assert stored == ["LICENSE", "demo/deco.py"]
+
+
+def test_key_depends_on_project_file_role_and_boilerplate(monkeypatch) -> None:
+    setup_py = (
+        b"# Contact: jane@acme.io\n"
+        b"from setuptools import setup\n"
+        b'setup(author="Jane Doe")\n'
+    )
+    file_scanner.scan_files(
+        [("tests/fixtures/setup.py", setup_py)], "demo-1.0", workers=1
+    )
+    root = file_scanner.scan_files([("setup.py", setup_py)], "demo-1.0", workers=1)
+
+    # The nested copy is scanned as text; the root file declares its author
+    assert {"name": "Jane Doe"} in [e.value for e in root]
+
+    key = evidence_cache._cache_key("ab" * 32, "LICENSE", True, True)
+    monkeypatch.setitem(
+        CONFIG, "scan", {**CONFIG["scan"], "license_boilerplate": False}
+    )
+    assert evidence_cache._cache_key("ab" * 32, "LICENSE", True, True) != key
+
+
+def test_parse_record_digests() -> None:
+    digest = hashlib.sha256(CODE).digest()
+    encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    record = (
+        f"demo/__init__.py,sha256={encoded},{len(CODE)}\n"
+        "demo-1.0.dist-info/RECORD,,\n"
+    )
+
+    assert evidence_cache.parse_record_digests(record) == {
+        "demo/__init__.py": digest.hex()
+    }
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import builtins
+import gc
+
+from skip_trace.analysis import file_scanner, source_scanner, url_scanner
+from skip_trace.config import CONFIG
+from skip_trace.schemas import EvidenceKind
+
+
+def make_tree(root) -> None:
+    (root / "demo").mkdir()
+    (root / "demo" / "__init__.py").write_text(
+        '__author__ = "Jane Doe <jane@acme.io>"\n# docs: https://acme.io/demo\n'
+    )
+    (root / "AUTHORS").write_text("Jane Doe <jane@acme.io>\n")
+    (root / "README.md").write_text("[Docs](https://docs.acme.io)\n")
+    (root / "demo" / "blob.dat").write_bytes(b"\0\1\2" * 100)
+    (root / "__pycache__").mkdir()
+    (root / "__pycache__" / "x.txt").write_text("https://skipped.example\n")
+
+
+def test_single_pass_matches_separate_scanners(tmp_path) -> None:
+    make_tree(tmp_path)
+
+    combined = file_scanner.scan_directory(str(tmp_path), "demo-1.0")
+    separate = source_scanner.scan_directory(
+        str(tmp_path), "demo-1.0"
+    ) + url_scanner.scan_directory_for_urls(str(tmp_path), "demo-1.0")
+
+    assert [e.id for e in combined] == [e.id for e in separate]
+    kinds = {e.kind for e in combined}
+    assert {EvidenceKind.AUTHOR_TAG, EvidenceKind.PROJECT_URL} <= kinds
+    assert not any("skipped.example" in str(e.value) for e in combined)
+
+
+def test_each_file_is_opened_once(tmp_path, monkeypatch) -> None:
+    make_tree(tmp_path)
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(path, *args, **kwargs):
+        if str(path).startswith(str(tmp_path)):
+            opened.append(str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    file_scanner.scan_directory(str(tmp_path), "demo-1.0")
+
+    assert len(opened) == len(set(opened)) == 4
+
+
+def test_each_file_is_decoded_once_for_on_text(tmp_path, monkeypatch) -> None:
+    make_tree(tmp_path)
+    decoded = []
+    real_decode = source_scanner.decode_text
+
+    def counting_decode(data):
+        decoded.append(data)
+        return real_decode(data)
+
+    monkeypatch.setattr(source_scanner, "decode_text", counting_decode)
+    seen = {}
+    file_scanner.scan_files(
+        file_scanner.iter_directory_files(str(tmp_path)),
+        "demo-1.0",
+        on_text=seen.__setitem__,
+        workers=1,
+    )
+
+    assert seen["AUTHORS"] == "Jane Doe <jane@acme.io>\n"
+    assert len(decoded) == len(seen) == 3
+
+
+def test_copyright_candidates_are_extracted_once(monkeypatch) -> None:
+    calls = []
+    real = source_scanner.copyright_candidates
+
+    def counting(content, triggers=None):
+        calls.append(content)
+        return real(content, triggers)
+
+    monkeypatch.setattr(source_scanner, "copyright_candidates", counting)
+    files = [(f"mod{i}.py", b"# Copyright 2024 Acme Ltd\n") for i in range(3)]
+    file_scanner.scan_files(files, "demo-1.0", urls=False, workers=1)
+
+    assert len(calls) == 3
+
+
+def test_process_pool_gives_the_same_evidence_in_the_same_order(
+    tmp_path, monkeypatch
+) -> None:
+    for i in range(30):
+        (tmp_path / f"mod{i:02}.py").write_text(
+            f'__author__ = "Dev {i} <dev{i}@acme.io>"\n'
+            "# Contact: shared@acme.io, see https://acme.io\n"
+        )
+    monkeypatch.setitem(CONFIG, "scan", {**CONFIG["scan"], "parallel_min_files": 5})
+    monkeypatch.setattr(file_scanner, "CHUNK_MAX_FILES", 4)
+
+    files = list(file_scanner.iter_directory_files(str(tmp_path)))
+    serial = file_scanner.scan_files(files, "demo-1.0", workers=1)
+    parallel = file_scanner.scan_files(files, "demo-1.0", workers=2)
+
+    assert [e.id for e in parallel] == [e.id for e in serial]
+    # The shared contact address is reported once, as in a serial scan
+    shared = [e for e in parallel if e.value.get("email") == "shared@acme.io"]
+    assert len(shared) == 1
+
+
+def test_preload_pool_forks_after_loading_ner(monkeypatch) -> None:
+    loads = []
+    monkeypatch.setattr(file_scanner.ner, "_get_nlp_model", lambda: loads.append(1))
+
+    with file_scanner._pool_context() as context:
+        assert context.get_start_method() == "fork"
+        assert loads == [1]
+        assert gc.get_freeze_count() > 0
+    assert gc.get_freeze_count() == 0
+
+    monkeypatch.setitem(CONFIG, "scan", {**CONFIG["scan"], "worker_start": "spawn"})
+    with file_scanner._pool_context() as context:
+        assert context.get_start_method() == "spawn"
+
+
+def test_plan_scan_orders_by_yield_and_respects_budgets() -> None:
+    entries = [
+        ("demo/deep/nested/module.py", 100),
+        ("docs/guide.rst", 100),
+        ("README.md", 100),
+        ("demo/__init__.py", 100),
+        ("LICENSE", 100),
+        ("demo.dist-info/METADATA", 100),
+        ("demo/core.py", 100),
+        ("demo/_speedups.so", 100),
+        ("big/AUTHORS", 10_000),
+    ]
+
+    plan = file_scanner.plan_scan(
+        entries, max_files=100, max_bytes=10**6, max_member_bytes=1_000
+    )
+    assert plan == [
+        "demo.dist-info/METADATA",
+        "LICENSE",
+        "README.md",
+        "demo/__init__.py",
+        "demo/core.py",
+        "docs/guide.rst",
+        "demo/deep/nested/module.py",
+    ]
+
+    assert file_scanner.plan_scan(
+        entries, max_files=2, max_bytes=10**6, max_member_bytes=10**6
+    ) == ["demo.dist-info/METADATA", "LICENSE"]
+    # The oversized AUTHORS file is passed over, smaller files still fit
+    assert file_scanner.plan_scan(
+        entries, max_files=100, max_bytes=300, max_member_bytes=10**6
+    ) == ["demo.dist-info/METADATA", "LICENSE", "README.md"]
+
+
+def test_scan_stops_early_once_enough_evidence(tmp_path) -> None:
+    files = [
+        (f"pkg{i}/__init__.py", f'__author__ = "Dev {i} <dev{i}@acme.io>"\n'.encode())
+        for i in range(5)
+    ]
+
+    evidence = file_scanner.scan_files(
+        files,
+        "demo-1.0",
+        urls=False,
+        stop_when=lambda claims: len({c.locator for c in claims}) >= 2,
+    )
+
+    locators = {e.locator.split("/")[1] for e in evidence}
+    assert locators == {"pkg0", "pkg1"}
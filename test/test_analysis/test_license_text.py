@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from skip_trace.analysis import license_text, source_scanner
+from skip_trace.config import CONFIG
+
+
+@pytest.mark.parametrize(
+    "holder_text, expected",
+    [
+        ("Jane Doe", "Jane Doe"),
+        ("Acme Inc. All rights reserved.", "Acme Inc."),
+        ("Google LLC. Licensed under the Apache License", "Google LLC."),
+        (
+            "The Python Software Foundation and contributors",
+            "The Python Software Foundation and contributors",
+        ),
+        ("notice and this permission notice shall be included", ""),
+        ('HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS', ""),
+        ("# OWNER OR CONTRIBUTORS BE LIABLE", ""),
+        ("[yyyy] [name of copyright owner]", ""),
+        ("Free Software Foundation, Inc. <https://fsf.org/>", ""),
+        ("Mozilla Foundation", "Mozilla Foundation"),
+        ("notice", ""),
+    ],
+)
+def test_holder_fragment(holder_text: str, expected: str) -> None:
+    assert license_text.holder_fragment(holder_text) == expected
+
+
+@pytest.mark.parametrize("spdx_id", license_text.load_index().licenses)
+def test_license_bodies_give_no_candidates(spdx_id: str) -> None:
+    path = os.path.join(license_text.LICENSE_TEXTS_DIR, f"{spdx_id}.txt")
+    with open(path, encoding="utf-8") as handle:
+        body = handle.read()
+
+    assert source_scanner.copyright_candidates(body) == []
+
+
+def test_filled_in_license_keeps_only_the_holder(monkeypatch) -> None:
+    with open(
+        os.path.join(license_text.LICENSE_TEXTS_DIR, "BSD-3-Clause.txt"),
+        encoding="utf-8",
+    ) as handle:
+        body = handle.read().replace("<year> <copyright holder>", "2021 Acme Widgets")
+
+    assert source_scanner.copyright_candidates(body) == ["Acme Widgets."]
+
+    monkeypatch.setitem(
+        CONFIG, "scan", {**CONFIG["scan"], "license_boilerplate": False}
+    )
+    assert len(source_scanner.copyright_candidates(body)) == 6
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+import spacy
+
+from skip_trace.analysis import ner
+from skip_trace.config import CONFIG
+from skip_trace.exceptions import ConfigurationError
+
+
+class FakeNlp:
+    """Stands in for a spaCy pipeline, tagging known names and counting calls."""
+
+    meta = {"lang": "en", "name": "core_web_sm", "version": "3.8.0"}
+    max_length = 1_000_000
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.batches: list = []
+
+    def __call__(self, text: str) -> SimpleNamespace:
+        self.calls += 1
+        ents = [
+            SimpleNamespace(text=name, label_=label)
+            for name, label in (("Python Software Foundation", "ORG"),)
+            if name in text
+        ]
+        return SimpleNamespace(ents=ents)
+
+    def pipe(self, texts, batch_size: int, n_process: int):
+        self.batches.append(list(texts))
+        return [self(text) for text in self.batches[-1]]
+
+
+@pytest.fixture
+def fake_nlp(tmp_path, monkeypatch):
+    nlp = FakeNlp()
+    monkeypatch.setitem(CONFIG, "cache", {**CONFIG["cache"], "dir": str(tmp_path)})
+    monkeypatch.setattr(ner, "_get_nlp_model", lambda: nlp)
+    monkeypatch.setattr(ner, "_memo", {})
+    monkeypatch.setattr(ner, "_stats", {"memory_hits": 0, "disk_hits": 0, "misses": 0})
+    return nlp
+
+
+def test_repeated_text_is_served_from_memory(fake_nlp) -> None:
+    text = "Copyright (c) Python Software Foundation"
+    first = ner.extract_entities(text)
+    second = ner.extract_entities(text)
+
+    assert first == second == [("Python Software Foundation", "ORG")]
+    assert fake_nlp.calls == 1
+    stats = ner.get_cache_stats()
+    assert stats["memory_hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_results_persist_across_processes(fake_nlp, monkeypatch) -> None:
+    ner.extract_entities("MIT License")
+    monkeypatch.setattr(ner, "_memo", {})  # as if in a fresh process
+
+    assert ner.extract_entities("MIT License") == []
+    assert fake_nlp.calls == 1
+    assert ner.get_cache_stats()["disk_hits"] == 1
+
+
+def test_model_version_is_part_of_the_key(fake_nlp, monkeypatch) -> None:
+    ner.extract_entities("MIT License")
+    monkeypatch.setattr(ner, "_memo", {})
+    monkeypatch.setattr(fake_nlp, "meta", {**FakeNlp.meta, "version": "3.9.0"})
+
+    ner.extract_entities("MIT License")
+    assert fake_nlp.calls == 2
+
+
+def test_batch_runs_unseen_texts_in_one_pipe_call(fake_nlp) -> None:
+    ner.extract_entities("MIT License")
+    texts = [
+        "Copyright (c) Python Software Foundation",
+        "MIT License",
+        "Copyright 2001 Python Software Foundation",
+        "Copyright (c) Python Software Foundation",
+    ]
+
+    results = ner.extract_entities_batch(texts)
+
+    assert results == [
+        [("Python Software Foundation", "ORG")],
+        [],
+        [("Python Software Foundation", "ORG")],
+        [("Python Software Foundation", "ORG")],
+    ]
+    # The seen text and the duplicate are not run again
+    assert fake_nlp.batches == [[texts[0], texts[2]]]
+    assert ner.get_cache_stats()["memory_hits"] == 2
+
+
+class FakePipeline:
+    """What spacy.load returns: the pipeline minus the excluded components."""
+
+    def __init__(self, exclude, listeners) -> None:
+        self.pipe_names = [c for c in ner.MODEL_COMPONENTS if c not in exclude]
+        self.listeners = listeners
+
+    def get_pipe(self, name: str) -> SimpleNamespace:
+        return SimpleNamespace(listening_components=self.listeners)
+
+    def remove_pipe(self, name: str) -> None:
+        self.pipe_names.remove(name)
+
+
+@pytest.mark.parametrize(
+    "profile, listeners, expected",
+    [
+        ("fast", [], ["ner"]),
+        ("fast", ["ner"], ["tok2vec", "ner"]),
+        ("full", [], list(ner.MODEL_COMPONENTS)),
+    ],
+)
+def test_profiles_load_only_the_components_they_need(
+    monkeypatch, profile, listeners, expected
+) -> None:
+    loaded = []
+
+    def fake_load(name, exclude):
+        loaded.append(name)
+        return FakePipeline(exclude, listeners)
+
+    monkeypatch.setattr(spacy, "load", fake_load)
+
+    assert ner.load_profile(profile).pipe_names == expected
+    assert loaded == ["en_core_web_sm"]
+
+
+def test_unknown_profile_is_a_configuration_error(monkeypatch) -> None:
+    monkeypatch.setitem(CONFIG, "ner", {**CONFIG["ner"], "profile": "huge"})
+
+    with pytest.raises(ConfigurationError):
+        ner.get_profile()
+
+
+class NameFinder:
+    """A pipeline that tags every "Jane Doe" and records the lengths it saw."""
+
+    meta = FakeNlp.meta
+    max_length = 1_000_000
+
+    def __init__(self) -> None:
+        self.lengths: list = []
+
+    def __call__(self, text: str) -> SimpleNamespace:
+        self.lengths.append(len(text))
+        ents, start = [], text.find("Jane Doe")
+        while start != -1:
+            ents.append(
+                SimpleNamespace(text="Jane Doe", label_="PERSON", start_char=start)
+            )
+            start = text.find("Jane Doe", start + 1)
+        return SimpleNamespace(ents=ents)
+
+    def pipe(self, texts, batch_size: int, n_process: int = 1):
+        return (self(text) for text in texts)
+
+
+def test_split_windows_covers_the_text_within_the_budget() -> None:
+    text = "\n".join(f"line {i} " + "word " * (i % 7) for i in range(200))
+
+    windows = list(ner.split_windows(text, 100, 20))
+
+    assert all(end - start <= 100 for start, end, _ in windows)
+    assert windows[0][0] == 0 and windows[-1][1] == windows[-1][2] == len(text)
+    for (_, end, owned_end), (next_start, _, _) in zip(windows, windows[1:]):
+        assert next_start == owned_end and owned_end <= end
+
+
+def test_long_texts_are_run_in_windows(monkeypatch) -> None:
+    nlp = NameFinder()
+    monkeypatch.setattr(ner, "_get_nlp_model", lambda: nlp)
+    monkeypatch.setattr(ner, "_memo", {})
+    monkeypatch.setitem(
+        CONFIG,
+        "ner",
+        {**CONFIG["ner"], "max_chars_per_call": 100, "window_overlap": 20},
+    )
+    # Every line mentions the name once, so some fall in window overlaps
+    text = "".join(f"{i:03d} by Jane Doe and others\n" for i in range(50))
+
+    entities = ner.extract_entities(text)
+
+    assert entities == [("Jane Doe", "PERSON")] * 50
+    assert max(nlp.lengths) <= 100
+
+
+def test_rules_backend_never_loads_spacy(monkeypatch) -> None:
+    monkeypatch.setitem(CONFIG, "ner", {**CONFIG["ner"], "backend": "rules"})
+    monkeypatch.setattr(ner, "load_profile", lambda: pytest.fail("spaCy loaded"))
+
+    assert ner.extract_entities_batch(["2020 Jane Doe", "Acme Widgets GmbH"]) == [
+        [("Jane Doe", "PERSON")],
+        [("Acme Widgets GmbH", "ORG")],
+    ]
+    assert ner.engine_signature().startswith("rules@")
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import datetime
+
+from skip_trace.analysis import ner, prefilter, source_scanner
+from skip_trace.config import CONFIG
+
+TEXT = """\
+@decorator
+def f():
+    pass
+
+__author__ = "Jane Doe <jane@acme.io>"
+# Copyright (c)
+#   2019-2021 Acme Widgets
+contact: bob@widgets.dev, alice@widgets.dev
+@"""
+
+
+def test_find_triggers() -> None:
+    assert prefilter.find_triggers(b"import os\n") == frozenset()
+    assert prefilter.find_triggers(b"COPYRIGHT 2020 Acme") == {"copyright"}
+    assert prefilter.find_triggers(TEXT.encode()) == prefilter.ALL_TRIGGERS
+
+
+def test_lines_containing() -> None:
+    lines = list(prefilter.lines_containing(TEXT, "@"))
+
+    assert lines == [
+        "@decorator",
+        '__author__ = "Jane Doe <jane@acme.io>"',
+        "contact: bob@widgets.dev, alice@widgets.dev",
+        "@",
+    ]
+
+
+def test_prefilter_finds_the_same_evidence(monkeypatch) -> None:
+    # Stand in for the NER model: every copyright holder is one entity
+    monkeypatch.setattr(
+        ner,
+        "extract_entities_batch",
+        lambda texts: [[(text, "ORG")] if text else [] for text in texts],
+    )
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    def scan(enabled: bool):
+        monkeypatch.setitem(CONFIG, "scan", {**CONFIG["scan"], "prefilter": enabled})
+        evidence: list = []
+        source_scanner.scan_file_content(TEXT, "pkg/mod.py", "demo", evidence, now)
+        return [(r.id, r.value) for r in evidence]
+
+    filtered = scan(True)
+
+    assert filtered == scan(False)
+    # Copyright matches continue onto the next line, so they run on the whole text
+    assert {"holder": "#   2019-2021 Acme Widgets", "file": "pkg/mod.py"} in [
+        value for _, value in filtered
+    ]
+    assert len(filtered) == 5
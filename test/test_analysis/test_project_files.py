@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import datetime
+
+from skip_trace.analysis import file_scanner, project_files
+from skip_trace.schemas import EvidenceKind
+
+NOW = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+PYPROJECT = """
+[project]
+name = "demo"
+authors = [{name = "Jane Doe", email = "jane@acme.io"}, {name = "ACME Team"}]
+maintainers = [{email = "ops@acme.io"}]
+
+[project.urls]
+Source = "https://github.com/acme/demo"
+
+[tool.poetry]
+authors = ["Joe Bloggs <joe@acme.io>"]
+"""
+
+SETUP_CFG = """
+[metadata]
+name = demo
+author = Jane Doe, Joe Bloggs
+author_email = jane@acme.io, joe@acme.io
+url = https://acme.io/demo
+project_urls =
+    Tracker = https://github.com/acme/demo/issues
+"""
+
+SETUP_PY = """
+from setuptools import setup
+
+AUTHOR = "Jane Doe"
+
+setup(
+    name="demo",
+    author=AUTHOR,
+    author_email="jane@acme.io",
+    maintainer=get_maintainer(),
+    project_urls={"Source": "https://github.com/acme/demo"},
+)
+"""
+
+
+def values(evidence, kind):
+    return [e.value for e in evidence if e.kind == kind]
+
+
+def test_pyproject_fields() -> None:
+    evidence = project_files.extract_project_evidence(
+        PYPROJECT, "pyproject.toml", "demo-1.0", NOW
+    )
+
+    assert values(evidence, EvidenceKind.PERSON) == [
+        {"name": "Jane Doe"},
+        {"name": "ACME Team"},
+        {"name": "Joe Bloggs"},
+    ]
+    assert values(evidence, EvidenceKind.EMAIL) == [
+        {"email": "jane@acme.io"},
+        {"email": "joe@acme.io"},
+        {"email": "ops@acme.io"},
+    ]
+    assert values(evidence, EvidenceKind.PROJECT_URL) == [
+        {"label": "Source", "url": "https://github.com/acme/demo"}
+    ]
+    assert all(e.locator == "demo-1.0/pyproject.toml" for e in evidence)
+
+
+def test_setup_cfg_pairs_authors_with_emails() -> None:
+    info = project_files.parse_setup_cfg(SETUP_CFG)
+
+    assert info.authors == [
+        ("Jane Doe", "jane@acme.io"),
+        ("Joe Bloggs", "joe@acme.io"),
+    ]
+    assert info.urls == [
+        ("Homepage", "https://acme.io/demo"),
+        ("Tracker", "https://github.com/acme/demo/issues"),
+    ]
+
+
+def test_setup_py_reads_literal_keywords_only() -> None:
+    info = project_files.parse_setup_py(SETUP_PY)
+
+    assert info.authors == [("Jane Doe", "jane@acme.io")]
+    assert info.maintainers == []
+    assert info.urls == [("Source", "https://github.com/acme/demo")]
+
+
+def test_pyproject_ignores_fields_of_the_wrong_type() -> None:
+    info = project_files.parse_pyproject(
+        'tool = "x"\n[project]\nauthors = "Jane Doe"\nurls = ["https://acme.io"]\n'
+    )
+
+    assert info == project_files.ProjectInfo()
+
+
+def test_only_root_project_files_are_parsed() -> None:
+    assert project_files.is_project_file("setup.py")
+    assert not project_files.is_project_file("tests/fixtures/setup.py")
+    assert not project_files.is_project_file("mysetup.py")
+
+
+def test_project_files_are_also_scanned_as_text() -> None:
+    setup_py = "# Contact: jane@acme.io\n" + SETUP_PY
+    files = [
+        ("setup.py", setup_py.encode()),
+        ("pyproject.toml", b"[project\nbroken\n# Contact: joe@acme.io\n"),
+        ("vendor/setup.py", b'setup(author_email="ops@acme.io")\n'),
+        ("docs/setup.py", b"# Contact: anne@acme.io\nimport sys\n"),
+    ]
+
+    evidence = file_scanner.scan_files(files, "demo-1.0", urls=False, workers=1)
+    emails = {
+        (e.locator, e.value["email"], e.notes) for e in evidence if "email" in e.value
+    }
+
+    # The declared email wins over the same address found in a comment
+    assert [notes for locator, email, notes in emails if email == "jane@acme.io"] == [
+        "Found author email for 'Jane Doe' declared in setup.py."
+    ]
+    # Unparseable and nested project files fall back to the text scan
+    assert {(locator, email) for locator, email, _ in emails} == {
+        ("demo-1.0/setup.py", "jane@acme.io"),
+        ("demo-1.0/pyproject.toml", "joe@acme.io"),
+        ("demo-1.0/vendor/setup.py", "ops@acme.io"),
+        ("demo-1.0/docs/setup.py", "anne@acme.io"),
+    }
+
+
+def test_declared_owners_skip_ner(monkeypatch) -> None:
+    ner_inputs = []
+    monkeypatch.setattr(
+        file_scanner.ner,
+        "extract_entities_batch",
+        lambda texts: ner_inputs.extend(texts) or [[] for _ in texts],
+    )
+    setup_py = "# Copyright 2024 Bloggs Tooling Ltd\n" + SETUP_PY
+    files = [
+        ("setup.py", setup_py.encode()),
+        ("demo/__init__.py", b"# Copyright 2024 Acme Widgets Ltd\n"),
+    ]
+
+    file_scanner.scan_files(files, "demo-1.0", urls=False, workers=1)
+
+    assert set(ner_inputs) == {"Acme Widgets Ltd"}
+
+
+def test_setup_py_without_setup_call_is_scanned_as_text() -> None:
+    assert (
+        project_files.extract_project_evidence(
+            "import setuptools\n", "setup.py", "demo-1.0", NOW
+        )
+        is None
+    )
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+import pathlib
+
+import pytest
+
+from skip_trace.analysis import rule_ner
+
+FIXTURES = json.loads(
+    (pathlib.Path(__file__).parent / "ner_fixtures.json").read_text(encoding="utf-8")
+)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Guido van Rossum <guido@example.org>", [("Guido van Rossum", "PERSON")]),
+        ("2014 Red Hat, Inc. All rights reserved.", [("Red Hat Inc.", "ORG")]),
+        (
+            "Alice Smith & Bob Jones",
+            [("Alice Smith", "PERSON"), ("Bob Jones", "PERSON")],
+        ),
+        ("permission notice shall be included", []),
+        ("Licensed under the MIT License", []),
+    ],
+)
+def test_extract_entities(text, expected) -> None:
+    assert rule_ner.extract_entities(text) == expected
+
+
+def test_accuracy_on_labeled_fixtures() -> None:
+    found = expected = correct = 0
+    for row in FIXTURES:
+        gold = {tuple(entity) for entity in row["entities"]}
+        predicted = set(rule_ner.extract_entities(row["text"]))
+        found += len(predicted)
+        expected += len(gold)
+        correct += len(predicted & gold)
+
+    assert correct / found >= 0.95  # precision
+    assert correct / expected >= 0.9  # recall
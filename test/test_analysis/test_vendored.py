@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from skip_trace.analysis import file_scanner, vendored
+from skip_trace.config import CONFIG
+
+
+def test_find_vendored_roots() -> None:
+    paths = [
+        "pip/__init__.py",
+        "pip/_vendor/vendor.txt",
+        "pip/_vendor/six.py",
+        "pip/_vendor/urllib3/connectionpool.py",
+        "demo/libs/bundled.py",
+        "demo/libs/vendored.txt",
+        "demo/compat/idna/idnadata.py",
+        "src/urllib3/connectionpool.py",
+    ]
+
+    roots = vendored.find_vendored_roots(paths)
+
+    assert [vendored.vendored_project(p, roots) for p in paths] == [
+        None,
+        "_vendor",
+        "six",
+        "urllib3",
+        "libs",
+        "libs",
+        "idna",
+        None,
+    ]
+
+
+def make_tree(root) -> None:
+    (root / "demo" / "_vendor" / "other").mkdir(parents=True)
+    (root / "demo" / "__init__.py").write_text(
+        '__author__ = "Jane Doe <jane@acme.io>"\n'
+    )
+    (root / "demo" / "_vendor" / "other" / "__init__.py").write_text(
+        '__author__ = "Someone Else <else@other.org>"\n'
+    )
+
+
+def test_vendored_files_are_skipped_by_default(tmp_path) -> None:
+    make_tree(tmp_path)
+
+    evidence = file_scanner.scan_directory(str(tmp_path), "demo-1.0")
+
+    assert evidence
+    assert all("_vendor" not in e.locator for e in evidence)
+
+
+def test_vendored_evidence_can_be_tagged(tmp_path, monkeypatch) -> None:
+    make_tree(tmp_path)
+    monkeypatch.setitem(CONFIG, "scan", {**CONFIG["scan"], "vendored": "scan"})
+    untagged = file_scanner.scan_directory(str(tmp_path), "demo-1.0")
+    monkeypatch.setitem(CONFIG, "scan", {**CONFIG["scan"], "vendored": "tag"})
+
+    evidence = file_scanner.scan_directory(str(tmp_path), "demo-1.0")
+
+    tagged = [e for e in evidence if e.linkage == ["vendored:other"]]
+    assert tagged and all("_vendor/other" in e.locator for e in tagged)
+    assert len(evidence) == len(untagged)
+    assert evidence[-len(tagged) :] == tagged
+    assert not any(e.linkage for e in evidence[: -len(tagged)])
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+
+from skip_trace import cli, prefetch
+from skip_trace.utils import artifact_store, cache
+
+
+@pytest.fixture(autouse=True)
+def quiet_logging(monkeypatch):
+    """`run_command` configures logging; leave the test runner's alone."""
+    monkeypatch.setattr("skip_trace.main.setup_logging", lambda level: None)
+
+
+def test_cache_show_lists_namespaces(capsys) -> None:
+    cache.set_cached_data("rdap", "acme.io", {"org": "Acme"})
+
+    assert cli.main(["cache", "show"]) == 0
+    output = capsys.readouterr().out
+    assert "Cache directory:" in output
+    assert "rdap: 1 files" in output
+
+
+def test_cache_clear_is_not_implemented(capsys) -> None:
+    assert cli.main(["cache", "clear"]) == 2
+    assert "not yet implemented" in capsys.readouterr().err
+
+
+def test_cache_gc_reports_what_was_freed(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(
+        artifact_store,
+        "collect_garbage",
+        lambda: {"removed": 2, "freed": 300, "remaining": 100},
+    )
+
+    assert cli.main(["cache", "gc"]) == 0
+    assert "Removed 2 stored artifacts, freed 300 bytes" in capsys.readouterr().out
+
+
+def test_cache_warm_passes_specs_and_options(monkeypatch, tmp_path) -> None:
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("requests==2.32.3\nrich\n")
+    calls = []
+
+    def warm_caches(specs, jobs=None, artifacts=True, scan_depth="quick"):
+        calls.append((specs, artifacts, scan_depth))
+        return {"metadata": 3, "artifacts": 0, "domains": 0, "urls": 0, "failed": 0}
+
+    monkeypatch.setattr(prefetch, "warm_caches", warm_caches)
+    code = cli.main(
+        [
+            "cache",
+            "warm",
+            "httpx",
+            "-r",
+            str(requirements),
+            "--no-artifacts",
+            "--scan-depth",
+            "metadata",
+        ]
+    )
+
+    assert code == 0
+    specs, artifacts, scan_depth = calls[0]
+    assert sorted(specs) == [
+        ("httpx", None),
+        ("requests", "2.32.3"),
+        ("rich", None),
+    ]
+    assert artifacts is False
+    assert scan_depth == "metadata"
+
+
+def test_cache_warm_without_packages_fails(capsys) -> None:
+    assert cli.main(["cache", "warm"]) == 2
+    assert "No packages given" in capsys.readouterr().err
+
+
+def test_cache_export_then_import(tmp_path, capsys) -> None:
+    cache.set_cached_data("pypi", "https://pypi.org/pypi/demo/json", {"info": {}})
+    bundle = str(tmp_path / "bundle.tar.gz")
+
+    assert cli.main(["cache", "export", bundle, "--namespace", "pypi"]) == 0
+    assert "Exported 1 cache entries" in capsys.readouterr().out
+    assert cli.main(["cache", "import", bundle]) == 0
+    assert "0 rejected" in capsys.readouterr().out
+
+
+def test_cache_import_rejects_a_broken_bundle(tmp_path, capsys) -> None:
+    bundle = tmp_path / "bundle.tar.gz"
+    bundle.write_bytes(b"not a bundle")
+
+    assert cli.main(["cache", "import", str(bundle)]) == 2
+    assert "Error:" in capsys.readouterr().err
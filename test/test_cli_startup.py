@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import sys
+
+ROOT = pathlib.Path(__file__).parent.parent
+HEAVY_MODULES = {
+    "bs4",
+    "github",
+    "httpx",
+    "pydantic",
+    "sigstore",
+    "spacy",
+    "tldextract",
+    "whois",
+    "whoisit",
+}
+# Generous, to stay quiet on slow machines: eager imports took 0.75 s
+IMPORT_BUDGET_SECONDS = 0.4
+
+
+def _run(code: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_cli_import_is_cheap() -> None:
+    result = _run(
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "import skip_trace.cli\n"
+        "seconds = time.perf_counter() - start\n"
+        "print(json.dumps({'seconds': seconds, 'modules': list(sys.modules)}))"
+    )
+
+    loaded = {module.split(".")[0] for module in result["modules"]}
+    assert not loaded & HEAVY_MODULES
+    assert "skip_trace.main" not in result["modules"]
+    assert result["seconds"] < IMPORT_BUDGET_SECONDS
+
+
+def test_schema_command_loads_only_pydantic() -> None:
+    result = _run(
+        "import contextlib, io, json, sys\n"
+        "from skip_trace import cli\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    code = cli.main(['schema', 'pypi-profile'])\n"
+        "print(json.dumps({'code': code, 'modules': list(sys.modules)}))"
+    )
+
+    loaded = {module.split(".")[0] for module in result["modules"]}
+    assert result["code"] == 0
+    assert loaded & HEAVY_MODULES == {"pydantic"}
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import zipfile
+
+import httpx
+import pytest
+
+from skip_trace.collectors import package_files
+from skip_trace.config import CONFIG
+from skip_trace.schemas import EvidenceKind
+from skip_trace.utils import archive_reader, artifact_store, http_client
+
+CORE_METADATA = (
+    b"Metadata-Version: 2.1\nName: demo\nVersion: 1.0\n"
+    b"Author-email: Jane Doe <jane@acme.io>\n"
+)
+WHEEL_URL = "https://files.example/demo-1.0-py3-none-any.whl"
+METADATA = {
+    "info": {"name": "demo", "version": "1.0"},
+    "urls": [
+        {
+            "packagetype": "bdist_wheel",
+            "filename": "demo-1.0-py3-none-any.whl",
+            "url": WHEEL_URL,
+            "digests": {"sha256": "0" * 64},
+        }
+    ],
+}
+
+
+def simple_index(metadata_hash: str) -> dict:
+    return {
+        "files": [
+            {
+                "filename": "demo-1.0-py3-none-any.whl",
+                "core-metadata": {"sha256": metadata_hash},
+            },
+            {"filename": "demo-1.0.tar.gz", "core-metadata": False},
+        ]
+    }
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    """Serves a Simple API page and a .metadata file; records every request."""
+    monkeypatch.setitem(CONFIG, "cache", {**CONFIG["cache"], "dir": str(tmp_path)})
+    state = {"calls": [], "hash": hashlib.sha256(CORE_METADATA).hexdigest()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        state["calls"].append(url)
+        if url.startswith("https://pypi.org/simple/"):
+            return httpx.Response(200, json=simple_index(state["hash"]))
+        if url == f"{WHEEL_URL}.metadata":
+            return httpx.Response(200, content=CORE_METADATA)
+        return httpx.Response(404)
+
+    monkeypatch.setattr(
+        http_client, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    return state
+
+
+def test_metadata_depth_reads_only_core_metadata(index) -> None:
+    evidence = package_files.collect_from_package_files(METADATA, scan_depth="metadata")
+
+    assert WHEEL_URL not in index["calls"]
+    emails = [e.value["email"] for e in evidence if e.kind == EvidenceKind.EMAIL]
+    assert emails == ["jane@acme.io"]
+    assert evidence[0].kind == EvidenceKind.ARTIFACT
+    assert evidence[1].locator == "demo-1.0/demo-1.0.dist-info/METADATA"
+
+    # The .metadata file is immutable, so a second run is served from cache
+    index["calls"].clear()
+    package_files.collect_from_package_files(METADATA, scan_depth="metadata")
+    assert index["calls"] == []
+
+
+def test_core_metadata_with_bad_digest_is_rejected(index) -> None:
+    index["hash"] = "f" * 64
+    distribution = METADATA["urls"][0]
+
+    assert package_files.fetch_core_metadata(distribution, "demo") is None
+
+
+def test_lazy_depth_reads_wheel_members_with_range_requests(
+    tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setitem(CONFIG, "cache", {**CONFIG["cache"], "dir": str(tmp_path)})
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("demo/__init__.py", '__author__ = "Jane Doe <jane@acme.io>"\n')
+        zf.writestr("demo/data.bin", b"\0" * 200_000)
+        zf.writestr("demo-1.0.dist-info/METADATA", CORE_METADATA)
+        zf.writestr("demo-1.0.dist-info/RECORD", "demo/__init__.py,,\n")
+    wheel = buf.getvalue()
+    ranges = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        byte_range = request.headers["range"].split("=", 1)[1]
+        ranges.append(byte_range)
+        start_s, end_s = byte_range.split("-")
+        if not start_s:
+            start, end = len(wheel) - int(end_s), len(wheel) - 1
+        else:
+            start, end = int(start_s), min(int(end_s), len(wheel) - 1)
+        return httpx.Response(
+            206,
+            content=wheel[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(wheel)}"},
+        )
+
+    monkeypatch.setattr(
+        http_client, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    evidence = package_files.collect_from_package_files(METADATA, scan_depth="lazy")
+
+    locators = {e.locator for e in evidence}
+    assert "demo-1.0/demo/__init__.py" in locators
+    assert "demo-1.0/demo-1.0.dist-info/METADATA" in locators
+    assert all(r != f"0-{len(wheel) - 1}" for r in ranges)
+
+
+def test_quick_depth_stops_at_core_metadata_when_it_is_enough(
+    index, monkeypatch
+) -> None:
+    monkeypatch.setitem(CONFIG, "scan", {**CONFIG["scan"], "early_stop_records": 1})
+
+    evidence = package_files.collect_from_package_files(METADATA, scan_depth="quick")
+
+    assert WHEEL_URL not in index["calls"]
+    assert f"{WHEEL_URL}.metadata" in index["calls"]
+    assert any(e.kind == EvidenceKind.EMAIL for e in evidence)
+
+
+def test_lazy_depth_reads_a_stored_wheel_in_place(index) -> None:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("demo/__init__.py", '__author__ = "Jane Doe <jane@acme.io>"\n')
+        zf.writestr("demo/deep/mod.py", '__author__ = "Joe Bloggs <joe@acme.io>"\n')
+        zf.writestr("demo-1.0.dist-info/METADATA", CORE_METADATA)
+    wheel = buf.getvalue()
+    sha256 = hashlib.sha256(wheel).hexdigest()
+    metadata = {
+        **METADATA,
+        "urls": [{**METADATA["urls"][0], "digests": {"sha256": sha256}}],
+    }
+    digest_dir = artifact_store.get_digest_dir(sha256)
+    os.makedirs(digest_dir)
+    with open(f"{digest_dir}/demo-1.0-py3-none-any.whl", "wb") as handle:
+        handle.write(wheel)
+
+    evidence = package_files.collect_from_package_files(metadata, scan_depth="lazy")
+
+    locators = {e.locator for e in evidence}
+    assert "demo-1.0/demo/__init__.py" in locators
+    assert "demo-1.0/demo/deep/mod.py" not in locators
+    assert WHEEL_URL not in index["calls"]
+
+
+def test_quick_scans_run_in_process(tmp_path, monkeypatch) -> None:
+    wheel = tmp_path / "demo-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w") as zf:
+        for i in range(5):
+            zf.writestr(f"demo/mod{i}.py", f'__author__ = "Dev {i} <dev{i}@acme.io>"\n')
+    monkeypatch.setitem(
+        CONFIG, "scan", {**CONFIG["scan"], "parallel_min_files": 1, "workers": 2}
+    )
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a quick scan must not start a worker pool")
+
+    monkeypatch.setattr(package_files.file_scanner, "_iter_parallel", no_pool)
+    with archive_reader.open_archive(str(wheel), wheel.name) as archive:
+        evidence = package_files._scan_archive(archive, "demo-1.0", "quick")
+
+    assert len({e.locator for e in evidence}) == 5
+
+
+def test_select_distribution_prefers_small_pure_wheels() -> None:
+    def dist(filename, size, packagetype="bdist_wheel", **extra):
+        return {"filename": filename, "size": size, "packagetype": packagetype, **extra}
+
+    platform = [
+        dist("demo-1.0-cp313-cp313-manylinux_2_17_x86_64.whl", 30_000_000),
+        dist("demo-1.0-cp313-cp313-win_amd64.whl", 9_000_000),
+    ]
+    sdist = dist("demo-1.0.tar.gz", 2_000_000, packagetype="sdist")
+    pure = dist("demo-1.0-py3-none-any.whl", 400_000)
+    yanked = dist("demo-1.0-py2.py3-none-any.whl", 100, yanked=True)
+
+    def pick(urls, scan_depth="quick"):
+        distribution, reason = package_files.select_distribution(
+            {"urls": urls}, scan_depth
+        )
+        return distribution["filename"], reason
+
+    assert pick(platform + [sdist, pure, yanked]) == (
+        "demo-1.0-py3-none-any.whl",
+        "pure-Python wheel",
+    )
+    assert pick(platform + [sdist])[0] == "demo-1.0-cp313-cp313-win_amd64.whl"
+    assert pick([sdist])[0] == "demo-1.0.tar.gz"
+    assert pick(platform + [sdist, pure], "full")[0] == "demo-1.0.tar.gz"
+    assert package_files.select_distribution({"urls": []}) is None
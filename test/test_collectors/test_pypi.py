@@ -1,12 +1,15 @@
 # tests/test_pypi_collector_integration.py
 from __future__ import annotations
 
+import os
+import time
 from typing import Any, Dict, Set
 
 import pytest
 
 from skip_trace.collectors import pypi as pypi_collector
 from skip_trace.exceptions import NoEvidenceError
+from skip_trace.utils import cache
 
 # Stable, high-signal packages. Adjust if they ever go away.
 PKG = "requests"
@@ -73,3 +76,32 @@ def test_fetch_other_package_urls_has_results_when_profile_exists(require_pypi):
 #             and r0.observed_at.tzinfo is not None
 #         )
 #         assert 0.0 <= r0.confidence <= 1.0
+
+
+def test_unpinned_lookups_expire_sooner(monkeypatch):
+    fetched = []
+
+    class FakeResponse:
+        def json(self):
+            return {"info": {"name": "demo"}}
+
+    def fake_request(url):
+        fetched.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(pypi_collector.http_client, "make_request", fake_request)
+    pypi_collector.fetch_package_metadata("demo")
+    pypi_collector.fetch_package_metadata("demo", "1.0")
+
+    # Age both entries past the index TTL, but not the configured one
+    aged = time.time() - pypi_collector.PYPI_INDEX_TTL_SECONDS - 1
+    for url in fetched:
+        os.utime(cache.get_cache_path("pypi", url), (aged, aged))
+    pypi_collector.fetch_package_metadata("demo")
+    pypi_collector.fetch_package_metadata("demo", "1.0")
+
+    assert fetched == [
+        "https://pypi.org/pypi/demo/json",
+        "https://pypi.org/pypi/demo/1.0/json",
+        "https://pypi.org/pypi/demo/json",
+    ]
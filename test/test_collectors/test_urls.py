@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from skip_trace.collectors import urls
+from skip_trace.config import CONFIG
+from skip_trace.utils import cache
+
+URL = "https://acme.io/about"
+
+
+class FakeResponse:
+    status_code = 200
+    text = "<p>Acme Widgets Ltd</p>"
+
+
+def test_offline_misses_are_not_cached(monkeypatch) -> None:
+    monkeypatch.setitem(CONFIG, "offline", True)
+
+    assert urls.fetch_url_content(URL) == (-1, "")
+    assert cache.get_cached_data("url", URL) is None
+
+    # Back online, the page is fetched and cached
+    monkeypatch.setitem(CONFIG, "offline", False)
+    monkeypatch.setattr(
+        urls.http_client, "make_request_safe", lambda url: FakeResponse()
+    )
+    assert urls.fetch_url_content(URL) == (200, FakeResponse.text)
+    assert cache.get_cached_data("url", URL)["content"] == FakeResponse.text
+
+
+def test_cached_failures_are_refetched(monkeypatch) -> None:
+    cache.set_cached_data("url", URL, {"status_code": -1, "content": ""})
+    monkeypatch.setattr(
+        urls.http_client, "make_request_safe", lambda url: FakeResponse()
+    )
+
+    assert urls.fetch_url_content(URL) == (200, FakeResponse.text)
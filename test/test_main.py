@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+
+from skip_trace import cli, main
+from skip_trace.config import CONFIG
+from skip_trace.schemas import OwnerCandidate, OwnerKind, PackageResult
+
+
+@pytest.fixture
+def analyzed(monkeypatch):
+    """Makes every analyzed package's top owner score 0.6."""
+    monkeypatch.setattr(main, "setup_logging", lambda level: None)
+    monkeypatch.setattr(
+        main,
+        "analyze_package",
+        lambda name, version=None, scan_depth="full": PackageResult(
+            package=name,
+            owners=[OwnerCandidate(name="Acme", kind=OwnerKind.COMPANY, score=0.6)],
+        ),
+    )
+
+
+@pytest.mark.parametrize("fail_under, expected", [(0.5, 0), (0.7, 101)])
+def test_exit_codes_follow_the_configured_threshold(
+    analyzed, monkeypatch, tmp_path, capsys, fail_under, expected
+) -> None:
+    monkeypatch.setitem(CONFIG, "default_fail_under", fail_under)
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("demo==1.0\n")
+
+    assert cli.main(["who-owns", "demo"]) == expected
+    assert cli.main(["reqs", str(requirements)]) == expected
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+
+from skip_trace import prefetch
+from skip_trace.exceptions import NetworkError
+
+METADATA = {
+    "info": {
+        "author_email": "Jane Doe <jane@acme.io>",
+        "home_page": "https://docs.acme.io/demo",
+        "project_urls": {"Source": "https://github.com/acme/demo"},
+    },
+    "urls": [
+        {
+            "packagetype": "bdist_wheel",
+            "filename": "demo-1.0-py3-none-any.whl",
+            "url": "https://files.example/demo-1.0-py3-none-any.whl",
+            "digests": {"sha256": "ab" * 32},
+            "size": 10,
+        },
+        {
+            "packagetype": "sdist",
+            "filename": "demo-1.0.tar.gz",
+            "url": "https://files.example/demo-1.0.tar.gz",
+            "digests": {"sha256": "cd" * 32},
+            "size": 20,
+        },
+    ],
+}
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """Replaces every network fetch of a warm-up with a recorder."""
+    calls: dict = {"metadata": [], "artifacts": [], "domains": [], "urls": []}
+
+    def fetch_metadata(name, version=None):
+        calls["metadata"].append((name, version))
+        if name == "missing":
+            raise NetworkError("404 Not Found")
+        return METADATA
+
+    monkeypatch.setattr(prefetch.pypi, "fetch_package_metadata", fetch_metadata)
+    monkeypatch.setattr(
+        prefetch.artifact_store,
+        "fetch_artifact",
+        lambda url, filename, sha256: calls["artifacts"].append(filename),
+    )
+    monkeypatch.setattr(
+        prefetch.package_files,
+        "fetch_core_metadata",
+        lambda dist, name: calls["artifacts"].append(f"{dist['filename']}.metadata"),
+    )
+    monkeypatch.setattr(prefetch.whois, "lookup_domain", calls["domains"].append)
+    monkeypatch.setattr(prefetch.urls, "fetch_url_content", calls["urls"].append)
+    return calls
+
+
+def test_warm_caches_fetches_what_an_audit_would(fetched) -> None:
+    summary = prefetch.warm_caches([("demo", "1.0"), ("missing", None)], jobs=2)
+
+    assert summary == {
+        "metadata": 1,
+        "artifacts": 1,
+        "domains": 1,
+        "urls": 2,
+        "failed": 1,
+    }
+    assert sorted(fetched["metadata"]) == [("demo", "1.0"), ("missing", None)]
+    assert fetched["artifacts"] == ["demo-1.0-py3-none-any.whl"]
+    # Hosting domains such as github.com are in `whois_ignored_domains`
+    assert fetched["domains"] == ["acme.io"]
+    assert sorted(fetched["urls"]) == [
+        "https://docs.acme.io/demo",
+        "https://github.com/acme/demo",
+    ]
+
+
+def test_warm_caches_can_skip_artifacts(fetched) -> None:
+    summary = prefetch.warm_caches([("demo", None)], artifacts=False)
+
+    assert summary["artifacts"] == 0
+    assert fetched["artifacts"] == []
+
+
+def test_warm_caches_fetches_what_the_scan_depth_reads(fetched) -> None:
+    prefetch.warm_caches([("demo", None)], scan_depth="full")
+    # The core metadata is not served (None), so the wheel is fetched instead
+    prefetch.warm_caches([("demo", None)], scan_depth="metadata")
+
+    assert fetched["artifacts"] == [
+        "demo-1.0.tar.gz",
+        "demo-1.0-py3-none-any.whl.metadata",
+        "demo-1.0-py3-none-any.whl",
+    ]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import io
+import tarfile
+import zipfile
+
+from skip_trace.utils import archive_reader
+
+
+def make_sdist(path) -> None:
+    with tarfile.open(path, "w:gz") as tf:
+        for name, data in (
+            ("demo-1.0/PKG-INFO", b"Name: demo\n"),
+            ("demo-1.0/src/demo/__init__.py", b"# Copyright Acme\n"),
+            ("demo-1.0/docs/logo.png", b"\x89PNG" * 10),
+            ("../escape.py", b"nope"),
+        ):
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+
+def test_tar_members_are_read_relative_to_the_sdist_root(tmp_path) -> None:
+    sdist = tmp_path / "demo-1.0.tar.gz"
+    make_sdist(sdist)
+    seen = []
+
+    def select(path: str, size: int):
+        seen.append(path)
+        return None if path.endswith(".png") else -1
+
+    with archive_reader.open_archive(str(sdist), sdist.name) as archive:
+        members = dict(archive.iter_selected(select))
+
+    assert members == {
+        "PKG-INFO": b"Name: demo\n",
+        "src/demo/__init__.py": b"# Copyright Acme\n",
+    }
+    assert "escape.py" not in " ".join(seen)
+    assert not (tmp_path / "demo-1.0").exists()  # nothing was extracted
+
+
+def test_zip_members_respect_byte_limits(tmp_path) -> None:
+    wheel = tmp_path / "demo-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("demo/__init__.py", "x" * 10_000)
+
+    with archive_reader.open_archive(str(wheel), wheel.name) as archive:
+        members = list(archive.iter_selected(lambda p, s: 100))
+
+    assert members == [("demo/__init__.py", b"x" * 100)]
+
+
+def test_read_in_order_returns_members_in_the_order_asked(tmp_path) -> None:
+    path = tmp_path / "demo-1.0.tar.gz"
+    with tarfile.open(path, "w:gz") as tf:
+        for name in ("demo-1.0/a.py", "demo-1.0/LICENSE", "demo-1.0/b.py"):
+            data = name.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+    with archive_reader.open_archive(str(path), path.name) as archive:
+        listing = archive.listing
+        members = archive.read_in_order(["LICENSE", "a.py", "missing.py"])
+
+    assert [name for name, _ in listing] == ["a.py", "LICENSE", "b.py"]
+    assert members == [("LICENSE", b"demo-1.0/LICENSE"), ("a.py", b"demo-1.0/a.py")]
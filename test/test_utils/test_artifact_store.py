@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+import os
+
+import httpx
+import pytest
+
+from skip_trace.config import CONFIG
+from skip_trace.exceptions import CollectorError
+from skip_trace.utils import artifact_store, http_client
+
+PAYLOAD = b"not really a wheel" * 100
+DIGEST = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the cache at a temp dir and serve PAYLOAD for every request."""
+    monkeypatch.setitem(CONFIG, "cache", {**CONFIG["cache"], "dir": str(tmp_path)})
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, content=PAYLOAD)
+
+    monkeypatch.setattr(
+        http_client, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    return calls
+
+
+def test_fetch_verifies_and_shares_identical_artifacts(store) -> None:
+    first = artifact_store.fetch_artifact(
+        "https://files.example/demo-1.0-py3-none-any.whl",
+        "demo-1.0-py3-none-any.whl",
+        DIGEST,
+    )
+    second = artifact_store.fetch_artifact(
+        "https://files.example/demo-1.1-py3-none-any.whl",
+        "demo-1.1-py3-none-any.whl",
+        DIGEST,
+    )
+
+    assert first == second
+    assert len(store) == 1
+    assert DIGEST in first
+    with open(first, "rb") as f:
+        assert f.read() == PAYLOAD
+
+
+def test_fetch_rejects_digest_mismatch(store) -> None:
+    with pytest.raises(CollectorError):
+        artifact_store.fetch_artifact(
+            "https://files.example/demo.whl", "demo.whl", "0" * 64
+        )
+    assert artifact_store.lookup("0" * 64) is None
+    assert artifact_store.list_entries() == []
+
+
+def test_collect_garbage_by_age_and_size(store) -> None:
+    path = artifact_store.fetch_artifact(
+        "https://files.example/demo.whl", "demo.whl", DIGEST
+    )
+    digest_dir = os.path.dirname(path)
+
+    assert (
+        artifact_store.collect_garbage(max_bytes=10**9, max_age_seconds=3600)["removed"]
+        == 0
+    )
+
+    os.utime(digest_dir, (0, 0))
+    result = artifact_store.collect_garbage(max_bytes=10**9, max_age_seconds=3600)
+    assert result["removed"] == 1
+    assert not os.path.exists(digest_dir)
+
+    artifact_store.fetch_artifact("https://files.example/demo.whl", "demo.whl", DIGEST)
+    assert (
+        artifact_store.collect_garbage(max_bytes=1, max_age_seconds=None)["remaining"]
+        == 0
+    )
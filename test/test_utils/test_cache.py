@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from skip_trace.config import CONFIG
+from skip_trace.utils import cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setitem(CONFIG, "cache", {**CONFIG["cache"], "dir": str(tmp_path)})
+    return tmp_path
+
+
+def test_similar_keys_do_not_collide() -> None:
+    cache.set_cached_data("url", "https://a.com/x?y=1", {"content": "query"})
+    cache.set_cached_data("url", "https://a.com/xy=1", {"content": "path"})
+
+    assert cache.get_cached_data("url", "https://a.com/x?y=1") == {"content": "query"}
+    assert cache.get_cached_data("url", "https://a.com/xy=1") == {"content": "path"}
+
+
+def test_entries_are_sharded_and_keep_their_key(cache_dir) -> None:
+    cache.set_cached_data("rdap", "acme.io", {"org": "Acme"})
+    path = cache.get_cache_path("rdap", "acme.io")
+
+    relative = os.path.relpath(path, cache_dir).split(os.sep)
+    assert relative[0] == "rdap"
+    assert relative[1] == relative[3][:2] and relative[2] == relative[3][2:4]
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["key"] == "acme.io"
+    assert not [
+        name for name in os.listdir(os.path.dirname(path)) if ".partial" in name
+    ]
+
+
+def test_entry_for_another_key_is_a_miss() -> None:
+    cache.set_cached_data("rdap", "acme.io", {"org": "Acme"})
+    path = cache.get_cache_path("rdap", "acme.io")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"key": "other.io", "data": {"org": "Other"}}, f)
+
+    assert cache.get_cached_data("rdap", "acme.io") is None
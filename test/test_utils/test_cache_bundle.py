@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tarfile
+
+import pytest
+
+from skip_trace.config import CONFIG
+from skip_trace.exceptions import CacheBundleError
+from skip_trace.utils import artifact_store, cache, cache_bundle
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache at a fresh temp dir and return a function to move it."""
+
+    def use(name: str) -> str:
+        path = str(tmp_path / name)
+        monkeypatch.setitem(CONFIG, "cache", {**CONFIG["cache"], "dir": path})
+        return path
+
+    use("bastion")
+    return use
+
+
+def test_export_then_import_round_trip(cache_dir, tmp_path) -> None:
+    cache.set_cached_data("pypi", "https://pypi.org/pypi/demo/json", {"info": {}})
+    cache.set_cached_data("rdap", "acme.io", {"org": "Acme"})
+    bundle = str(tmp_path / "bundle.tar.gz")
+
+    manifest = cache_bundle.export_bundle(bundle, ["pypi", "rdap"])
+    assert len(manifest["entries"]) == 2
+
+    cache_dir("runner")
+    summary = cache_bundle.import_bundle(bundle)
+    assert summary == {"imported": 2, "kept": 0, "rejected": 0}
+    assert cache.get_cached_data("rdap", "acme.io") == {"org": "Acme"}
+
+    # A second import keeps the local copies, which are not older
+    assert cache_bundle.import_bundle(bundle)["kept"] == 2
+
+
+def test_import_prefers_newer_timestamps(cache_dir, tmp_path) -> None:
+    cache.set_cached_data("rdap", "acme.io", {"org": "Old"})
+    old_path = cache.get_cache_path("rdap", "acme.io")
+    os.utime(old_path, (1000, 1000))
+    bundle = str(tmp_path / "bundle.tar.gz")
+    cache_bundle.export_bundle(bundle, ["rdap"])
+
+    cache_dir("runner")
+    cache.set_cached_data("rdap", "acme.io", {"org": "New"})
+    assert cache_bundle.import_bundle(bundle)["kept"] == 1
+    with open(cache.get_cache_path("rdap", "acme.io"), encoding="utf-8") as f:
+        assert "New" in f.read()
+
+
+def test_import_rejects_tampered_entries(cache_dir, tmp_path) -> None:
+    bundle = str(tmp_path / "evil.tar.gz")
+    payload = tmp_path / "payload.json"
+    payload.write_text("{}", encoding="utf-8")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "format": 1,
+                "namespaces": ["rdap"],
+                "entries": [
+                    {"path": "../escape.json", "size": 2, "sha256": "x", "mtime": 1},
+                    {"path": "rdap/a.json", "size": 2, "sha256": "0" * 64, "mtime": 1},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    with tarfile.open(bundle, "w:gz") as tf:
+        tf.add(str(payload), arcname="cache/rdap/a.json")
+        tf.add(str(manifest), arcname="manifest.json")
+
+    assert cache_bundle.import_bundle(bundle)["rejected"] == 2
+    assert not os.path.exists(tmp_path / "escape.json")
+
+    with pytest.raises(CacheBundleError):
+        cache_bundle.import_bundle(str(payload))
+
+
+def _write_bundle(tmp_path, entries, files) -> str:
+    """Builds a hand-made bundle from a manifest entry list and member files."""
+    bundle = str(tmp_path / "crafted.tar.gz")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps({"format": 1, "namespaces": ["evil"], "entries": entries}),
+        encoding="utf-8",
+    )
+    with tarfile.open(bundle, "w:gz") as tf:
+        for name, path in files.items():
+            tf.add(str(path), arcname=f"cache/{name}")
+        tf.add(str(manifest), arcname="manifest.json")
+    return bundle
+
+
+def test_import_ignores_namespaces_listed_by_the_bundle(cache_dir, tmp_path) -> None:
+    payload = tmp_path / "payload"
+    payload.write_bytes(b"{}")
+    entry = {
+        "path": "evil/a.json",
+        "size": 2,
+        "sha256": hashlib.sha256(b"{}").hexdigest(),
+        "mtime": 1,
+    }
+    bundle = _write_bundle(tmp_path, [entry], {"evil/a.json": payload})
+
+    base_dir = cache_dir("runner")
+    assert cache_bundle.import_bundle(bundle)["rejected"] == 1
+    assert not os.path.exists(os.path.join(base_dir, "evil"))
+
+
+def test_import_checks_artifacts_against_their_digest_dir(cache_dir, tmp_path) -> None:
+    payload = tmp_path / "payload"
+    payload.write_bytes(b"wheel bytes")
+    actual = hashlib.sha256(b"wheel bytes").hexdigest()
+    other = "ab" * 32
+    good = f"artifacts/{actual[:2]}/{actual}/demo-1.0-py3-none-any.whl"
+    # Self-consistent with the manifest, but filed under another digest
+    misfiled = f"artifacts/{other[:2]}/{other}/demo-1.0-py3-none-any.whl"
+    entries = [
+        {"path": path, "size": 11, "sha256": actual, "mtime": 1}
+        for path in (good, misfiled)
+    ]
+    bundle = _write_bundle(tmp_path, entries, {good: payload, misfiled: payload})
+
+    cache_dir("runner")
+    assert cache_bundle.import_bundle(bundle) == {
+        "imported": 1,
+        "kept": 0,
+        "rejected": 1,
+    }
+    assert artifact_store.lookup(actual) is not None
+    assert artifact_store.lookup(other) is None
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from skip_trace.utils import domains
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://docs.python.org/3/", ("docs", "python", "org")),
+        ("http://user:pw@www.Example.co.uk:8080/x?y#z", ("www", "example", "co.uk")),
+        ("github.com/pypa/pip", ("", "github", "com")),
+        # Private-section suffixes are not used
+        ("https://pallets.github.io", ("pallets", "github", "io")),
+        # Wildcard and exception rules
+        ("https://a.b.ck", ("", "a", "b.ck")),
+        ("https://www.ck", ("", "www", "ck")),
+        ("https://x.city.kobe.jp", ("x", "city", "kobe.jp")),
+        ("https://xn--mnchen-3ya.de", ("", "xn--mnchen-3ya", "de")),
+        ("https://foo.рф", ("", "foo", "рф")),
+        ("http://192.168.0.1/admin", ("", "192.168.0.1", "")),
+        ("localhost:8000", ("", "localhost", "")),
+        ("", ("", "", "")),
+    ],
+)
+def test_extract(url: str, expected: tuple) -> None:
+    assert domains.extract(url) == expected
+
+
+def test_registered_domain() -> None:
+    assert domains.registered_domain("https://sub.example.co.uk/") == "example.co.uk"
+    assert domains.registered_domain("https://co.uk") == ""
+    assert domains.registered_domain("http://127.0.0.1") == ""
+
+
+def test_bundled_list_is_versioned_and_offline(monkeypatch) -> None:
+    def no_network(*args, **kwargs):
+        raise AssertionError("the suffix list must not be downloaded")
+
+    monkeypatch.setattr("socket.socket.connect", no_network)
+    domains.load_suffix_list.cache_clear()
+    domains.extract.cache_clear()
+
+    suffixes = domains.load_suffix_list()
+
+    assert suffixes.version != "unknown"
+    assert "com" in suffixes.rules and "ck" in suffixes.wildcards
+    assert domains.registered_domain("https://pypi.org/project/x/") == "pypi.org"
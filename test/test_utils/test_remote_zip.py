@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import io
+import os
+import zipfile
+
+import httpx
+import pytest
+
+from skip_trace.exceptions import RangeNotSupportedError
+from skip_trace.utils import http_client, remote_zip
+
+URL = "https://files.example/demo-1.0-py3-none-any.whl"
+
+
+def make_zip() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("demo/__init__.py", '__author__ = "Jane Doe"\n')
+        # Incompressible filler, so the archive is much bigger than the members we read
+        zf.writestr("demo/_blob.bin", os.urandom(1024 * 1024))
+        zf.writestr("demo-1.0.dist-info/METADATA", "Name: demo\nVersion: 1.0\n")
+    return buf.getvalue()
+
+
+def serve(monkeypatch, payload: bytes, honour_ranges: bool = True) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        byte_range = request.headers.get("range")
+        if not honour_ranges or not byte_range:
+            return httpx.Response(200, content=payload)
+        start_s, end_s = byte_range.split("=", 1)[1].split("-")
+        if not start_s:  # suffix range, e.g. bytes=-65536
+            start, end = max(0, len(payload) - int(end_s)), len(payload) - 1
+        else:
+            start, end = int(start_s), min(int(end_s), len(payload) - 1)
+        return httpx.Response(
+            206,
+            content=payload[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(payload)}"},
+        )
+
+    monkeypatch.setattr(
+        http_client, "_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+
+def test_reads_members_without_fetching_the_whole_archive(monkeypatch) -> None:
+    payload = make_zip()
+    serve(monkeypatch, payload)
+
+    archive, remote = remote_zip.open_remote_zip(URL)
+    with archive:
+        assert archive.read("demo-1.0.dist-info/METADATA").startswith(b"Name: demo")
+        assert archive.read("demo/__init__.py") == b'__author__ = "Jane Doe"\n'
+
+    assert remote.size == len(payload)
+    assert remote.bytes_fetched < len(payload) / 4
+
+
+def test_server_without_range_support_is_reported(monkeypatch) -> None:
+    serve(monkeypatch, make_zip(), honour_ranges=False)
+
+    with pytest.raises(RangeNotSupportedError):
+        remote_zip.open_remote_zip(URL)
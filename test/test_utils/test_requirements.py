@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from skip_trace.utils import requirements
+
+
+def test_parse_requirements_file_follows_includes(tmp_path) -> None:
+    (tmp_path / "base.txt").write_text("rich[jupyter]>=13\n", encoding="utf-8")
+    req = tmp_path / "requirements.txt"
+    req.write_text(
+        "# pinned\n"
+        "requests==2.32.3 ; python_version >= '3.8'  # comment\n"
+        "-r base.txt\n"
+        "--index-url https://example.invalid/simple\n"
+        "git+https://github.com/acme/demo.git\n"
+        "httpx \\\n    ==0.28.1\n",
+        encoding="utf-8",
+    )
+
+    assert requirements.parse_requirements_file(str(req)) == [
+        ("requests", "2.32.3"),
+        ("rich", None),
+        ("httpx", "0.28.1"),
+    ]
+
+
+def test_hashed_pins_keep_their_version(tmp_path) -> None:
+    req = tmp_path / "requirements.txt"
+    req.write_text(
+        "requests==2.32.3 \\\n"
+        f"    --hash=sha256:{'55' * 32} \\\n"
+        f"    --hash=sha256:{'70' * 32}\n"
+        "certifi==2024.8.30 --hash=sha256:abc ; python_version >= '3.8'\n",
+        encoding="utf-8",
+    )
+
+    assert requirements.parse_requirements_file(str(req)) == [
+        ("requests", "2.32.3"),
+        ("certifi", "2024.8.30"),
+    ]
+    assert requirements.parse_package_spec("rich==13.9.4 --hash=sha256:abc") == (
+        "rich",
+        "13.9.4",
+    )
+
+
+def test_parse_lockfiles(tmp_path) -> None:
+    uv_lock = tmp_path / "uv.lock"
+    uv_lock.write_text(
+        'version = 1\n\n[[package]]\nname = "demo"\nversion = "0.1.0"\n'
+        'source = { editable = "." }\n\n'
+        '[[package]]\nname = "httpx"\nversion = "0.28.1"\n'
+        'source = { registry = "https://pypi.org/simple" }\n',
+        encoding="utf-8",
+    )
+    pipfile_lock = tmp_path / "Pipfile.lock"
+    pipfile_lock.write_text(
+        '{"default": {"requests": {"version": "==2.32.3"}}, "develop": {}}',
+        encoding="utf-8",
+    )
+
+    assert requirements.parse_package_file(str(uv_lock)) == [("httpx", "0.28.1")]
+    assert requirements.parse_package_file(str(pipfile_lock)) == [
+        ("requests", "2.32.3")
+    ]
+
+
+def test_dedupe_specs_normalizes_names() -> None:
+    specs = [("Foo_Bar", "1.0"), ("foo-bar", None), ("baz", None)]
+    assert requirements.dedupe_specs(specs) == [("Foo_Bar", "1.0"), ("baz", None)]
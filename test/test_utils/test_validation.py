@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from skip_trace.utils import validation
+
+
+@pytest.mark.parametrize(
+    "candidate, expected",
+    [
+        ("Jane.Doe@Acme.IO", "Jane.Doe@acme.io"),
+        ("a@münchen.de", "a@münchen.de"),
+        ("jane@myexample.com", "jane@myexample.com"),
+        ("jane@example.com", None),
+        ("jane@docs.example.org", None),
+        ("jane@host.test", None),
+        ("jane@localhost", None),
+        ("@decorator.attr", None),
+        ("a@b@c.com", None),
+        ("jane@acme.io.", None),
+        ("jane doe@acme.io", None),
+        (None, None),
+    ],
+)
+def test_is_valid_email(candidate, expected) -> None:
+    assert validation.is_valid_email(candidate) == expected
+
+
+def test_only_new_well_formed_candidates_reach_the_validator(monkeypatch) -> None:
+    calls = []
+    real = validation.validate_email
+
+    def counting(email, **kwargs):
+        calls.append(email)
+        return real(email, **kwargs)
+
+    monkeypatch.setattr(validation, "validate_email", counting)
+    validation._validate.cache_clear()
+
+    for _ in range(3):
+        validation.is_valid_email("jane@acme.io")
+        validation.is_valid_email("self@property")
+        validation.is_valid_email("jane@example.com")
+
+    assert calls == ["jane@acme.io"]